@@ -0,0 +1,131 @@
+"""Test the optional NumPy column backend."""
+
+import pytest
+
+from tinytable import Table, TableStream, read_csv
+from tinytable.filter import ChainFilter
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def numpy_table(sample_table):
+    return sample_table.to_backend("numpy")
+
+
+class TestToBackend:
+    def test_numeric_columns_become_arrays(self, numpy_table):
+        assert numpy_table.backend == "numpy"
+        assert isinstance(numpy_table.data["age"], np.ndarray)
+        assert isinstance(numpy_table.data["name"], list)
+
+    def test_round_trip_lossless(self):
+        data = {"i": [1, 2, 3], "f": [0.5, 1.5, 2.0], "b": [True, False, True], "mixed": [1, 2.5, None]}
+        back = Table(data).to_backend("numpy").to_backend("python")
+        assert back.backend == "python"
+        assert back.data == data
+        assert [type(v) for v in back.data["i"]] == [int, int, int]
+
+    def test_big_ints_stay_lists(self):
+        t = Table({"x": [2**70, 1]}).to_backend("numpy")
+        assert t.backend == "python"
+
+    def test_unknown_backend(self, sample_table):
+        with pytest.raises(ValueError):
+            sample_table.to_backend("arrow")
+
+    def test_source_unchanged(self, sample_table, numpy_table):
+        numpy_table.edit_value("name", 0, "Zed")
+        assert sample_table.data["name"][0] == "Olivia"
+
+
+class TestVectorizedColumns:
+    def test_arithmetic(self, numpy_table):
+        result = numpy_table["age"] * 2 + 1
+        assert isinstance(result.data, np.ndarray)
+        assert list(result) == [9, 11, 17, 7, 49, 113, 25, 137, 43, 181]
+
+    def test_column_operand(self, numpy_table):
+        result = numpy_table["age"] - numpy_table["id"]
+        assert list(result)[:3] == [3, 3, 5]
+
+    def test_comparison_filter(self, numpy_table, sample_table):
+        f = numpy_table["age"] > 20
+        assert isinstance(f, ChainFilter)
+        both = f & (numpy_table["age"] < 60)
+        assert numpy_table[both].data["name"].copy() == ["Amelia", "Oliver", "Sophia"]
+        assert numpy_table[f].to_backend("python").data == sample_table[sample_table["age"] > 20].data
+
+    def test_isin(self, numpy_table):
+        assert list(numpy_table["id"].isin([1, 3])) == [True, False, True] + [False] * 7
+
+    def test_values_are_python_objects(self, numpy_table):
+        assert type(numpy_table["age"][0]) is int
+        assert type(numpy_table[0]["age"]) is int
+        assert type(numpy_table["age"].sum()) is int
+
+    def test_slice_view(self, numpy_table):
+        col = numpy_table["age"][::-3]
+        assert list(col) == [90, 12, 3, 4]
+        assert list(col + 0) == [90, 12, 3, 4]
+
+
+class TestVectorizedTable:
+    def test_aggregations_match(self, sample_table, numpy_table):
+        for name in ("sum", "mean", "min", "max", "std", "pstd", "count", "mode"):
+            assert getattr(numpy_table, name)() == pytest.approx(getattr(sample_table, name)())
+
+    def test_gather_keeps_arrays(self, numpy_table):
+        result = numpy_table.filter_by_indexes([3, 1])
+        assert isinstance(result.data["age"], np.ndarray)
+        assert result.to_backend("python").data["age"] == [3, 5]
+        assert isinstance(numpy_table.head(2).data["age"], np.ndarray)
+
+    def test_edit_value_lossless(self, numpy_table):
+        numpy_table.edit_value("age", 0, 7)
+        assert isinstance(numpy_table.data["age"], np.ndarray)
+        numpy_table.edit_value("age", 1, 2.5)
+        assert numpy_table.data["age"][:2] == [7, 2.5]
+
+    def test_drop_row_and_edit_row(self, numpy_table):
+        numpy_table.drop_row(0)
+        numpy_table.edit_row(0, {"age": 1})
+        assert len(numpy_table) == 9
+        assert numpy_table.to_backend("python").data["age"][:2] == [1, 8]
+
+    def test_loc_set_keeps_arrays(self, numpy_table):
+        numpy_table.loc[numpy_table["age"] > 50, "age"] = 50
+        assert isinstance(numpy_table.data["age"], np.ndarray)
+        assert numpy_table.data["age"].max() == 50
+        numpy_table.loc[[0], "age"] = "four"
+        assert numpy_table.data["age"][0] == "four"
+
+    def test_batch_edit_restores_arrays(self, numpy_table):
+        with numpy_table.batch_edit():
+            assert isinstance(numpy_table.data["age"], list)
+            numpy_table["age"][0] = 40
+        assert isinstance(numpy_table.data["age"], np.ndarray)
+        assert numpy_table.data["age"][0] == 40
+
+    def test_groupby_and_io(self, numpy_table, sample_table, temp_csv_path):
+        assert numpy_table.groupby("gender").sum().data == sample_table.groupby("gender").sum().data
+        numpy_table.to_csv(temp_csv_path)
+        assert read_csv(temp_csv_path).data == read_csv("tests/data/people.csv").data
+
+    def test_fillna_keeps_python_values(self):
+        table = Table({"i": [3, 4], "f": [1.5, None]}).to_backend("numpy")
+        result = table.fillna(0)
+        assert result.data["i"].tolist() == [3, 4]
+        assert result.data["f"] == [1.5, 0]
+        assert all(type(value) is int for value in result.to_backend("python").data["i"])
+        table.fillna(0, inplace=True)
+        assert isinstance(table.data["i"], np.ndarray)
+
+    def test_stream_aggregates_are_python_scalars(self, numpy_table):
+        stream = TableStream([numpy_table, numpy_table])
+        total = stream.sum()["age"]
+        assert type(total) is int
+        assert total == 2 * sum(numpy_table.to_backend("python").data["age"])
+        assert type(stream.max()["age"]) is int
+        sums = stream.groupby("gender").sum().data["age"]
+        assert all(type(value) is int for value in sums)
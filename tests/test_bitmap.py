@@ -0,0 +1,108 @@
+"""Test validity bitmaps and null tracking Tables."""
+
+import pytest
+
+from tinytable import Table
+from tinytable.bitmap import Bitmap
+
+
+@pytest.fixture
+def sparse_table():
+    return Table(
+        {
+            "a": [1, None, None, 4, None, None, None, None, 9, None],
+            "b": [None, None, 3, 4, None, None, None, None, None, None],
+            "c": ["x"] * 10,
+        }
+    )
+
+
+@pytest.fixture
+def tracked(sparse_table):
+    table = sparse_table.copy()
+    table.track_nulls()
+    return table
+
+
+class TestBitmap:
+    def test_from_values(self):
+        bitmap = Bitmap.from_values([1, None, 3, None, 5, 6, 7, 8, None])
+        assert len(bitmap) == 9
+        assert bitmap.to_bools() == [True, False, True, False, True, True, True, True, False]
+        assert bitmap.count() == 6
+        assert bitmap.null_count() == 3
+        assert bitmap.valid_indexes() == [0, 2, 4, 5, 6, 7]
+
+    def test_set_and_get(self):
+        bitmap = Bitmap.from_bools([False] * 10)
+        bitmap[9] = True
+        bitmap[-10] = True
+        assert bitmap[0] and bitmap[9] and not bitmap[5]
+        bitmap[0] = False
+        assert bitmap.count() == 1
+        with pytest.raises(IndexError):
+            bitmap[10] = True
+
+    def test_and_or(self):
+        a = Bitmap.from_bools([True, True, False, False])
+        b = Bitmap.from_bools([True, False, True, False])
+        assert (a & b).to_bools() == [True, False, False, False]
+        assert (a | b).to_bools() == [True, True, True, False]
+
+    def test_all_valid_take_delete(self):
+        bitmap = Bitmap.all_valid(11)
+        assert bitmap.count() == 11
+        bitmap[3] = False
+        assert bitmap.take([3, 4]).to_bools() == [False, True]
+        bitmap.delete(3)
+        assert bitmap == Bitmap.all_valid(10)
+
+    def test_compress(self):
+        bitmap = Bitmap.from_values([1, None, 3])
+        assert bitmap.compress([1, None, 3]) == [1, 3]
+
+
+class TestTrackedTable:
+    def test_isna_notna_match(self, sparse_table, tracked):
+        assert tracked.isna().data == sparse_table.isna().data
+        assert tracked.notna().data == sparse_table.notna().data
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"how": "all"}, {"thresh": 2}, {"subset": ["a"]}, {"axis": 1}, {"axis": 1, "how": "all"}, {"axis": 1, "thresh": 3}],
+    )
+    def test_dropna_matches(self, sparse_table, tracked, kwargs):
+        assert tracked.dropna(**kwargs).data == sparse_table.dropna(**kwargs).data
+
+    def test_null_count(self, sparse_table, tracked):
+        assert tracked.null_count() == {"a": 7, "b": 8, "c": 0}
+        assert sparse_table.null_count() == tracked.null_count()
+
+    def test_aggregations_skip_nulls(self, tracked, sparse_table):
+        assert tracked.sum() == {"a": 14, "b": 7}
+        assert tracked.max()["a"] == 9
+        assert "a" not in sparse_table.sum()
+
+    def test_edits_update_bitmaps(self, tracked):
+        tracked.edit_value("a", 1, 2)
+        tracked["b"][0] = 1
+        tracked.edit_row(2, {"a": None, "b": None})
+        tracked.drop_row(3)
+        tracked["c"] = [None] * 9
+        assert tracked.validity is not None
+        for name, values in tracked.data.items():
+            assert tracked.validity[name] == Bitmap.from_values(values)
+
+    def test_derived_tables_keep_bitmaps(self, tracked):
+        for derived in (tracked.head(3), tracked[2:6], tracked[["a"]], tracked.copy(), tracked.sort_values("c")):
+            assert derived.validity is not None
+            for name, values in derived.data.items():
+                assert derived.validity[name] == Bitmap.from_values(values)
+
+    def test_copy_bitmaps_independent(self, tracked):
+        copy_table = tracked.copy()
+        copy_table.edit_value("a", 1, 5)
+        assert tracked.validity["a"][1] is False
+
+    def test_untracked_by_default(self, sparse_table):
+        assert sparse_table.validity is None
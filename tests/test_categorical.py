@@ -0,0 +1,109 @@
+"""Test dictionary encoded Categorical columns."""
+
+import pytest
+
+from tinytable import Categorical, Table, read_csv, read_sqlite
+
+
+@pytest.fixture
+def status_table():
+    return Table({"status": ["ok", "fail", "ok", None, "ok", "skip"], "n": [1, 2, 3, 4, 5, 6]})
+
+
+@pytest.fixture
+def encoded(status_table):
+    return status_table.astype({"status": "category"})
+
+
+class TestCategorical:
+    def test_from_values(self):
+        c = Categorical.from_values(["a", "b", None, "a"])
+        assert c.categories == ["a", "b"]
+        assert list(c.codes) == [0, 1, -1, 0]
+        assert c == ["a", "b", None, "a"]
+        assert c[-1] == "a" and c[2] is None
+
+    def test_mutation_adds_categories(self):
+        c = Categorical.from_values(["a"])
+        c[0] = "b"
+        c.append("c")
+        c.insert(0, None)
+        del c[1]
+        assert list(c) == [None, "c"]
+        assert c.categories == ["a", "b", "c"]
+
+    def test_codes_widen(self):
+        c = Categorical.from_values(range(100))
+        assert c.codes.typecode == "b"
+        c.extend(range(100, 300))
+        assert c.codes.typecode == "h"
+        assert list(c) == list(range(300))
+
+    def test_slice_and_take_copy_categories(self):
+        c = Categorical.from_values(["a", "b", "a"])
+        part = c[1:]
+        part[0] = "z"
+        assert c.categories == ["a", "b"]
+        assert c.take([2, 0]) == ["a", "a"]
+
+    def test_value_counts_and_groups(self):
+        c = Categorical.from_values(["b", "a", None, "b"])
+        assert c.value_counts() == {"b": 2, "a": 1, None: 1}
+        assert c.group_indexes() == {"b": [0, 3], "a": [1], None: [2]}
+
+
+class TestCategoricalTable:
+    def test_astype(self, status_table, encoded):
+        assert isinstance(encoded.data["status"], Categorical)
+        assert encoded.data == status_table.data
+        assert isinstance(status_table.data["status"], list)
+        assert encoded.astype({"status": "object"}).data["status"] == status_table.data["status"]
+
+    def test_astype_callable_and_unknown(self, status_table):
+        assert status_table.astype({"n": str}).data["n"][0] == "1"
+        with pytest.raises(KeyError):
+            status_table.astype({"nope": "category"})
+        with pytest.raises(ValueError):
+            status_table.astype({"n": "decimal"})
+
+    def test_filters(self, status_table, encoded):
+        for make in (lambda t: t["status"] == "ok", lambda t: t["status"] != "ok", lambda t: t["status"].isin(["skip", None])):
+            assert encoded[make(encoded)].data == status_table[make(status_table)].data
+
+    def test_filtered_table_stays_encoded(self, encoded):
+        result = encoded[encoded["n"] > 2]
+        assert isinstance(result.data["status"], Categorical)
+        assert result.data["status"] == ["ok", None, "ok", "skip"]
+
+    def test_value_counts(self, encoded, status_table):
+        assert encoded["status"].value_counts() == status_table["status"].value_counts()
+
+    def test_groupby(self, encoded, status_table):
+        assert [key for key, _ in encoded.groupby("status")] == [key for key, _ in status_table.groupby("status")]
+        assert encoded.groupby("status").sum().data == status_table.groupby("status").sum().data
+
+    def test_edit_value(self, encoded):
+        encoded.edit_value("status", 0, "new")
+        assert encoded["status"][0] == "new"
+
+
+class TestReaders:
+    def test_read_csv_categorical(self):
+        table = read_csv("tests/data/people.csv", categorical=True)
+        assert isinstance(table.data["gender"], Categorical)
+        assert isinstance(table.data["name"], list)
+        assert table.data == read_csv("tests/data/people.csv").data
+
+    def test_read_csv_named_columns(self):
+        table = read_csv("tests/data/people.csv", categorical=["name"])
+        assert isinstance(table.data["name"], Categorical)
+
+    def test_read_csv_chunks(self):
+        stream = read_csv("tests/data/people.csv", chunksize=4, categorical=["gender"])
+        assert all(isinstance(chunk.data["gender"], Categorical) for chunk in stream)
+
+    def test_read_sqlite_categorical(self, sample_table, temp_db_path):
+        sample_table.to_sqlite(temp_db_path, "people", replace_table=True)
+        table = read_sqlite(temp_db_path, "people", categorical=True)
+        assert isinstance(table.data["gender"], Categorical)
+        assert table.data == sample_table.data
@@ -185,6 +185,74 @@ class TestColumnBehavior:
         assert col.parent is None
 
 
+class TestColumnView:
+    """Test Columns as views of their parent Table."""
+
+    def test_column_shares_parent_list(self, sample_table):
+        """Test Table Column does not copy values."""
+        col = sample_table["age"]
+        assert col.is_view
+        assert col.data is sample_table.data["age"]
+
+    def test_column_sees_parent_edits(self, sample_table):
+        """Test Column reads later edits to its parent."""
+        col = sample_table["age"]
+        sample_table.edit_value("age", 0, 40)
+        assert col[0] == 40
+
+    def test_column_slice_view(self, sample_table):
+        """Test slicing a Column returns a view of its rows."""
+        col = sample_table["age"][2:8:2]
+        assert col.is_view
+        assert list(col) == [8, 24, 12]
+        assert len(col) == 3
+        assert col[-1] == 12
+        col[1] = 0
+        assert sample_table.data["age"][4] == 0
+
+    def test_column_slice_of_slice(self, sample_table):
+        """Test slicing a slice view composes row ranges."""
+        col = sample_table["id"][1:9][::-2]
+        assert col.data == [9, 7, 5, 3]
+
+    def test_column_head_tail(self, labeled_table):
+        """Test Column head and tail views keep labels."""
+        col = labeled_table["name"]
+        assert col.head(2).labels == [("r1",), ("r2",)]
+        assert col.tail(1).data == [col[-1]]
+        assert len(col.tail(10)) == 3
+
+    def test_detached_column_copy_on_write(self):
+        """Test Column made from a list copies it on first write."""
+        values = [1, 2, 3]
+        col = Column(values, "x")
+        assert col.data is values
+        col[0] = 10
+        assert values == [1, 2, 3]
+        assert col.data == [10, 2, 3]
+
+    def test_column_drop_keeps_values(self, sample_table):
+        """Test dropped view Column keeps a copy of its values."""
+        col = sample_table["id"]
+        col.drop()
+        assert col.data == [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+    def test_column_read_keeps_parent_sharing(self, sample_table):
+        """Test reading a view Column of a copy does not copy the copy's lists."""
+        copy_table = sample_table.copy()
+        copy_table.track_nulls()
+        bitmaps = copy_table.validity
+        assert (copy_table["age"] + 1)[0] == 5
+        assert copy_table._data["id"] is sample_table._data["id"]
+        assert copy_table.validity is bitmaps
+
+    def test_arithmetic_result_detached(self, sample_table):
+        """Test Column arithmetic results do not write to the parent."""
+        result = sample_table["age"] * 2
+        result[0] = -1
+        assert sample_table.data["age"][0] == 4
+
+
 class TestRowBehavior:
     """Test Row class behavior."""
 
@@ -342,3 +410,40 @@ class TestColumnRowIntegration:
         # Row should still be accessible even after dropping
         assert row.data == {"id": 1, "name": "Olivia", "age": 4, "gender": "f"}
         assert row.parent is None
+
+
+class TestRowView:
+    """Test Rows as views of their parent Table."""
+
+    def test_row_has_no_dict(self, sample_table):
+        """Test Row uses slots."""
+        row = sample_table[0]
+        assert not hasattr(row, "__dict__")
+
+    def test_row_reads_parent(self, sample_table):
+        """Test Row sees later edits to its parent."""
+        row = sample_table[2]
+        sample_table.edit_value("name", 2, "Ana")
+        assert row["name"] == "Ana"
+        assert row.data["name"] == "Ana"
+
+    def test_row_write_through(self, sample_table):
+        """Test Row setitem edits the parent Table."""
+        row = sample_table[3]
+        row["age"] = 30
+        assert sample_table.data["age"][3] == 30
+
+    def test_iterrows_views(self, labeled_table):
+        """Test iterrows yields view Rows with labels."""
+        rows = list(labeled_table.iterrows())
+        assert [i for i, _ in rows] == [0, 1, 2]
+        assert [row.label for _, row in rows] == [("r1",), ("r2",), ("r3",)]
+        rows[1][1]["age"] = 99
+        assert labeled_table.data["age"][1] == 99
+
+    def test_detached_row(self):
+        """Test Row made from a dict holds its own values."""
+        row = Row({"id": 1, "name": "Alice"}, 0)
+        row["name"] = "Ann"
+        assert row.data == {"id": 1, "name": "Ann"}
+        assert list(row) == [1, "Ann"]
@@ -0,0 +1,103 @@
+"""Test concat, append_rows, append_table and RowBuffer."""
+
+import pytest
+
+from tinytable import RowBuffer, Table, concat
+
+
+@pytest.fixture
+def left():
+    return Table({"x": [1, 2], "y": ["a", "b"]})
+
+
+@pytest.fixture
+def right():
+    return Table({"x": [3], "z": [True]})
+
+
+class TestConcat:
+    def test_outer(self, left, right):
+        result = concat([left, right])
+        assert result.data == {"x": [1, 2, 3], "y": ["a", "b", None], "z": [None, None, True]}
+        assert result.labels is None
+
+    def test_inner(self, left, right):
+        assert concat([left, right], join="inner").data == {"x": [1, 2, 3]}
+
+    def test_bad_join(self, left):
+        with pytest.raises(ValueError):
+            concat([left], join="left")
+
+    def test_labels_kept_if_all_labeled(self):
+        first = Table({"x": [1]}, labels=["a"])
+        second = Table({"x": [2]}, labels=["b"])
+        assert concat([first, second]).labels == ["a", "b"]
+        assert concat([first, Table({"x": [3]})]).labels is None
+
+    def test_does_not_share_lists(self, left):
+        result = concat([left])
+        result.edit_value("x", 0, 10)
+        assert left.data["x"] == [1, 2]
+
+    def test_inputs_keep_sharing(self, left):
+        copy_table = left.copy()
+        concat([left, copy_table])
+        assert copy_table._data["x"] is left._data["x"]
+
+    def test_many_chunks(self):
+        chunks = [Table({"i": [i]}) for i in range(1000)]
+        assert concat(chunks).data["i"] == list(range(1000))
+
+    def test_empty(self):
+        assert concat([]).data == {}
+
+
+class TestAppend:
+    def test_append_rows(self, left):
+        left.append_rows([{"x": 5, "w": 1}, [6, "c", None]])
+        assert left.data == {"x": [1, 2, 5, 6], "y": ["a", "b", None, "c"], "w": [None, None, 1, None]}
+        assert len(left) == 4
+
+    def test_append_table_tracks_nulls(self, left, right):
+        left.track_nulls()
+        left.append_table(right)
+        assert left.data["z"] == [None, None, True]
+        assert left.validity["y"].to_bools() == [True, True, False]
+        assert left.validity["z"].to_bools() == [False, False, True]
+
+    def test_labels(self):
+        table = Table({"x": [1]}, labels=["a"])
+        table.append_rows([[2]], labels=["b"])
+        assert table.labels == ["a", "b"]
+        with pytest.raises(ValueError):
+            table.append_rows([[3]])
+
+    def test_append_table_keeps_other_sharing(self, left):
+        copy_table = left.copy()
+        Table({"x": [0], "y": ["z"]}).append_table(copy_table)
+        assert copy_table._data["x"] is left._data["x"]
+
+    def test_append_self(self, left):
+        left.append_table(left)
+        assert left.data == {"x": [1, 2, 1, 2], "y": ["a", "b", "a", "b"]}
+
+    def test_shared_columns_copied(self, left):
+        selected = left[["x"]]
+        left.append_rows([[3, "c"]])
+        assert selected.data == {"x": [1, 2]}
+
+
+class TestRowBuffer:
+    def test_build_table(self, right):
+        buffer = RowBuffer(["x"])
+        buffer.extend([[1], {"x": 2, "y": 3}])
+        buffer.extend_table(right)
+        assert len(buffer) == 3
+        table = buffer.to_table()
+        assert table.data == {"x": [1, 2, 3], "y": [None, 3, None], "z": [None, None, True]}
+        assert len(buffer) == 0
+        assert buffer.data == {"x": [], "y": [], "z": []}
+
+    def test_row_length(self):
+        with pytest.raises(ValueError):
+            RowBuffer(["x", "y"]).append([1])
@@ -0,0 +1,52 @@
+"""Test duplicated, drop_duplicates and streaming dedupe."""
+
+import pytest
+
+from tinytable import Table, TableStream
+from tinytable.dedupe import SeenKeys, duplicated_mask
+
+
+@pytest.fixture
+def rows():
+    return Table({"a": [1, 2, 1, 3, 2], "b": ["x", "y", "x", "z", "q"]})
+
+
+class TestDuplicated:
+    def test_all_columns(self, rows):
+        assert rows.duplicated() == [False, False, True, False, False]
+
+    def test_subset_and_keep(self, rows):
+        assert rows.duplicated("a") == [False, False, True, False, True]
+        assert rows.duplicated("a", keep="last") == [True, True, False, False, False]
+        assert rows.duplicated("a", keep=False) == [True, True, True, False, True]
+
+    def test_bad_keep(self):
+        with pytest.raises(ValueError):
+            duplicated_mask([1, 1], keep="middle")
+
+    def test_drop_duplicates(self, rows):
+        assert rows.drop_duplicates().data == {"a": [1, 2, 3, 2], "b": ["x", "y", "z", "q"]}
+        assert rows.drop_duplicates(["a"], keep="last").data == {"a": [1, 3, 2], "b": ["x", "z", "q"]}
+
+    def test_drop_duplicates_inplace(self, rows):
+        assert rows.drop_duplicates("a", inplace=True) is None
+        assert rows.data == {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+
+class TestStreamDedupe:
+    def test_across_chunks(self, rows):
+        stream = TableStream([rows, rows])
+        assert stream.drop_duplicates("a").to_table().data == {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+
+    def test_bounded_forgets_oldest(self, rows):
+        stream = TableStream([rows, rows])
+        assert stream.drop_duplicates("a", max_keys=1).to_table().data["a"] == [1, 2, 1, 3, 2] * 2
+
+    def test_bounded_spills(self, rows):
+        stream = TableStream([rows, rows])
+        assert stream.drop_duplicates("a", max_keys=1, spill=True).to_table().data["a"] == [1, 2, 3]
+
+    def test_seen_keys_spill(self):
+        seen = SeenKeys(max_keys=2, spill=True)
+        assert [seen.add(key) for key in [1, 2, 3, 1, 4, 3]] == [True, True, True, False, True, False]
+        seen.close()
@@ -0,0 +1,124 @@
+"""Test truncated repr and display options."""
+
+import pytest
+
+import tinytable as tt
+from tinytable import Table
+from tinytable.display import shown_positions
+
+
+class CountingList(list):
+    """list that counts item reads."""
+
+    reads = 0
+
+    def __getitem__(self, i):
+        CountingList.reads += 1
+        return super().__getitem__(i)
+
+
+@pytest.fixture
+def wide_table():
+    return Table({f"c{i}": list(range(100)) for i in range(30)})
+
+
+class TestOptions:
+    def test_get_set_reset(self):
+        assert tt.get_option("display.max_rows") == 60
+        try:
+            tt.set_option("display.max_rows", 10)
+            assert tt.get_option("display.max_rows") == 10
+        finally:
+            tt.reset_option("display.max_rows")
+        assert tt.get_option("display.max_rows") == 60
+
+    def test_unknown_option(self):
+        with pytest.raises(KeyError):
+            tt.get_option("display.nope")
+
+    def test_option_context(self):
+        with tt.option_context("display.max_rows", 4, "display.max_columns", 2):
+            assert tt.get_option("display.max_rows") == 4
+            assert tt.get_option("display.max_columns") == 2
+        assert tt.get_option("display.max_rows") == 60
+        assert tt.get_option("display.max_columns") == 20
+
+    def test_option_context_pairs(self):
+        with pytest.raises(ValueError):
+            with tt.option_context("display.max_rows"):
+                pass
+
+
+class TestShownPositions:
+    def test_all_shown(self):
+        assert shown_positions(3, 5) == ([0, 1, 2], None)
+        assert shown_positions(3, None) == ([0, 1, 2], None)
+
+    def test_head_and_tail(self):
+        assert shown_positions(100, 5) == ([0, 1, 2, 98, 99], 3)
+
+
+class TestTruncatedRepr:
+    def test_small_table_not_truncated(self, sample_table):
+        text = repr(sample_table)
+        assert "..." not in text
+        assert "rows x" not in text
+
+    def test_rows_truncated(self, wide_table):
+        with tt.option_context("display.max_rows", 4, "display.max_columns", None):
+            text = repr(wide_table)
+        lines = [line for line in text.splitlines() if line.startswith("|")]
+        # header, 2 head rows, gap row, 2 tail rows
+        assert len(lines) == 6
+        assert lines[-1].startswith("| 99 ")
+        assert "[100 rows x 30 columns]" in text
+
+    def test_columns_truncated(self, wide_table):
+        with tt.option_context("display.max_rows", 2, "display.max_columns", 4):
+            text = repr(wide_table)
+        header = text.splitlines()[1]
+        assert "c0" in header and "c1" in header and "c28" in header and "c29" in header
+        assert "c15" not in header
+        assert "..." in header
+
+    def test_repr_reads_only_shown_cells(self):
+        CountingList.reads = 0
+        t = Table({"x": list(range(100_000)), "y": list(range(100_000))})
+        t.data = {"x": CountingList(t.data["x"]), "y": CountingList(t.data["y"])}
+        with tt.option_context("display.max_rows", 10):
+            repr(t)
+        assert CountingList.reads == 20
+
+    def test_long_strings_kept_by_default(self):
+        t = Table({"text": ["x" * 500]})
+        assert "x" * 500 in repr(t)
+
+    def test_long_strings_shortened(self):
+        t = Table({"text": ["x" * 500]})
+        with tt.option_context("display.max_colwidth", 10):
+            text = repr(t)
+        assert "xxxxxxx..." in text
+        assert "x" * 11 not in text
+
+    def test_column_repr_truncated(self, wide_table):
+        with tt.option_context("display.max_rows", 4):
+            text = repr(wide_table["c3"])
+        assert "[100 rows x 1 columns]" in text
+
+    def test_row_repr_truncated(self, wide_table):
+        with tt.option_context("display.max_columns", 2):
+            text = repr(wide_table[5])
+        assert "c0" in text and "c29" in text and "c10" not in text
+
+    def test_labels_shown(self):
+        t = Table({"x": list(range(10))}, labels=[f"r{i}" for i in range(10)])
+        with tt.option_context("display.max_rows", 2):
+            text = repr(t)
+        assert "r0" in text and "r9" in text and "r5" not in text
+
+    def test_group_repr_truncated(self, sample_table):
+        g = sample_table.groupby("id")
+        with tt.option_context("display.max_groups", 2):
+            text = repr(g)
+        assert text.startswith("Group by ['id'] (10 groups)")
+        assert "Olivia" in text and "Mateo" in text and "Emma" not in text
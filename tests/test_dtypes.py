@@ -0,0 +1,101 @@
+"""Test astype conversions and error policies."""
+
+import pytest
+
+from tinytable import Table
+from tinytable.dtypes import convert, to_bool
+
+
+@pytest.fixture
+def raw():
+    return Table({"n": ["1", "2", None, "x"], "f": ["1.5", "2", "3e1", None], "b": ["yes", "False", "1", "maybe"]})
+
+
+class TestConvert:
+    def test_str_to_numbers(self):
+        assert convert(["1", " 2 ", None], int) == [1, 2, None]
+        assert convert(["1.5", "2"], float) == [1.5, 2.0]
+
+    def test_int_to_float(self):
+        result = convert([1, 2], float)
+        assert result == [1.0, 2.0]
+        assert all(type(value) is float for value in result)
+
+    def test_to_bool_parses_strings(self):
+        assert [to_bool(value) for value in ["True", "n", "0", 2]] == [True, False, False, True]
+        with pytest.raises(ValueError):
+            to_bool("maybe")
+
+    def test_function_sees_none(self):
+        assert convert([1, None], lambda value: value is None) == [False, True]
+
+    def test_bad_errors(self):
+        with pytest.raises(ValueError):
+            convert([1], int, errors="skip")
+
+
+class TestAstypeErrors:
+    def test_raise(self, raw):
+        with pytest.raises(ValueError):
+            raw.astype({"n": int})
+
+    def test_coerce(self, raw):
+        result = raw.astype({"n": int, "f": float, "b": "boolean"}, errors="coerce")
+        assert result.data == {"n": [1, 2, None, None], "f": [1.5, 2.0, 30.0, None], "b": [True, False, True, None]}
+        assert raw.data["n"] == ["1", "2", None, "x"]
+
+    def test_ignore(self, raw):
+        result = raw.astype({"n": int, "f": float}, errors="ignore")
+        assert result.data["n"] == ["1", "2", None, "x"]
+        assert result.data["f"] == [1.5, 2.0, 30.0, None]
+
+    def test_tracked_nulls(self, raw):
+        raw.track_nulls()
+        result = raw.astype({"n": int}, errors="coerce")
+        assert result.validity["n"].to_bools() == [True, True, False, False]
+
+    def test_cast_column_as(self, raw):
+        raw.cast_column_as("b", "boolean", errors="coerce")
+        assert raw.data["b"] == [True, False, True, None]
+
+    def test_bool_keeps_bool_semantics(self):
+        table = Table({"b": ["abc", "", "False", None]})
+        table.cast_column_as("b", bool)
+        assert table.data["b"] == [True, False, True, None]
+
+    def test_column_cast_as(self, raw):
+        column = raw["f"]
+        column.cast_as(float)
+        assert raw.data["f"] == [1.5, 2.0, 30.0, None]
+
+
+class TestTypedStorage:
+    def test_typed_dtypes(self):
+        np = pytest.importorskip("numpy")
+        result = Table({"n": ["1", "2"], "x": [1, 2]}).astype({"n": "int64", "x": "float64"})
+        assert isinstance(result.data["n"], np.ndarray)
+        assert result.data["x"].dtype == np.float64
+        assert result.backend == "numpy"
+
+    def test_typed_with_none_stays_list(self, raw):
+        pytest.importorskip("numpy")
+        result = raw.astype({"n": "int64"}, errors="coerce")
+        assert result.data["n"] == [1, 2, None, None]
+
+    def test_array_columns(self):
+        pytest.importorskip("numpy")
+        table = Table({"x": [1, 2]}).to_backend("numpy")
+        assert table.astype({"x": float}).data["x"] == [1.0, 2.0]
+        assert table.astype({"x": str}).data["x"] == ["1", "2"]
+        assert table.astype({"x": "bool"}).data["x"].tolist() == [True, True]
+
+    def test_array_errors(self):
+        pytest.importorskip("numpy")
+        table = Table({"x": [1.5, float("nan"), float("inf")]}).to_backend("numpy")
+        with pytest.raises(ValueError):
+            table.astype({"x": int})
+        with pytest.raises(ValueError):
+            table.astype({"x": "int64"})
+        assert table.astype({"x": int}, errors="coerce").data["x"] == [1, None, None]
+        assert table.astype({"x": "int64"}, errors="coerce").data["x"] == [1, None, None]
+        assert table.astype({"x": "int64"}, errors="ignore").data["x"].dtype.kind == "f"
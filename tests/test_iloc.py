@@ -132,6 +132,60 @@ class TestIlocGetItem:
             _ = empty_table.iloc[0]
 
 
+class TestFusedGather:
+    """Test row and column selection gathered once from the source buffers."""
+
+    def test_filter_by_indexes_columns(self, sample_table):
+        """Test filter_by_indexes selects only the passed columns."""
+        result = sample_table.filter_by_indexes([2, 0], ["age", "id"])
+        assert result.data == {"age": [8, 4], "id": [3, 1]}
+
+    def test_contiguous_range_copies(self, sample_table):
+        """Test a range of rows is sliced into new lists."""
+        result = sample_table.filter_by_indexes(range(2, 4))
+        assert result.data["age"] == [8, 3]
+        result.edit_value("age", 0, 100)
+        assert sample_table.data["age"][2] == 8
+
+    def test_range_keeps_labels_and_nulls(self):
+        """Test labels and validity are gathered with the columns."""
+        table = Table({"x": [1, None, 3], "y": ["a", "b", "c"]}, labels=["p", "q", "r"])
+        table.track_nulls()
+        result = table.iloc[1:3, 0:1]
+        assert result.data == {"x": [None, 3]}
+        assert result.labels == ["q", "r"]
+        assert list(result.validity) == ["x"]
+        assert result.validity["x"].to_bools() == [False, True]
+
+    def test_slice_past_end_raises(self):
+        """Test a slice or range past the last row raises IndexError."""
+        table = Table({"a": [1, 2, 3, 4, 5]})
+        with pytest.raises(IndexError):
+            table[1:100]
+        with pytest.raises(IndexError):
+            table.filter_by_indexes(range(3, 10))
+
+    def test_iloc_two_slices_past_end_clipped(self):
+        """Test iloc slices past the end are clipped to the rows that exist."""
+        table = Table({"a": [1, 2, 3, 4, 5], "b": [6, 7, 8, 9, 10]})
+        result = table.iloc[1:100, 0:2]
+        assert len(result) == 4
+        assert result.data == {"a": [2, 3, 4, 5], "b": [7, 8, 9, 10]}
+        repr(result)
+
+    def test_iloc_open_and_negative_slices(self, sample_table):
+        """Test iloc with open ended and negative slices."""
+        assert sample_table.iloc[8:, 2:].data == {"age": [21, 90], "gender": ["f", "m"]}
+        assert sample_table.iloc[:, :2].columns == ("id", "name")
+        assert len(sample_table.iloc[:, :2]) == 10
+        assert sample_table.iloc[-2:, 0:2].data == {"id": [9, 10], "name": ["Sophia", "Mateo"]}
+
+    def test_categorical_range(self, sample_table):
+        """Test Categorical columns slice their codes."""
+        encoded = sample_table.astype({"gender": "category"})
+        assert list(encoded.filter_by_indexes(range(0, 3)).data["gender"]) == ["f", "m", "f"]
+
+
 class TestIlocSetItem:
     """Test Table.iloc __setitem__ operations."""
 
@@ -178,6 +232,35 @@ class TestIlocSetItem:
         with pytest.raises(KeyError):
             empty_table.iloc[0] = {"name": "Updated"}
 
+    def test_iloc_set_list_of_ints(self, sample_table):
+        """Test iloc setitem with list of ints sets each row."""
+        sample_table.iloc[[0, -1]] = [{"age": 1}, [11, "New", 2, "f"]]
+        assert sample_table.data["age"][0] == 1
+        assert sample_table.data["name"][9] == "New"
+        assert sample_table.data["age"][9] == 2
+
+    def test_iloc_set_slice(self, sample_table):
+        """Test iloc setitem with a slice sets each row."""
+        sample_table.iloc[:2] = [{"age": 1}, {"age": 2}]
+        assert sample_table.data["age"][:3] == [1, 2, 8]
+
+    def test_iloc_set_two_int_lists(self, sample_table):
+        """Test iloc setitem with two int lists sets a block."""
+        sample_table.iloc[[0, 2], [1, 2]] = [["A", 1], ["B", 2]]
+        assert sample_table.data["name"][:3] == ["A", "Noah", "B"]
+        assert sample_table.data["age"][:3] == [1, 5, 2]
+
+    def test_iloc_set_two_slices_scalar(self, sample_table):
+        """Test iloc setitem with two slices sets every cell to a scalar."""
+        sample_table.iloc[1:3, 2:4] = None
+        assert sample_table.data["age"][:4] == [4, None, None, 3]
+        assert sample_table.data["gender"][:4] == ["f", None, None, "m"]
+
+    def test_iloc_set_block_shape(self, sample_table):
+        """Test a block of the wrong shape raises ValueError."""
+        with pytest.raises(ValueError):
+            sample_table.iloc[[0, 1], [0, 1]] = [[1, 2]]
+
 
 class TestIlocEdgeCases:
     """Test iloc edge cases and error conditions."""
@@ -0,0 +1,47 @@
+"""Test optional backends are imported on first use, not with tinytable."""
+
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = ["openpyxl", "sqlite_utils", "tabulate", "urllib.request"]
+
+
+def imported_modules(code: str) -> set:
+    """Run code in a fresh interpreter, return the names of lazy modules it imported."""
+    script = f"import sys\n{code}\nprint(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+
+def test_import_tinytable_is_lazy():
+    """Test importing tinytable does not import I/O or display backends."""
+    assert imported_modules("import tinytable") == set()
+
+
+def test_csv_and_aggregations_stay_lazy():
+    """Test csv reading and aggregation do not import other backends."""
+    code = "import tinytable as tt\nt = tt.read_csv('tests/data/people.csv')\nt.sum()\nt.groupby('gender').mean()"
+    assert imported_modules(code) == set()
+
+
+@pytest.mark.parametrize(
+    "code,module",
+    [
+        ("repr(tt.Table({'x': [1]}))", "tabulate"),
+        ("tt.read_excel('tests/data/people.xlsx', 'Sheet1')", "openpyxl"),
+        ("tt.read_sqlite('tests/data/data.db', 'people')", "sqlite_utils"),
+    ],
+)
+def test_backend_imported_on_first_use(code, module):
+    """Test each backend is imported when first needed."""
+    assert module in imported_modules(f"import tinytable as tt\n{code}")
+
+
+@pytest.mark.slow
+def test_import_time():
+    """Benchmark: importing tinytable stays well under the eager-import baseline."""
+    code = "import time\nstart = time.perf_counter()\nimport tinytable\nprint(time.perf_counter() - start)"
+    timings = [float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout) for _ in range(3)]
+    assert min(timings) < 0.25
@@ -0,0 +1,72 @@
+"""Test interning repeated str values while reading files."""
+
+from tinytable import read_csv, read_excel, read_sqlite
+from tinytable.intern import StringInterner, interned_rows, interner
+
+
+def distinct_objects(values):
+    return len({id(value) for value in values})
+
+
+class TestStringInterner:
+    def test_shares_repeats(self):
+        values = ["".join(["a", "b"]) for _ in range(5)] + [1, None]
+        assert distinct_objects(values[:5]) == 5
+        StringInterner().intern_values("x", values)
+        assert distinct_objects(values[:5]) == 1
+        assert values == ["ab"] * 5 + [1, None]
+
+    def test_cache_is_bounded(self):
+        strings = StringInterner(max_size=2)
+        strings.intern_values("x", [str(i) for i in range(10)])
+        assert len(strings.caches["x"]) == 2
+
+    def test_caches_are_per_column(self):
+        strings = StringInterner()
+        strings.intern_data({"a": ["x"], "b": ["y", "z"]})
+        assert list(strings.caches["a"]) == ["x"]
+        assert list(strings.caches["b"]) == ["y", "z"]
+
+    def test_interned_rows_share_repeats_as_read(self):
+        strings = StringInterner()
+        rows = interned_rows(([1, "".join(["a", "b"])] for _ in range(3)), strings, ["n", "s"])
+        first = next(rows)
+        assert list(strings.caches["s"]) == ["ab"]
+        assert all(row[1] is first[1] for row in rows)
+
+    def test_interned_rows_mappings(self):
+        rows = [{"s": "".join(["a", "b"])} for _ in range(3)]
+        out = list(interned_rows(rows, StringInterner()))
+        assert out == rows
+        assert distinct_objects(row["s"] for row in out) == 1
+
+    def test_interned_rows_off(self):
+        rows = [["a"], ["a"]]
+        assert list(interned_rows(rows, None, ["s"])) == rows
+
+    def test_interner_option(self):
+        assert interner(False) is None
+        assert interner(True).max_size > 0
+        assert interner(3).max_size == 3
+
+
+class TestReadInterned:
+    def test_read_csv(self):
+        table = read_csv("tests/data/people.csv", intern_strings=True)
+        assert distinct_objects(table.data["gender"]) == 2
+        assert table.data == read_csv("tests/data/people.csv").data
+
+    def test_read_csv_chunks_share_cache(self):
+        stream = read_csv("tests/data/people.csv", chunksize=3, intern_strings=True)
+        genders = [value for chunk in stream for value in chunk.data["gender"]]
+        assert distinct_objects(genders) == 2
+
+    def test_read_excel(self):
+        table = read_excel("tests/data/people.xlsx", "Sheet1", intern_strings=True)
+        assert distinct_objects(table.data["gender"]) == 2
+
+    def test_read_sqlite(self, sample_table, temp_db_path):
+        sample_table.to_sqlite(temp_db_path, "people", replace_table=True)
+        table = read_sqlite(temp_db_path, "people", intern_strings=True)
+        assert distinct_objects(table.data["gender"]) == 2
+        assert table.data == sample_table.data
@@ -0,0 +1,83 @@
+"""Test Table.loc, vectorized setters and batch_edit."""
+
+import pytest
+
+from tinytable import Table
+
+
+@pytest.fixture
+def labeled():
+    return Table({"x": [1, 2, 3], "y": ["a", "b", "c"]}, labels=["r", "s", "r"])
+
+
+class TestLocGetItem:
+    def test_mask(self, sample_table):
+        result = sample_table.loc[sample_table["age"] > 50]
+        assert result.data["name"] == ["Oliver", "Elijah", "Mateo"]
+
+    def test_bools_and_column(self, sample_table):
+        mask = [age < 5 for age in sample_table.data["age"]]
+        assert list(sample_table.loc[mask, "name"]) == ["Olivia", "Liam"]
+
+    def test_labels(self, labeled):
+        assert labeled.loc["r"].data == {"x": [1, 3], "y": ["a", "c"]}
+        assert labeled.loc[["s", "r"], ["y"]].data == {"y": ["b", "a", "c"]}
+
+    def test_missing_label(self, labeled):
+        with pytest.raises(KeyError):
+            labeled.loc["t"]
+
+    def test_positions_without_labels(self, sample_table):
+        assert sample_table.loc[[0, -1], "id"].data == [1, 10]
+
+
+class TestLocSetItem:
+    def test_mask_scalar(self, sample_table):
+        sample_table.loc[sample_table["age"] >= 18, "adult"] = True
+        assert sample_table.data["adult"] == [None, None, None, None, True, True, None, True, True, True]
+
+    def test_values_per_row(self, labeled):
+        labeled.loc["r", "x"] = [10, 30]
+        assert labeled.data["x"] == [10, 2, 30]
+
+    def test_block(self, labeled):
+        labeled.loc[:, ["x", "y"]] = [[0, "p"], [0, "q"], [0, "r"]]
+        assert labeled.data == {"x": [0, 0, 0], "y": ["p", "q", "r"]}
+
+    def test_wrong_length(self, labeled):
+        with pytest.raises(ValueError):
+            labeled.loc["r", "x"] = [1, 2, 3]
+
+    def test_copy_on_write(self, sample_table):
+        copy_table = sample_table.copy()
+        sample_table.loc[[0], "age"] = 100
+        assert copy_table.data["age"][0] == 4
+
+    def test_tracks_nulls(self, labeled):
+        labeled.track_nulls()
+        labeled.loc["s", "x"] = None
+        assert labeled.validity["x"].to_bools() == [True, False, True]
+
+
+class TestBatchEdit:
+    def test_batch_edit(self, sample_table):
+        with sample_table.batch_edit():
+            for i, row in sample_table.iterrows():
+                row["age"] = row["age"] + 1
+            sample_table["name"][0] = "Zed"
+        assert sample_table.data["age"][:3] == [5, 6, 9]
+        assert sample_table.data["name"][0] == "Zed"
+
+    def test_batch_edit_rebuilds_validity(self):
+        table = Table({"x": [1, None]})
+        table.track_nulls()
+        with table.batch_edit():
+            table.edit_value("x", 0, None)
+            table.edit_value("x", 1, 2)
+        assert table.validity["x"].to_bools() == [False, True]
+
+    def test_batch_edit_copy_on_write(self, sample_table):
+        copy_table = sample_table.copy()
+        with sample_table.batch_edit():
+            sample_table.edit_value("age", 0, 100)
+        assert copy_table.data["age"][0] == 4
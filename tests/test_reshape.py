@@ -0,0 +1,74 @@
+"""Test pivot, pivot_table and melt."""
+
+import pytest
+
+from tinytable import Table
+
+
+@pytest.fixture
+def sales():
+    return Table(
+        {
+            "day": ["mon", "mon", "tue", "tue", "mon"],
+            "city": ["a", "b", "a", "b", "a"],
+            "units": [1, 2, 3, 4, 5],
+            "returns": [0, 1, None, 1, 0],
+        }
+    )
+
+
+class TestPivotTable:
+    def test_sum(self, sales):
+        result = sales.pivot_table("day", "city", "units", aggfunc="sum")
+        assert result.data == {"day": ["mon", "tue"], "a": [6, 3], "b": [2, 4]}
+
+    def test_default_values_and_mean(self, sales):
+        result = sales.pivot_table("day", "city")
+        assert result.columns == ("day", "units_a", "units_b", "returns_a", "returns_b")
+        assert result.data["units_a"] == [3, 3]
+        assert result.data["returns_a"] == [0, None]
+
+    def test_default_values_skip_mixed_types(self, sales):
+        sales["note"] = ["x", "y", "z", "x", "y"]
+        result = sales.pivot_table("day", "city")
+        assert result.columns == ("day", "units_a", "units_b", "returns_a", "returns_b")
+        with pytest.raises(TypeError):
+            sales.pivot_table("day", "city", "note")
+
+    def test_fill_value_and_function(self, sales):
+        result = sales.pivot_table("city", "day", "returns", aggfunc=lambda values: len(values), fill_value=0)
+        assert result.data == {"city": ["a", "b"], "mon": [2, 1], "tue": [0, 1]}
+
+    def test_multiple_index_columns(self, sales):
+        result = sales.pivot_table(["day", "city"], "city", "units", aggfunc="count")
+        assert result.data["day"] == ["mon", "mon", "tue", "tue"]
+        assert result.data["city"] == ["a", "b", "a", "b"]
+        assert result.data["a"] == [2, None, 1, None]
+
+
+class TestPivot:
+    def test_pivot(self, sales):
+        result = sales.filter_by_indexes([0, 1, 2, 3]).pivot("day", "city", "units")
+        assert result.data == {"day": ["mon", "tue"], "a": [1, 3], "b": [2, 4]}
+
+    def test_duplicates_raise(self, sales):
+        with pytest.raises(ValueError):
+            sales.pivot("day", "city", "units")
+
+
+class TestMelt:
+    def test_melt(self, sales):
+        result = sales.melt("day", ["units", "returns"])
+        assert result.columns == ("day", "variable", "value")
+        assert result.data["day"] == sales.data["day"] * 2
+        assert result.data["variable"] == ["units"] * 5 + ["returns"] * 5
+        assert result.data["value"] == sales.data["units"] + sales.data["returns"]
+
+    def test_melt_names_and_defaults(self, sales):
+        result = sales.melt(["day", "city"], var_name="field", value_name="amount")
+        assert result.columns == ("day", "city", "field", "amount")
+        assert len(result) == 10
+
+    def test_pivot_round_trip(self, sales):
+        long = sales.filter_by_indexes([0, 1, 2, 3]).melt(["day", "city"], ["units"])
+        assert long.pivot("day", "city", "value").data == {"day": ["mon", "tue"], "a": [1, 3], "b": [2, 4]}
@@ -0,0 +1,80 @@
+"""Test approximate distinct counts and quantile sketches."""
+
+import json
+
+import pytest
+
+from tinytable import HyperLogLog, QuantileSketch, Table, TableStream
+
+
+@pytest.fixture
+def numbers():
+    return [(i * 7919) % 10_000 for i in range(20_000)]
+
+
+class TestHyperLogLog:
+    def test_small_counts_close(self):
+        assert HyperLogLog.from_values(["a", "b", "a", None, 1]).count() == 4
+
+    def test_estimate_within_error(self, numbers):
+        estimate = HyperLogLog.from_values(numbers).count()
+        assert abs(estimate - 10_000) / 10_000 < 0.03
+
+    def test_merge_and_serialize(self, numbers):
+        a = HyperLogLog.from_values(numbers[:10_000])
+        b = HyperLogLog.from_dict(json.loads(json.dumps(HyperLogLog.from_values(numbers[10_000:]).to_dict())))
+        assert a.merge(b).count() == HyperLogLog.from_values(numbers).count()
+
+    def test_merge_precision_mismatch(self):
+        with pytest.raises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+
+class TestQuantileSketch:
+    def test_exact_for_small_inputs(self):
+        sketch = QuantileSketch.from_values([5, 1, None, 4, 2, 3])
+        assert sketch.quantiles([0, 0.5, 1]) == [1, 3, 5]
+
+    def test_bounded_size_and_rank_error(self, numbers):
+        sketch = QuantileSketch.from_values(numbers, k=100)
+        assert sketch.count == len(numbers)
+        assert sum(map(len, sketch.compactors)) < 400
+        assert abs(sketch.quantile(0.9) - 9_000) < 300
+
+    def test_merge_and_serialize(self, numbers):
+        a = QuantileSketch.from_values(numbers[:10_000])
+        b = QuantileSketch.from_dict(json.loads(json.dumps(QuantileSketch.from_values(numbers[10_000:]).to_dict())))
+        merged = a.merge(b)
+        assert merged.count == len(numbers)
+        assert abs(merged.quantile(0.5) - 5_000) < 200
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            QuantileSketch.from_values(["a"])
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(0.5)
+        with pytest.raises(ValueError):
+            QuantileSketch.from_values([1]).quantile(1.5)
+
+
+class TestTableSketches:
+    def test_nunique_approx(self, sample_table):
+        assert sample_table.nunique(approx=True) == sample_table.nunique()
+
+    def test_nunique_approx_mixed_numbers(self):
+        table = Table({"x": [1, 1.0, True, 2, 2.0, 0, False, -0.0, 2.5, "1"]})
+        assert table.nunique(approx=True) == table.nunique() == {"x": 5}
+
+    def test_approx_quantile_skips_non_numeric(self, sample_table):
+        assert sample_table.approx_quantile() == {"id": 5, "age": 12}
+        assert sample_table.approx_quantile([0, 1]) == {"id": [1, 10], "age": [3, 90]}
+
+    def test_group(self, sample_table):
+        grouped = sample_table.groupby("gender")
+        assert grouped.nunique(approx=True).data == grouped.nunique().data
+        assert grouped.approx_quantile(1).data == {"id": [9, 10], "age": [24, 90]}
+
+    def test_stream(self, numbers):
+        stream = TableStream([Table({"n": numbers[i : i + 1000]}) for i in range(0, len(numbers), 1000)])
+        assert abs(stream.approx_nunique()["n"] - 10_000) < 300
+        assert abs(stream.approx_quantile(0.5)["n"] - 5_000) < 200
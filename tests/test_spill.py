@@ -0,0 +1,134 @@
+"""Test sorting and grouping with disk spill."""
+
+import random
+
+import pytest
+
+from tinytable import Table, TableStream, read_csv
+from tinytable.aggregate import get_aggregation
+from tinytable.sort import external_sort
+from tinytable.spill import SpilledGroups, SpillFile, SpillGroupAccumulator, estimate_row_bytes
+
+
+@pytest.fixture
+def random_table():
+    rng = random.Random(42)
+    n = 500
+    return Table(
+        {
+            "key": [rng.choice("abcdefghij") for _ in range(n)],
+            "value": [rng.randint(0, 100) for _ in range(n)],
+            "id": list(range(n)),
+        }
+    )
+
+
+class TestSpillFile:
+    def test_round_trip(self):
+        spill = SpillFile()
+        first = spill.write([1, 2])
+        second = spill.write([3])
+        assert list(spill) == [1, 2, 3]
+        assert spill.read(second) == [3]
+        assert spill.read(first) == [1, 2]
+        spill.close()
+
+    def test_estimate_row_bytes(self):
+        assert estimate_row_bytes({}) == 0
+        assert estimate_row_bytes({"x": [1, 2], "y": ["a", "b"]}) > 0
+
+
+class TestSortValues:
+    def test_sort_values(self, sample_table):
+        result = sample_table.sort_values("age")
+        assert result.data["age"] == sorted(sample_table.data["age"])
+        assert result.data["name"][0] == "Liam"
+
+    def test_sort_values_descending(self, sample_table):
+        result = sample_table.sort_values("age", ascending=False)
+        assert result.data["age"] == sorted(sample_table.data["age"], reverse=True)
+
+    def test_sort_values_multi_mixed(self, sample_table):
+        result = sample_table.sort_values(["gender", "age"], ascending=[True, False])
+        assert result.data["gender"] == ["f"] * 5 + ["m"] * 5
+        assert result.data["age"][:5] == [24, 21, 12, 8, 4]
+
+    def test_sort_values_none_last(self):
+        t = Table({"x": [2, None, 1]})
+        assert t.sort_values("x").data["x"] == [1, 2, None]
+        assert t.sort_values("x", ascending=False).data["x"] == [2, 1, None]
+
+    def test_sort_values_keeps_labels(self, labeled_table):
+        result = labeled_table.sort_values("age", ascending=False)
+        assert result.labels == [("r3",), ("r2",), ("r1",)]
+
+    def test_sort_values_ascending_length(self, sample_table):
+        with pytest.raises(ValueError):
+            sample_table.sort_values(["gender", "age"], ascending=[True])
+
+    def test_sort_values_memory_limit(self, random_table):
+        expected = random_table.sort_values(["key", "value"])
+        result = random_table.sort_values(["key", "value"], memory_limit=2_000)
+        assert result.data == expected.data
+
+    def test_external_sort_stable_many_runs(self, random_table):
+        chunks = [random_table[i : i + 50].data for i in range(0, 500, 50)]
+        result = list(external_sort(chunks, ["key"], memory_limit=1_000, chunksize=64))
+        assert [len(chunk["id"]) for chunk in result][:2] == [64, 64]
+        ids = [i for chunk in result for i in chunk["id"]]
+        assert ids == random_table.sort_values("key").data["id"]
+
+    def test_stream_sort_values(self, random_table):
+        stream = TableStream(random_table[i : i + 100] for i in range(0, 500, 100))
+        result = stream.sort_values("value", ascending=False, memory_limit=1_000, chunksize=100).to_table()
+        assert result.data == random_table.sort_values("value", ascending=False).data
+
+    def test_stream_sort_values_csv(self, sample_table):
+        stream = read_csv("tests/data/people.csv", chunksize=3)
+        assert stream.sort_values("name", memory_limit=100).to_table().data == sample_table.sort_values("name").data
+
+
+class TestSpillGroupby:
+    def test_groupby_memory_limit(self, random_table):
+        expected = random_table.groupby("key")
+        result = random_table.groupby("key", memory_limit=1_000)
+        assert isinstance(result.groups, SpilledGroups)
+        assert [key for key, _ in result] == [key for key, _ in expected]
+        assert result[0][1].data == expected[0][1].data
+        assert result.sum().data == expected.sum().data
+        assert result.sum().labels == expected.sum().labels
+
+    def test_groupby_memory_limit_not_reached(self, sample_table):
+        result = sample_table.groupby("gender", memory_limit=10**9)
+        assert isinstance(result.groups, list)
+
+    def test_spill_group_accumulator(self, random_table):
+        acc = SpillGroupAccumulator(get_aggregation("sum"), "key", memory_limit=300, partitions=3)
+        for i in range(0, 500, 50):
+            acc.update(random_table[i : i + 50].data)
+        assert acc.spilled
+        labels, data = acc.result()
+        expected = random_table.groupby("key").sum()
+        assert labels == expected.labels
+        assert data == expected.data
+        acc.close()
+
+    def test_stream_groupby_closes_on_error(self, random_table, monkeypatch):
+        closed = []
+        monkeypatch.setattr(SpillGroupAccumulator, "close", lambda self: closed.append(self.spilled))
+
+        def chunks():
+            for i in range(0, 300, 50):
+                yield random_table[i : i + 50]
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError):
+            TableStream(chunks()).groupby("key", memory_limit=300).sum()
+        assert closed == [True]
+
+    def test_stream_groupby_memory_limit(self, random_table):
+        stream = TableStream(random_table[i : i + 50] for i in range(0, 500, 50))
+        result = stream.groupby("key", memory_limit=300).max()
+        expected = random_table.groupby("key").max()
+        assert result.labels == expected.labels
+        assert result.data == expected.data
@@ -0,0 +1,196 @@
+"""Test TableStream chunked pipelines."""
+
+import sqlite3
+
+import pytest
+
+from tinytable import Table, TableStream, read_csv, read_sqlite
+from tinytable.aggregate import GroupAccumulator, get_aggregation
+
+
+@pytest.fixture
+def people_stream():
+    return read_csv("tests/data/people.csv", chunksize=3)
+
+
+class TestTableStreamSources:
+    """Test building TableStreams."""
+
+    def test_read_csv_chunksize(self, people_stream):
+        """Test read_csv with chunksize returns stream of Tables."""
+        assert isinstance(people_stream, TableStream)
+        chunks = list(people_stream)
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+        assert all(isinstance(chunk, Table) for chunk in chunks)
+        assert chunks[0].data["name"] == ["Olivia", "Noah", "Emma"]
+
+    def test_stream_is_reiterable(self, people_stream):
+        """Test file backed stream can be consumed more than once."""
+        assert people_stream.count() == people_stream.count()
+
+    def test_read_csv_chunksize_names(self, tmp_path):
+        """Test chunked csv with names reads first line as data."""
+        path = tmp_path / "no_header.csv"
+        path.write_text("1,a\n2,b\n3,c\n")
+        stream = read_csv(str(path), names=["id", "letter"], chunksize=2)
+        assert stream.to_table().data == {"id": [1, 2, 3], "letter": ["a", "b", "c"]}
+
+    def test_read_sqlite_chunksize(self):
+        """Test read_sqlite with chunksize."""
+        stream = read_sqlite("tests/data/data.db", "people", chunksize=4)
+        assert [len(chunk) for chunk in stream] == [4, 4, 2]
+        assert stream.sum()["age"] == 291
+
+    def test_from_cursor(self):
+        """Test stream from sqlite cursor."""
+        con = sqlite3.connect("tests/data/data.db")
+        try:
+            cursor = con.execute("select id, age from people where age > 10")
+            stream = TableStream.from_cursor(cursor, chunksize=2)
+            assert stream.to_table().data == {"id": [5, 6, 7, 8, 9, 10], "age": [24, 56, 12, 68, 21, 90]}
+        finally:
+            con.close()
+
+    def test_from_iterable_of_mappings(self):
+        """Test stream from plain data mappings."""
+        stream = TableStream([{"x": [1, 2]}, {"x": [3]}])
+        assert stream.sum() == {"x": 6}
+
+
+class TestTableStreamOperations:
+    """Test lazy chunk operations."""
+
+    def test_filter(self, people_stream):
+        result = people_stream.filter(lambda tbl: tbl["age"] >= 21).to_table()
+        assert result.data["name"] == ["Amelia", "Oliver", "Elijah", "Sophia", "Mateo"]
+
+    def test_select(self, people_stream):
+        result = people_stream.select(["id", "age"]).head(2)
+        assert result.data == {"id": [1, 2], "age": [4, 5]}
+
+    def test_map(self, people_stream):
+        result = people_stream.map(lambda tbl: tbl.tail(1)).to_table()
+        assert result.data["id"] == [3, 6, 9, 10]
+
+    def test_with_column(self, people_stream):
+        result = people_stream.with_column("months", lambda tbl: tbl["age"] * 12).to_table()
+        assert result.data["months"][:3] == [48, 60, 96]
+        assert result.columns == ("id", "name", "age", "gender", "months")
+
+    def test_with_column_scalar(self, people_stream):
+        result = people_stream.with_column("source", "csv").head(4)
+        assert result.data["source"] == ["csv"] * 4
+
+    def test_head_reads_only_needed_chunks(self):
+        consumed = []
+
+        def chunks():
+            for i in range(100):
+                consumed.append(i)
+                yield {"x": [i, i]}
+
+        stream = TableStream(chunks())
+        assert stream.head(3).data == {"x": [0, 0, 1]}
+        assert consumed == [0, 1]
+
+
+class TestTableStreamAggregations:
+    """Test mergeable streaming aggregations."""
+
+    def test_aggregations_match_table(self, people_stream, sample_table):
+        assert people_stream.sum() == sample_table.sum()
+        assert people_stream.count() == sample_table.count()
+        assert people_stream.mean() == sample_table.mean()
+        assert people_stream.min() == sample_table.min()
+        assert people_stream.max() == sample_table.max()
+
+    def test_aggregate_unknown(self, people_stream):
+        with pytest.raises(ValueError):
+            people_stream.aggregate("median")
+
+    def test_skips_empty_chunks(self, people_stream):
+        result = people_stream.filter(lambda tbl: tbl["age"] > 60).sum()
+        assert result["age"] == 158
+
+    def test_groupby(self, people_stream, sample_table):
+        result = people_stream.groupby("gender").sum()
+        expected = sample_table.groupby("gender").sum()
+        assert result.labels == expected.labels
+        assert result.data == expected.data
+
+    def test_groupby_mean_multi(self, people_stream):
+        result = people_stream.groupby(["gender"]).mean()
+        assert result.labels == [("f",), ("m",)]
+        assert result.data["age"] == [13.8, 44.4]
+
+    def test_group_accumulator_merge(self):
+        agg = get_aggregation("max")
+        a = GroupAccumulator(agg, "k")
+        b = GroupAccumulator(agg, "k")
+        a.update({"k": ["x", "y"], "v": [1, 5]})
+        b.update({"k": ["y", "z"], "v": [7, 2]})
+        a.merge(b)
+        labels, data = a.result()
+        assert labels == ["x", "y", "z"]
+        assert data["v"] == [1, 7, 2]
+
+
+class TestSortedGroupby:
+    """Test grouping streams and Tables already sorted by the group key."""
+
+    @pytest.fixture
+    def sorted_stream(self):
+        rows = {"k": ["a", "a", "b", "b", "b", "c", "d", "d"], "v": [1, 2, 3, 4, 5, 6, 7, 8]}
+        return TableStream([Table({name: values[i : i + 3] for name, values in rows.items()}) for i in range(0, 8, 3)])
+
+    def test_aggregate_carries_groups_across_chunks(self, sorted_stream):
+        result = sorted_stream.groupby("k", sorted=True).sum()
+        assert result.labels == ["a", "b", "c", "d"]
+        assert result.data["v"] == [3, 12, 6, 15]
+
+    def test_matches_hash_groupby(self, sorted_stream):
+        expected = sorted_stream.groupby("k").mean()
+        assert sorted_stream.groupby("k", sorted=True).mean().data == expected.data
+
+    def test_aggregate_stream_emits_finished_groups(self, sorted_stream):
+        chunks = list(sorted_stream.groupby("k", sorted=True).aggregate_stream("count"))
+        assert [chunk.labels for chunk in chunks] == [["a"], ["b"], ["c"], ["d"]]
+
+    def test_iterate_groups(self, sorted_stream):
+        groups = [(key, table["v"].data) for key, table in sorted_stream.groupby("k", sorted=True)]
+        assert groups == [("a", [1, 2]), ("b", [3, 4, 5]), ("c", [6]), ("d", [7, 8])]
+        with pytest.raises(ValueError):
+            iter(sorted_stream.groupby("k")).__next__()
+
+    def test_table_groupby_sorted(self):
+        table = Table({"k": [1, 1, 2, 2, 2, 3], "v": [1, 2, 3, 4, 5, 6]})
+        grouped = table.groupby("k", sorted=True)
+        assert grouped.sum().data == table.groupby("k").sum().data
+        assert grouped.transform("max").data == {"v": [2, 2, 5, 5, 5, 6]}
+
+    def test_table_groupby_sorted_slices_lazily(self):
+        table = Table({"k": [1, 1, 2], "v": [1, 2, 3]})
+        grouped = table.groupby("k", sorted=True)
+        assert len(grouped.groups) == 2
+        assert grouped[1][1].data == {"k": [2], "v": [3]}
+        assert [(key, group.data["v"]) for key, group in grouped] == [(1, [1, 2]), (2, [3])]
+
+
+class TestTableStreamSinks:
+    """Test writing streams."""
+
+    def test_to_csv(self, people_stream, temp_csv_path, sample_table):
+        people_stream.filter(lambda tbl: tbl["gender"] == "f").to_csv(str(temp_csv_path))
+        result = read_csv(str(temp_csv_path))
+        assert result.data == sample_table[sample_table["gender"] == "f"].data
+
+    def test_to_sqlite(self, people_stream, temp_db_path, sample_table):
+        people_stream.to_sqlite(str(temp_db_path), "people")
+        result = read_sqlite(str(temp_db_path), "people")
+        assert result.data == sample_table.data
+
+    def test_to_sqlite_replace(self, people_stream, temp_db_path):
+        people_stream.to_sqlite(str(temp_db_path), "people")
+        people_stream.select(["id"]).to_sqlite(str(temp_db_path), "people", replace_table=True)
+        result = read_sqlite(str(temp_db_path), "people")
+        assert result.data == {"id": list(range(1, 11))}
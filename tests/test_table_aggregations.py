@@ -290,3 +290,107 @@ class TestTableAggregationEdgeCases:
         groups = t.groupby("category")
         assert len(groups.groups) == 3
         assert all(len(group) == 1 for _, group in groups)
+
+
+class TestValueCounts:
+    """Test Column and Table value_counts."""
+
+    @pytest.fixture
+    def colors(self):
+        return Table({"color": ["red", "blue", None, "blue", "green", "blue", "red"], "size": [1, 2, 1, 2, 1, 1, 1]})
+
+    def test_column_most_frequent_first(self, colors):
+        counts = colors["color"].value_counts()
+        assert list(counts.items()) == [("blue", 3), ("red", 2), (None, 1), ("green", 1)]
+
+    def test_column_options(self, colors):
+        assert colors["color"].value_counts(dropna=True, top=2) == {"blue": 3, "red": 2}
+        assert colors["color"].value_counts(normalize=True, dropna=True) == {"blue": 0.5, "red": 2 / 6, "green": 1 / 6}
+
+    def test_table_subset(self, colors):
+        result = colors.value_counts(["color", "size"], dropna=True)
+        assert result.columns == ("color", "size", "count")
+        assert result.data["count"] == [2, 2, 1, 1]
+        assert list(zip(result.data["color"], result.data["size"])) == [("red", 1), ("blue", 2), ("green", 1), ("blue", 1)]
+
+    def test_table_single_column_normalized(self, colors):
+        result = colors.value_counts(["size"], normalize=True, top=1)
+        assert result.data == {"size": [1], "proportion": [5 / 7]}
+
+    def test_table_column_name(self, colors):
+        assert colors.value_counts("size").data == colors.value_counts(["size"]).data
+
+    def test_table_missing_column(self, colors):
+        with pytest.raises(KeyError):
+            colors.value_counts(["shape"])
+
+
+class TestQuantiles:
+    """Test exact quantile, median and describe."""
+
+    def test_quantile_interpolates(self, sample_table):
+        assert sample_table.quantile(0.25) == {"id": 3.25, "age": 5.75}
+        assert sample_table.quantile([0, 1]) == {"id": [1, 10], "age": [3, 90]}
+
+    def test_median_skips_none(self):
+        t = Table({"x": [3, None, 1, 2], "s": ["a", "b", "c", "d"]})
+        assert t.median() == {"x": 2}
+
+    def test_quantile_out_of_range(self, sample_table):
+        with pytest.raises(ValueError):
+            sample_table.quantile(2)
+
+    def test_describe(self, sample_table):
+        result = sample_table.describe()
+        assert result.labels == ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+        assert result.columns == ("id", "age")
+        assert result.data["age"][0] == 10
+        assert result.data["age"][1] == pytest.approx(29.1)
+        assert result.data["age"][2] == pytest.approx(sample_table.std()["age"])
+        assert result.data["age"][3:] == [3, 5.75, 16.5, 48.0, 90]
+
+    def test_group_median_and_describe(self, sample_table):
+        grouped = sample_table.groupby("gender")
+        assert grouped.median().data == {"id": [5, 6], "age": [12, 56]}
+        described = grouped.describe()
+        assert described.labels == ["f", "m"]
+        assert described.data["age_max"] == [24, 90]
+
+
+def demean(values):
+    mean = sum(values) / len(values)
+    return [value - mean for value in values]
+
+
+class TestGroupTransform:
+    """Test Group transform and apply broadcasting back to the original rows."""
+
+    def test_transform_name_broadcasts(self, sample_table):
+        result = sample_table.groupby("gender").transform("max")
+        assert result.data["age"] == [24, 90, 24, 90, 24, 90, 24, 90, 24, 90]
+        assert "gender" not in result.data
+
+    def test_transform_function_per_row(self, sample_table):
+        result = sample_table.groupby("gender").transform(demean)
+        assert result.data["id"] == [-4, -4, -2, -2, 0, 0, 2, 2, 4, 4]
+        assert "name" not in result.data
+
+    def test_transform_in_processes(self, sample_table):
+        grouped = sample_table.groupby("gender")
+        assert grouped.transform(demean, processes=2).data == grouped.transform(demean).data
+
+    def test_transform_errors(self, sample_table):
+        grouped = sample_table.groupby("gender")
+        with pytest.raises(ValueError):
+            grouped.transform("nope")
+        with pytest.raises(ValueError):
+            grouped.transform(lambda values: values[:1])
+
+    def test_apply_same_rows_scatters(self, sample_table):
+        result = sample_table.groupby("gender").apply(lambda t: {"rank": list(range(len(t)))})
+        assert result.data == {"rank": [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]}
+
+    def test_apply_other_rows_stacks(self, sample_table):
+        result = sample_table.groupby("gender").apply(lambda t: t.head(2))
+        assert result.labels == ["f", "f", "m", "m"]
+        assert result.data["name"] == ["Olivia", "Emma", "Noah", "Liam"]
@@ -233,3 +233,71 @@ class TestTableSpecialMethods:
         """Test keys method."""
         keys = sample_table.keys()
         assert keys == ("id", "name", "age", "gender")
+
+
+class TestTableRowCount:
+    """Test the cached row count stays in step with mutations."""
+
+    def test_len_not_recounted(self, sample_table, monkeypatch):
+        """Test row access does not recount rows."""
+        import tinytable.table as table_module
+
+        calls = []
+        original = table_module.features.row_count
+        monkeypatch.setattr(table_module.features, "row_count", lambda data: calls.append(1) or original(data))
+        for i in range(len(sample_table)):
+            sample_table[i]
+        assert len(sample_table) == 10
+        assert calls == []
+
+    def test_len_after_drop_row(self, sample_table):
+        """Test len after dropping rows inplace."""
+        sample_table.drop_row(0)
+        del sample_table[0]
+        assert len(sample_table) == 8
+        assert sample_table[-1]["name"] == "Mateo"
+
+    def test_len_after_filter_inplace(self, sample_table):
+        """Test len after filtering inplace."""
+        sample_table.filter_by_indexes_inplace([1, 3])
+        assert len(sample_table) == 2
+        with pytest.raises(IndexError, match=r"row index 2 out of range \(0-1\)"):
+            sample_table[2]
+
+    def test_len_after_dropping_all_columns(self, sample_table):
+        """Test len after dropping every column."""
+        for name in list(sample_table.columns):
+            sample_table.drop_column(name)
+        assert len(sample_table) == 0
+        sample_table.filter_by_columns_inplace([])
+        assert len(sample_table) == 0
+
+    def test_len_after_setting_data(self, sample_table):
+        """Test assigning data resets the cached row count."""
+        sample_table.data = {"x": [1, 2]}
+        assert len(sample_table) == 2
+
+    def test_len_after_dropna_inplace(self, table_with_none):
+        """Test len after dropna inplace."""
+        table_with_none.dropna(inplace=True)
+        assert len(table_with_none) == 2
+        assert len(table_with_none.dropna(axis=1)) == 2
+
+    def test_derived_table_len(self, sample_table):
+        """Test len of derived Tables."""
+        assert len(sample_table.head(3)) == 3
+        assert len(sample_table.tail(20)) == 10
+        assert len(sample_table.only_columns(["id"])) == 10
+        assert len(sample_table.filter_by_columns([])) == 0
+        assert len(sample_table[2:5]) == 3
+
+    def test_negative_index(self, sample_table):
+        """Test negative positional access."""
+        assert sample_table[-10]["name"] == "Olivia"
+        with pytest.raises(IndexError, match=r"row index -1 out of range \(0-9\)"):
+            sample_table[-11]
+
+    def test_empty_index(self, empty_table):
+        """Test positional access on empty Table."""
+        with pytest.raises(IndexError, match="empty Table"):
+            empty_table[0]
@@ -2,7 +2,7 @@
 
 import pytest
 
-from tinytable import Table
+from tinytable import Table, TableStream
 
 
 class TestTableDataOperations:
@@ -50,6 +50,13 @@ class TestTableDataOperations:
         result = sample_table.tail()
         assert len(result) == 5
 
+    def test_tail_zero(self, labeled_table):
+        """Test tail(0) returns no rows or labels."""
+        result = labeled_table.tail(0)
+        assert len(result) == 0
+        assert result.data["id"] == []
+        assert labeled_table.label_tail(0) == []
+
     def test_head_empty_table(self, empty_table):
         """Test head on empty table."""
         result = empty_table.head(5)
@@ -238,3 +245,134 @@ class TestTableDataOperations:
         assert len(rows) == 3
         assert rows[0][1].label == ("r1",)
         assert rows[1][1].label == ("r2",)
+
+
+class TestCopyOnWrite:
+    """Test copies and column subsets share lists until changed."""
+
+    def test_copy_shares_lists(self, sample_table):
+        """Test shallow copy does not copy column lists."""
+        copy_table = sample_table.copy()
+        assert copy_table._data["age"] is sample_table._data["age"]
+
+    def test_copy_edit_does_not_change_original(self, sample_table):
+        """Test editing a copy copies the changed column only."""
+        copy_table = sample_table.copy()
+        copy_table["age"][0] = 100
+        copy_table.drop_row(1)
+        assert sample_table.data["age"][:2] == [4, 5]
+        assert len(sample_table) == 10
+        assert copy_table.data["age"][:2] == [100, 8]
+
+    def test_original_edit_does_not_change_copy(self, sample_table):
+        """Test editing the original leaves the copy unchanged."""
+        copy_table = sample_table.copy()
+        sample_table.edit_value("name", 0, "Zed")
+        sample_table.edit_row(1, {"age": 0})
+        assert copy_table.data["name"][0] == "Olivia"
+        assert copy_table.data["age"][1] == 5
+        assert sample_table.data["age"][1] == 0
+
+    def test_drop_column_copy_does_not_share_labels(self):
+        """Test dropping a row from a drop_column copy leaves the original labels."""
+        table = Table({"x": [1, 2, 3], "y": [4, 5, 6]}, labels=["a", "b", "c"])
+        result = table.drop_column("y", inplace=False)
+        result.drop_row(0)
+        assert table.labels == ["a", "b", "c"]
+        assert result.labels == ["b", "c"]
+
+    def test_only_columns_shares_lists(self, sample_table):
+        """Test column subsets share lists until changed."""
+        subset = sample_table[["id", "age"]]
+        assert subset._data["age"] is sample_table._data["age"]
+        subset.edit_column("age", [0] * 10)
+        assert sample_table.data["age"][0] == 4
+        assert subset._data["age"] is not sample_table._data["age"]
+
+    def test_direct_data_edit_unshares(self, sample_table):
+        """Test changing a list through Table.data leaves copies unchanged."""
+        copy_table = sample_table.copy()
+        sample_table.data["age"][0] = 100
+        assert copy_table.data["age"][0] == 4
+
+    def test_direct_data_append_recounts(self):
+        """Test resizing column lists through Table.data updates the row count."""
+        table = Table({"x": [1, 2, 3]})
+        assert len(table) == 3
+        table.data["x"].append(4)
+        assert len(table) == 4
+        column = table.data["x"]
+        len(table)
+        column.append(5)
+        assert len(table) == 5
+
+    def test_direct_data_edit_rebuilds_bitmaps(self):
+        """Test tracked null bitmaps follow direct changes to Table.data."""
+        table = Table({"x": [1, None, 3]})
+        table.track_nulls()
+        table.data["x"][0] = None
+        assert table.validity["x"].to_bools() == [False, False, True]
+
+    def test_internal_reads_keep_sharing(self, sample_table):
+        """Test grouping and streaming a copy read its lists without copying them."""
+        copy_table = sample_table.copy()
+        copy_table.groupby("gender").nunique(approx=True)
+        TableStream([copy_table]).sum()
+        assert copy_table._data["age"] is sample_table._data["age"]
+
+    def test_fillna_inplace_on_copy(self, table_with_none):
+        """Test inplace fillna on a copy leaves the original."""
+        copy_table = table_with_none.copy()
+        copy_table.fillna(0, inplace=True)
+        assert None in table_with_none.data["age"]
+        assert None not in copy_table.data["age"]
+
+    def test_deep_copy_copies_values(self):
+        """Test deep copy copies mutable values."""
+        t = Table({"x": [[1], [2]]})
+        deep = t.copy(deep=True)
+        deep.data["x"][0].append(3)
+        assert t.data["x"][0] == [1]
+
+
+class TestDropRows:
+    """Test dropping many rows at once."""
+
+    def test_drop_rows_inplace(self, sample_table):
+        """Test dropping rows by index, negative indexes from the end."""
+        ages = sample_table.data["age"]
+        assert sample_table.drop_rows([0, 2, -1]) is None
+        assert sample_table.data["age"] == [age for i, age in enumerate(ages) if i not in (0, 2, 9)]
+        assert len(sample_table) == 7
+
+    def test_drop_rows_copy(self, sample_table):
+        """Test inplace=False leaves the Table unchanged."""
+        result = sample_table.drop_rows(range(5), inplace=False)
+        assert result.data["age"] == sample_table.data["age"][5:]
+        assert len(sample_table) == 10
+
+    def test_drop_rows_out_of_range(self, sample_table):
+        """Test dropping a row past the end raises IndexError."""
+        with pytest.raises(IndexError):
+            sample_table.drop_rows([10])
+
+    def test_drop_rows_labels_and_nulls(self):
+        """Test labels and validity bitmaps are compacted with the columns."""
+        table = Table({"x": [1, None, 3, None]}, labels=["a", "b", "c", "d"])
+        table.track_nulls()
+        table.drop_rows([0, 3])
+        assert table.labels == ["b", "c"]
+        assert table.validity["x"].to_bools() == [False, True]
+
+    def test_drop_mask(self, sample_table):
+        """Test dropping rows by a Filter or a list of bools."""
+        young = [age < 10 for age in sample_table.data["age"]]
+        result = sample_table.drop(sample_table["age"] < 10, inplace=False)
+        assert result.data["age"] == [age for age in sample_table.data["age"] if age >= 10]
+        sample_table.drop(young)
+        assert sample_table.data == result.data
+
+    def test_drop_mask_length(self, sample_table):
+        """Test a mask of the wrong length raises ValueError."""
+        with pytest.raises(ValueError):
+            sample_table.drop([True])
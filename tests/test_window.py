@@ -0,0 +1,92 @@
+"""Test rolling, expanding and cumulative window functions."""
+
+import statistics
+
+import pytest
+
+from tinytable import Table
+from tinytable.window import rolling_max, rolling_min, rolling_std
+
+
+@pytest.fixture
+def series():
+    return Table({"key": ["a", "a", "b", "a", "b"], "x": [1, None, 3, 4, 5], "name": ["v", "w", "x", "y", "z"]})
+
+
+def naive(values, window, func):
+    out = []
+    for i in range(len(values)):
+        present = [v for v in values[max(0, i - window + 1) : i + 1] if v is not None]
+        out.append(func(present) if present else None)
+    return out
+
+
+class TestWindowFunctions:
+    def test_rolling_min_max_match_naive(self):
+        values = [5, 3, None, 8, 1, 1, 9, 2, None, 7, 4]
+        assert rolling_min(values, 3) == naive(values, 3, min)
+        assert rolling_max(values, 3) == naive(values, 3, max)
+
+    def test_rolling_std_matches_statistics(self):
+        values = [2.0, 4.0, 4.0, 5.0, 7.0, 9.0, 1.0]
+        expected = [None] + [statistics.stdev(values[max(0, i - 2) : i + 1]) for i in range(1, len(values))]
+        assert rolling_std(values, 3) == pytest.approx(expected)
+
+    def test_window_must_be_positive(self, series):
+        with pytest.raises(ValueError):
+            series["x"].rolling(0)
+
+
+class TestColumnWindows:
+    def test_rolling(self, series):
+        assert series["x"].rolling(2).sum().data == [None, None, None, 7, 9]
+        assert series["x"].rolling(2, min_periods=1).mean().data == [1, 1, 3, 3.5, 4.5]
+        assert series["x"].rolling(3, min_periods=0).count().data == [1, 1, 2, 2, 3]
+
+    def test_expanding(self, series):
+        assert series["x"].expanding().max().data == [1, 1, 3, 4, 5]
+        assert series["x"].expanding().mean().data == [1, 1, 2, 8 / 3, 13 / 4]
+
+    def test_cumulative(self, series):
+        assert series["x"].cumsum().data == [1, None, 4, 8, 13]
+        assert series["x"].cummin().data == [1, None, 1, 1, 1]
+        assert series["x"].cummax().data == [1, None, 3, 4, 5]
+
+    def test_shift_and_diff(self, series):
+        assert series["name"].shift().data == [None, "v", "w", "x", "y"]
+        assert series["name"].shift(-2, fill_value="").data == ["x", "y", "z", "", ""]
+        assert series["x"].diff().data == [None, None, None, 1, 1]
+
+
+class TestTableWindows:
+    def test_rolling_skips_non_numeric(self, series):
+        assert series.rolling(2, min_periods=1).max().data == {"x": [1, 1, 3, 4, 5]}
+
+    def test_shift_keeps_all_columns(self, series):
+        shifted = series.shift()
+        assert shifted.columns == ("key", "x", "name")
+        assert shifted.data["key"] == [None, "a", "a", "b", "a"]
+
+    def test_cumsum(self, series):
+        assert series.cumsum().data == {"x": [1, None, 4, 8, 13]}
+
+
+class TestGroupWindows:
+    def test_group_cumsum(self, series):
+        result = series.groupby("key").cumsum()
+        assert result.labels is None
+        assert result.data == {"x": [1, None, 3, 5, 8]}
+
+    def test_group_keeps_row_order_and_labels(self):
+        table = Table({"g": ["a", "b", "a", "b"], "x": [1, 2, 3, 4]}, labels=["r1", "r2", "r3", "r4"])
+        result = table.groupby("g").cumsum()
+        assert result.labels == ["r1", "r2", "r3", "r4"]
+        assert result.data == {"x": [1, 2, 4, 6]}
+
+    def test_group_rolling_and_shift(self, series):
+        grouped = series.groupby("key")
+        assert grouped.rolling(2, min_periods=1).min().data == {"x": [1, 1, 3, 4, 3]}
+        assert grouped.shift().data == {"x": [None, 1, None, None, 3], "name": [None, "v", None, "w", "x"]}
+
+    def test_group_cumcount(self, series):
+        assert series.groupby("key").cumcount().data == {"cumcount": [0, 1, 0, 2, 1]}
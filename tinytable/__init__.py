@@ -1,5 +1,25 @@
 __version__ = "0.18.1"
 
+from tinytable.categorical import Categorical
+from tinytable.combine import RowBuffer, concat
+from tinytable.options import get_option, option_context, reset_option, set_option
+from tinytable.sketch import HyperLogLog, QuantileSketch
+from tinytable.stream import TableStream
 from tinytable.table import Table, read_csv, read_excel, read_sqlite
 
-__all__ = ["Table", "read_csv", "read_excel", "read_sqlite"]
+__all__ = [
+    "Categorical",
+    "HyperLogLog",
+    "QuantileSketch",
+    "RowBuffer",
+    "Table",
+    "TableStream",
+    "concat",
+    "get_option",
+    "option_context",
+    "read_csv",
+    "read_excel",
+    "read_sqlite",
+    "reset_option",
+    "set_option",
+]
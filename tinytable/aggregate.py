@@ -0,0 +1,248 @@
+"""Mergeable partial aggregations.
+
+Each aggregation is split into a partial step over a chunk of column values,
+a merge step combining two partial states and a finalize step producing the
+result. Partial states from different chunks (or groups, or processes)
+can be merged in any order, so aggregates can be computed in bounded memory.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from tinytim.rows import row_dicts_to_data
+
+import tinytable.buffers as buffers
+from tinytable.group import group_indexes, key_runs
+from tinytable.sketch import DEFAULT_K, DEFAULT_PRECISION, HyperLogLog, QuantileSketch
+from tinytable.types import DataDict, DataMapping, RowDict
+
+
+class Aggregation:
+    """Partial, merge and finalize functions for one aggregation."""
+
+    def __init__(
+        self,
+        name: str,
+        partial: Callable[[Sequence], Any],
+        merge: Callable[[Any, Any], Any],
+        finalize: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self.name = name
+        self.partial = partial
+        self.merge = merge
+        self.finalize = finalize if finalize is not None else _identity
+
+    def __repr__(self) -> str:
+        return f"Aggregation({self.name!r})"
+
+
+def _identity(state: Any) -> Any:
+    return state
+
+
+def _add(a: Any, b: Any) -> Any:
+    return a + b
+
+
+def _min(a: Any, b: Any) -> Any:
+    return a if a <= b else b
+
+
+def _max(a: Any, b: Any) -> Any:
+    return a if a >= b else b
+
+
+def _reducer(name: str, func: Callable[[Sequence], Any]) -> Callable[[Sequence], Any]:
+    """func of values, or the NumPy name reduction as a Python scalar for arrays."""
+
+    def reduce(values: Sequence) -> Any:
+        if buffers.is_array(values):
+            result = buffers.reduce(values, name)
+            if result is not None:
+                return result
+        return func(values)
+
+    return reduce
+
+
+_sum = _reducer("sum", sum)
+
+
+def _sum_count(values: Sequence) -> Tuple[Any, int]:
+    return _sum(values), len(values)
+
+
+def _merge_sum_count(a: Tuple[Any, int], b: Tuple[Any, int]) -> Tuple[Any, int]:
+    return a[0] + b[0], a[1] + b[1]
+
+
+def _mean(state: Tuple[Any, int]) -> Any:
+    return state[0] / state[1]
+
+
+AGGREGATIONS: Dict[str, Aggregation] = {
+    "sum": Aggregation("sum", _sum, _add),
+    "count": Aggregation("count", len, _add),
+    "mean": Aggregation("mean", _sum_count, _merge_sum_count, _mean),
+    "min": Aggregation("min", _reducer("min", min), _min),
+    "max": Aggregation("max", _reducer("max", max), _max),
+}
+
+
+def approx_nunique_aggregation(precision: int = DEFAULT_PRECISION) -> Aggregation:
+    """Approximate distinct count merging HyperLogLog sketches."""
+    return Aggregation("approx_nunique", lambda values: HyperLogLog.from_values(values, precision), HyperLogLog.merge, HyperLogLog.count)
+
+
+def approx_quantile_aggregation(q: Union[float, Sequence[float]], k: int = DEFAULT_K) -> Aggregation:
+    """Approximate quantile (or list of quantiles for a sequence q) merging QuantileSketches."""
+
+    def finalize(sketch: QuantileSketch) -> Any:
+        if sketch.count == 0:
+            return None
+        return sketch.quantile(q) if isinstance(q, (int, float)) else sketch.quantiles(q)
+
+    return Aggregation("approx_quantile", lambda values: QuantileSketch.from_values(values, k), QuantileSketch.merge, finalize)
+
+
+AGGREGATIONS["approx_nunique"] = approx_nunique_aggregation()
+AGGREGATIONS["approx_median"] = approx_quantile_aggregation(0.5)
+
+
+def get_aggregation(name: Union[str, Aggregation]) -> Aggregation:
+    if isinstance(name, Aggregation):
+        return name
+    try:
+        return AGGREGATIONS[name]
+    except KeyError:
+        raise ValueError(f"unknown aggregation {name!r}, must be one of {list(AGGREGATIONS)}") from None
+
+
+def partial_data(agg: Aggregation, data: DataMapping) -> Dict[str, Any]:
+    """Return {column name: partial state}, skipping columns agg can't handle."""
+    out = {}
+    for column_name, values in data.items():
+        if len(values) == 0:
+            continue
+        try:
+            out[column_name] = agg.partial(values)
+        except TypeError:
+            continue
+    return out
+
+
+def merge_data(agg: Aggregation, a: Optional[Mapping[str, Any]], b: Mapping[str, Any]) -> Dict[str, Any]:
+    """Merge two {column name: partial state} mappings.
+
+    Columns missing from either side failed to aggregate in some chunk
+    and are dropped, mirroring how Table aggregations skip them.
+    """
+    if a is None:
+        return dict(b)
+    out = {}
+    for column_name, state in a.items():
+        if column_name in b:
+            try:
+                out[column_name] = agg.merge(state, b[column_name])
+            except TypeError:
+                continue
+    return out
+
+
+def finalize_data(agg: Aggregation, states: Optional[Mapping[str, Any]]) -> RowDict:
+    if states is None:
+        return {}
+    return {column_name: agg.finalize(state) for column_name, state in states.items()}
+
+
+class Accumulator:
+    """Running aggregate over a sequence of data chunks."""
+
+    def __init__(self, agg: Aggregation) -> None:
+        self.agg = agg
+        self.states: Optional[Dict[str, Any]] = None
+
+    def update(self, data: DataMapping) -> None:
+        if len(data) == 0 or len(next(iter(data.values()))) == 0:
+            return
+        self.states = merge_data(self.agg, self.states, partial_data(self.agg, data))
+
+    def merge(self, other: "Accumulator") -> None:
+        if other.states is not None:
+            self.states = merge_data(self.agg, self.states, other.states)
+
+    def result(self) -> RowDict:
+        return finalize_data(self.agg, self.states)
+
+
+class GroupAccumulator:
+    """Running aggregate per group key over a sequence of data chunks.
+
+    Keys are kept in order of first appearance.
+    """
+
+    def __init__(self, agg: Aggregation, by: Any) -> None:
+        self.agg = agg
+        self.by = by
+        self.states: Dict[Any, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def update(self, data: DataMapping) -> None:
+        for key, indexes in group_indexes(data, self.by).items():
+            chunk = {column_name: buffers.take(values, indexes) for column_name, values in data.items()}
+            self.update_key(key, partial_data(self.agg, chunk))
+
+    def update_key(self, key: Any, states: Mapping[str, Any]) -> None:
+        self.states[key] = merge_data(self.agg, self.states.get(key), states)
+
+    def merge(self, other: "GroupAccumulator") -> None:
+        for key, states in other.states.items():
+            self.update_key(key, states)
+
+    def result(self) -> Tuple[List[Any], DataDict]:
+        """Return (group keys, aggregated data), skipping empty rows."""
+        labels = []
+        rows = []
+        for key, states in self.states.items():
+            row = finalize_data(self.agg, states)
+            if len(row):
+                labels.append(key)
+                rows.append(row)
+        return labels, row_dicts_to_data(rows)
+
+
+class SortedGroupAccumulator:
+    """Running aggregate of groups of consecutive rows with equal keys.
+
+    For chunks sorted by the by columns: only the current group's state
+    is held, and it carries over to the next chunk until its key changes.
+    """
+
+    def __init__(self, agg: Aggregation, by: Any) -> None:
+        self.agg = agg
+        self.by = by
+        self.key: Any = None
+        self.states: Optional[Dict[str, Any]] = None
+
+    def update(self, data: DataMapping) -> List[Tuple[Any, RowDict]]:
+        """Add a chunk, returning the (key, row) of each group it finished."""
+        finished = []
+        for key, start, stop in key_runs(data, self.by):
+            states = partial_data(self.agg, {column_name: values[start:stop] for column_name, values in data.items()})
+            if self.states is not None and key == self.key:
+                self.states = merge_data(self.agg, self.states, states)
+            else:
+                finished.extend(self.flush())
+                self.key = key
+                self.states = states
+        return finished
+
+    def flush(self) -> List[Tuple[Any, RowDict]]:
+        """Finish the current group, returning its (key, row) if it has one."""
+        states = self.states
+        self.states = None
+        if states is None:
+            return []
+        row = finalize_data(self.agg, states)
+        return [(self.key, row)] if len(row) else []
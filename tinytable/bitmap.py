@@ -0,0 +1,150 @@
+"""Compact validity bitmaps marking the non-missing values of a column.
+
+Bit i of a Bitmap is set when value i is valid (not missing), packed
+eight values per byte of a bytearray, least significant bit first.
+Counting, combining and selecting rows work a byte (or a whole
+bitmap as one int) at a time instead of comparing every value.
+"""
+
+from itertools import chain, compress
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
+
+# Bools of the 8 bits of each byte value, least significant bit first.
+BYTE_BOOLS: Tuple[Tuple[bool, ...], ...] = tuple(tuple(bool(b >> i & 1) for i in range(8)) for b in range(256))
+BYTE_COUNTS: Tuple[int, ...] = tuple(sum(bools) for bools in BYTE_BOOLS)
+
+
+def _pack(bools: Sequence[bool]) -> bytearray:
+    data = bytearray((len(bools) + 7) // 8)
+    for i in compress(range(len(bools)), bools):
+        data[i >> 3] |= 1 << (i & 7)
+    return data
+
+
+class Bitmap:
+    """Validity bitmap of length values, set bits are valid values.
+    Bits past length are always unset.
+    """
+
+    __slots__ = ("data", "length")
+
+    def __init__(self, data: bytearray, length: int) -> None:
+        self.data = data
+        self.length = length
+
+    @classmethod
+    def from_bools(cls, bools: Iterable[bool]) -> "Bitmap":
+        bools = bools if isinstance(bools, list) else list(bools)
+        return cls(_pack(bools), len(bools))
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any], na_value: Any = None) -> "Bitmap":
+        """Bitmap of the values that are not na_value (compared by identity)."""
+        return cls.from_bools([value is not na_value for value in values])
+
+    @classmethod
+    def all_valid(cls, length: int) -> "Bitmap":
+        bitmap = cls(bytearray(b"\xff" * (length // 8)), length)
+        if length % 8:
+            bitmap.data.append((1 << (length % 8)) - 1)
+        return bitmap
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, i: int) -> bool:
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("bitmap index out of range")
+        return bool(self.data[i >> 3] >> (i & 7) & 1)
+
+    def __setitem__(self, i: int, valid: bool) -> None:
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("bitmap index out of range")
+        if valid:
+            self.data[i >> 3] |= 1 << (i & 7)
+        else:
+            self.data[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def __iter__(self) -> Iterator[bool]:
+        return iter(self.to_bools())
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Bitmap) and self.length == other.length and self.data == other.data
+
+    def __repr__(self) -> str:
+        return f"Bitmap({self.count()} valid of {self.length})"
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        return self._combine(other, int.__and__)
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        return self._combine(other, int.__or__)
+
+    def _combine(self, other: "Bitmap", op) -> "Bitmap":
+        if self.length != other.length:
+            raise ValueError("bitmaps must be the same length")
+        size = len(self.data)
+        bits = op(int.from_bytes(self.data, "little"), int.from_bytes(other.data, "little"))
+        return Bitmap(bytearray(bits.to_bytes(size, "little")), self.length)
+
+    def copy(self) -> "Bitmap":
+        return Bitmap(bytearray(self.data), self.length)
+
+    def count(self) -> int:
+        """Number of valid values."""
+        counts = BYTE_COUNTS
+        return sum(counts[b] for b in self.data)
+
+    def null_count(self) -> int:
+        return self.length - self.count()
+
+    def to_bools(self) -> List[bool]:
+        """Valid flag of each value."""
+        return list(chain.from_iterable(BYTE_BOOLS[b] for b in self.data))[: self.length]
+
+    def valid_indexes(self) -> List[int]:
+        """Indexes of valid values, skipping all null bytes."""
+        out: List[int] = []
+        for byte_index, b in enumerate(self.data):
+            if b == 0xFF:
+                out.extend(range(byte_index * 8, byte_index * 8 + 8))
+            elif b:
+                base = byte_index * 8
+                out.extend(base + i for i in range(8) if b >> i & 1)
+        return out
+
+    def compress(self, values: Sequence[Any]) -> List[Any]:
+        """Return the valid values of values."""
+        if self.count() == self.length:
+            return list(values)
+        return list(compress(values, self.to_bools()))
+
+    def take(self, indexes: Iterable[int]) -> "Bitmap":
+        data = self.data
+        return Bitmap.from_bools([bool(data[i >> 3] >> (i & 7) & 1) for i in indexes])
+
+    def slice(self, rows: slice) -> "Bitmap":
+        return self.take(range(self.length)[rows])
+
+    def extend(self, bools: Iterable[bool]) -> None:
+        """Append a bit per bool, growing the bytearray in place."""
+        data = self.data
+        i = self.length
+        for valid in bools:
+            if not i & 7:
+                data.append(0)
+            if valid:
+                data[i >> 3] |= 1 << (i & 7)
+            i += 1
+        self.length = i
+
+    def delete(self, index: int) -> None:
+        """Remove the bit at index, shifting later bits down."""
+        bools = self.to_bools()
+        del bools[index]
+        self.data = _pack(bools)
+        self.length -= 1
@@ -0,0 +1,193 @@
+"""Column buffer helpers for list, Categorical and NumPy array columns.
+
+Table columns are lists by default. With the opt-in "numpy" backend,
+numeric columns are held as NumPy arrays and these helpers dispatch
+gathers, copies and reductions to vectorized NumPy calls.
+Categorical columns gather and copy their integer codes.
+NumPy is only imported when the numpy backend is used.
+"""
+
+import sys
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from tinytable.categorical import Categorical
+
+BACKENDS = ("python", "numpy")
+
+# numpy reduction used for each Table aggregation.
+REDUCTIONS: Dict[str, Callable[[Any], Any]] = {
+    "sum": lambda a: a.sum(),
+    "mean": lambda a: a.mean(),
+    "min": lambda a: a.min(),
+    "max": lambda a: a.max(),
+    "std": lambda a: a.std(ddof=1),
+    "pstd": lambda a: a.std(ddof=0),
+}
+
+
+def numpy() -> Any:
+    """Import and return numpy, raising ImportError with install hint if missing."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("The numpy backend requires numpy: pip install tinytable[numpy]") from e
+    return numpy
+
+
+def is_array(values: Any) -> bool:
+    """Return True if values is a NumPy array, without importing numpy."""
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def validate_backend(backend: str) -> None:
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, not {backend!r}.")
+
+
+def is_sequence(value: Any) -> bool:
+    """Return True if value is a list like sequence of values (not a str or bytes)."""
+    return (isinstance(value, Sequence) and not isinstance(value, (str, bytes))) or is_array(value)
+
+
+def to_array(values: Sequence) -> Any:
+    """Return values as a NumPy array if the conversion is lossless, else values.
+
+    Only columns of all bool, all int (fitting int64) or all float values
+    are converted, so converting back with to_list returns equal values
+    of the same types.
+    """
+    if is_array(values) or len(values) == 0:
+        return values
+    np = numpy()
+    types = set(map(type, values))
+    if types == {float}:
+        return np.array(values, dtype=np.float64)
+    if types == {bool}:
+        return np.array(values, dtype=np.bool_)
+    if types == {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return values
+    return values
+
+
+def to_list(values: Sequence) -> list:
+    """Return values as a list of Python objects, lists returned as is."""
+    if isinstance(values, list):
+        return values
+    if is_array(values):
+        return values.tolist()  # type: ignore[attr-defined]
+    return list(values)
+
+
+def value_at(values: Sequence, index: int) -> Any:
+    """Return the value at index as a Python object."""
+    value = values[index]
+    if type(values) is list:
+        return value
+    return value.item() if hasattr(value, "item") else value
+
+
+def copy(values: Sequence) -> Any:
+    if is_array(values) or isinstance(values, Categorical):
+        return values.copy()  # type: ignore[attr-defined]
+    return list(values)
+
+
+def is_contiguous(indexes: Sequence[int]) -> bool:
+    """Return True if indexes is a range of consecutive non-negative indexes."""
+    return isinstance(indexes, range) and indexes.step == 1 and indexes.start >= 0
+
+
+def take(values: Sequence, indexes: Sequence[int]) -> Any:
+    """Return values at indexes, in one vectorized gather for arrays
+    and one slice for a contiguous range of indexes.
+    """
+    if is_contiguous(indexes):
+        if len(indexes) and indexes[-1] >= len(values):
+            raise IndexError("index out of range")
+        part = values[indexes.start : max(indexes.start, indexes.stop)]  # type: ignore[attr-defined]
+        return part.copy() if is_array(part) else part  # type: ignore[attr-defined]
+    if is_array(values):
+        return values[numpy().asarray(indexes, dtype=numpy().intp)]
+    if is_array(indexes):
+        indexes = indexes.tolist()  # type: ignore[attr-defined]
+    if isinstance(values, Categorical):
+        return values.take(indexes)
+    return [values[i] for i in indexes]
+
+
+def concat(parts: Sequence[Optional[Sequence]], lengths: Sequence[int]) -> Any:
+    """Return the parts joined end to end, a part of None standing for lengths[i] None values.
+
+    Arrays of the same kind are joined in one NumPy call, anything else
+    into one list allocated up front and filled a part at a time.
+    """
+    if parts and all(is_array(part) for part in parts):
+        kinds = {part.dtype.kind for part in parts}  # type: ignore[union-attr]
+        if len(kinds) == 1:
+            return numpy().concatenate(parts)
+    out: list = [None] * sum(lengths)
+    start = 0
+    for part, length in zip(parts, lengths):
+        if part is not None:
+            out[start : start + length] = to_list(part)
+        start += length
+    return out
+
+
+def delete(values: Sequence, index: int) -> Any:
+    """Return values without the value at index, deleting in place for lists."""
+    if is_array(values):
+        return numpy().delete(values, index)
+    del values[index]  # type: ignore[attr-defined]
+    return values
+
+
+def fits(values: Sequence, value: Any) -> bool:
+    """Return True if value can be stored in array values without changing its type."""
+    kind = values.dtype.kind  # type: ignore[attr-defined]
+    if kind == "b":
+        return type(value) is bool
+    if kind == "i":
+        return type(value) is int and -(2**63) <= value < 2**63
+    if kind == "f":
+        return type(value) is float
+    return False
+
+
+def set_value(values: Sequence, index: int, value: Any) -> Any:
+    """Set values[index] = value and return the buffer holding the result.
+
+    Arrays that cannot hold value losslessly are converted to a list first.
+    """
+    if is_array(values) and not fits(values, value):
+        values = values.tolist()  # type: ignore[attr-defined]
+    values[index] = value  # type: ignore[index]
+    return values
+
+
+def reduce(values: Sequence, name: str) -> Optional[Any]:
+    """Return Python scalar of the name reduction of array values,
+    None if there is no NumPy reduction for name.
+    """
+    reduction = REDUCTIONS.get(name)
+    if reduction is None or len(values) == 0:
+        return None
+    if name in ("mean", "std", "pstd") and values.dtype.kind == "b":  # type: ignore[attr-defined]
+        return None
+    if name == "std" and len(values) < 2:
+        return None
+    return reduction(values).item()
+
+
+def operand(other: Any) -> Any:
+    """Return other as an array operand for vectorized Column operations."""
+    if hasattr(other, "_array"):
+        array = other._array()
+        return numpy().asarray(list(other)) if array is None else array
+    if isinstance(other, (list, tuple)):
+        return numpy().asarray(other)
+    return other
@@ -0,0 +1,170 @@
+"""Dictionary encoded (categorical) columns.
+
+A Categorical stores each distinct value once in categories and each
+row as an integer code into categories (-1 for None) in a compact
+array. Grouping, membership, equality filters and value counts work
+on the integer codes instead of hashing and comparing every value.
+"""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Mapping, MutableSequence, Optional, Sequence, Union
+
+# Smallest signed array typecode holding each code range.
+TYPECODES = (("b", 2**7 - 1), ("h", 2**15 - 1), ("i", 2**31 - 1), ("q", 2**63 - 1))
+# Encode columns with at most this share of distinct values by default.
+MAX_CATEGORY_RATIO = 0.5
+
+
+def typecode_for(category_count: int) -> str:
+    for typecode, largest in TYPECODES:
+        if category_count - 1 <= largest:
+            return typecode
+    raise OverflowError("too many categories")
+
+
+class Categorical(MutableSequence):
+    """Column values stored as integer codes into a list of categories.
+
+    Behaves as a mutable sequence of the decoded values, so it can be
+    used as a Table column. Setting a new value adds a category.
+    """
+
+    __slots__ = ("codes", "categories", "_lookup")
+
+    def __init__(self, codes: "array[int]", categories: List[Hashable]) -> None:
+        self.codes = codes
+        self.categories = categories
+        self._lookup: Dict[Hashable, int] = {category: code for code, category in enumerate(categories)}
+
+    @classmethod
+    def from_values(cls, values: Iterable[Hashable]) -> "Categorical":
+        """Encode values, categories in order of first appearance."""
+        lookup: Dict[Hashable, int] = {None: -1}
+        codes = [lookup.setdefault(value, len(lookup) - 1) for value in values]
+        categories = list(lookup)[1:]
+        return cls(array(typecode_for(len(categories)), codes), categories)
+
+    def _code(self, value: Hashable) -> int:
+        if value is None:
+            return -1
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(value)
+            self._lookup[value] = code
+            typecode = typecode_for(len(self.categories))
+            if typecode != self.codes.typecode:
+                self.codes = array(typecode, self.codes)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __iter__(self) -> Iterator[Any]:
+        decode = (self.categories + [None]).__getitem__
+        return map(decode, self.codes)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return Categorical(self.codes[i], list(self.categories))
+        code = self.codes[i]
+        return None if code < 0 else self.categories[code]
+
+    def __setitem__(self, i: Any, value: Any) -> None:
+        if isinstance(i, slice):
+            raise TypeError("Categorical does not support slice assignment")
+        code = self._code(value)
+        self.codes[i] = code
+
+    def __delitem__(self, i: Any) -> None:
+        del self.codes[i]
+
+    def insert(self, i: int, value: Any) -> None:
+        code = self._code(value)
+        self.codes.insert(i, code)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Categorical):
+            return list(self) == list(other)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Categorical({list(self)!r}, categories={self.categories!r})"
+
+    def copy(self) -> "Categorical":
+        return Categorical(array(self.codes.typecode, self.codes), list(self.categories))
+
+    def to_list(self) -> list:
+        return list(self)
+
+    def take(self, indexes: Iterable[int]) -> "Categorical":
+        codes = self.codes
+        return Categorical(array(codes.typecode, [codes[i] for i in indexes]), list(self.categories))
+
+    def _code_flags(self, flags: List[bool], none_flag: bool) -> List[bool]:
+        """Expand one flag per category (plus None) to one flag per row."""
+        return list(map((flags + [none_flag]).__getitem__, self.codes))
+
+    def isin_mask(self, values: Iterable[Any]) -> List[bool]:
+        """Row flags of values being in values, testing each category once."""
+        values = list(values)
+        return self._code_flags([category in values for category in self.categories], None in values)
+
+    def equal_mask(self, value: Any) -> List[bool]:
+        return self._code_flags([category == value for category in self.categories], value is None)
+
+    def value_counts(self) -> Dict[Any, int]:
+        """{value: count} of the values present, in category order."""
+        counts = Counter(self.codes)
+        out = {category: counts[code] for code, category in enumerate(self.categories) if counts[code]}
+        if counts[-1]:
+            out[None] = counts[-1]
+        return out
+
+    def group_indexes(self) -> Dict[Any, List[int]]:
+        """{value: row indexes} in order of first appearance, bucketed by code."""
+        buckets: List[List[int]] = [[] for _ in range(len(self.categories) + 1)]
+        for i, code in enumerate(self.codes):
+            buckets[code].append(i)
+        decode = self.categories + [None]
+        order = sorted((indexes[0], code) for code, indexes in enumerate(buckets) if indexes)
+        return {decode[code]: buckets[code] for _, code in order}
+
+
+def is_categorical(values: Any) -> bool:
+    return isinstance(values, Categorical)
+
+
+def encode_data(
+    data: Mapping[str, Sequence[Any]], columns: Union[bool, Sequence[str]] = True, max_ratio: float = MAX_CATEGORY_RATIO
+) -> Dict[str, Any]:
+    """Return data with columns encoded as Categoricals.
+
+    Pass column names to encode those columns, or True to encode every
+    column of str (or None) values with at most max_ratio distinct values per row.
+    """
+    out: Dict[str, Any] = dict(data)
+    if columns is False:
+        return out
+    for name, values in data.items():
+        if columns is True:
+            encoded = _encode_if_repetitive(values, max_ratio)
+            if encoded is not None:
+                out[name] = encoded
+        elif name in columns:
+            out[name] = Categorical.from_values(values)
+    return out
+
+
+def _encode_if_repetitive(values: Sequence[Any], max_ratio: float) -> Optional[Categorical]:
+    if not values or not all(value is None or type(value) is str for value in values):
+        return None
+    encoded = Categorical.from_values(values)
+    if len(encoded.categories) > max_ratio * len(values):
+        return None
+    return encoded
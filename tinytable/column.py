@@ -1,149 +1,359 @@
 from __future__ import annotations
 
+from itertools import islice
 from typing import (
     Any,
     Callable,
     Generator,
     MutableMapping,
     MutableSequence,
+    Optional,
     Sequence,
     Union,
 )
 
 import tinytim.columns as columns
-from tabulate import tabulate
-from tinytim.group import groupby
 
-from tinytable.filter import Filter
-from tinytable.group import Group
+import tinytable.buffers as buffers
+import tinytable.counts as counts
+import tinytable.display as display
+import tinytable.dtypes as dtypes
+import tinytable.window as windows
+from tinytable.categorical import Categorical
+from tinytable.filter import ChainFilter, Filter
+from tinytable.group import Group, group_indexes
 from tinytable.types import DataDict, data_dict
 
 
 class Column:
-    def __init__(self, data: Sequence, name: Union[str, None], parent=None, labels=None):
-        self.data = list(data)
+    """Column of values.
+
+    Columns from a Table are views of the parent Table's column list:
+    values are not copied, reads and writes go to the parent.
+    Slicing, head and tail of a view return views over a range of rows.
+    Columns made from data share it until the first write, then copy it.
+    Columns of NumPy arrays (see Table.to_backend) use vectorized
+    arithmetic, comparisons and sum.
+    """
+
+    def __init__(self, data: Optional[Sequence], name: Union[str, None], parent=None, labels=None):
+        shared = isinstance(data, list) or buffers.is_array(data)
+        self._values: Optional[Sequence] = None if data is None else data if shared else list(data)
+        self._owned = not shared
+        self._rows: Optional[range] = None
         self.name = name
         self.parent = parent
         self.labels = labels
 
+    @classmethod
+    def view(cls, parent, name: str, labels=None, rows: Optional[range] = None) -> Column:
+        """Column reading the parent Table's name column, limited to rows if given."""
+        col = cls(None, name, parent, labels)
+        col._rows = rows
+        return col
+
+    @property
+    def is_view(self) -> bool:
+        return self._values is None
+
+    def _buffer(self) -> Sequence:
+        if self._values is None:
+            return self.parent._data[self.name]
+        return self._values
+
+    @property
+    def data(self) -> list:
+        """Column values, the parent's list itself for whole column views."""
+        if self._values is None:
+            values = self.parent._data[self.name]
+            if self._rows is None:
+                return values
+            if buffers.is_array(values):
+                return self._array().copy()
+            return [values[i] for i in self._rows]
+        return self._values  # type: ignore[return-value]
+
+    @data.setter
+    def data(self, values: Sequence) -> None:
+        self._values = list(values)
+        self._owned = True
+        self._rows = None
+
+    def _writable(self) -> list:
+        if not self._owned:
+            self._values = buffers.copy(self._values or [])
+            self._owned = True
+        return self._values  # type: ignore[return-value]
+
+    def _categorical(self) -> Optional[Categorical]:
+        """Return the Categorical values of whole column Categoricals, else None."""
+        values = self._buffer()
+        if self._rows is None and isinstance(values, Categorical):
+            return values
+        return None
+
+    def _array(self) -> Any:
+        """Return the values as a NumPy array (a view for slices), None for list columns."""
+        values = self._buffer()
+        if not buffers.is_array(values):
+            return None
+        rows = self._rows
+        if rows is None:
+            return values
+        stop = rows.stop if rows.stop >= 0 else None
+        return values[rows.start : stop : rows.step]
+
     def __len__(self) -> int:
-        return len(self.data)
+        if self._rows is not None:
+            return len(self._rows)
+        return len(self._buffer())
 
     def __repr__(self) -> str:
         header = "index" if self.name is None else self.name
-        index = True if self.labels is None else self.labels
-        return tabulate({header: self.data}, headers=[header], tablefmt="grid", showindex=index)
+        return display.format_grid([header], lambda _: self.data, len(self), self.labels)
 
     def __iter__(self):
-        return iter(self.data)
-
-    def __getitem__(self, index: int) -> Any:
-        return self.data[index]
+        values = self._buffer()
+        if buffers.is_array(values):
+            return iter(self._array().tolist())
+        rows = self._rows
+        if rows is None:
+            return iter(values)
+        if rows.step > 0:
+            return islice(values, rows.start, rows.stop, rows.step)
+        return (values[i] for i in rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self._slice(index)
+        if self._rows is not None:
+            index = self._rows[index]
+        return buffers.value_at(self._buffer(), index)
 
     def __setitem__(self, index: int, value: Any) -> None:
-        self.data[index] = value
+        if self._values is None:
+            position = index if self._rows is None else self._rows[index]
+            self.parent.edit_value(self.name, position, value)
+            return
+        self._values = buffers.set_value(self._writable(), index, value)
         if self.parent is not None:
             self.parent.edit_value(self.name, index, value)
 
+    def _slice(self, key: slice) -> Column:
+        labels = None if self.labels is None else self.labels[key]
+        if self._values is None:
+            rows = range(len(self)) if self._rows is None else self._rows
+            return Column.view(self.parent, self.name, labels, rows[key])  # type: ignore[arg-type]
+        return Column(self._values[key], self.name, None, labels)
+
+    def head(self, n: int = 5) -> Column:
+        """Return the first n values, as a view for Table Columns."""
+        return self._slice(slice(0, n))
+
+    def tail(self, n: int = 5) -> Column:
+        """Return the last n values, as a view for Table Columns."""
+        return self._slice(slice(max(len(self) - n, 0), None))
+
     def __eq__(self, value: Any) -> Filter:  # type: ignore[override]
+        array = self._array()
+        if array is not None:
+            return ChainFilter(array == buffers.operand(value))
+        categorical = self._categorical()
+        if categorical is not None:
+            return ChainFilter(categorical.equal_mask(value))
         return Filter(self, lambda x: x == value)
 
     def __ne__(self, value: Any) -> Filter:  # type: ignore[override]
+        array = self._array()
+        if array is not None:
+            return ChainFilter(array != buffers.operand(value))
+        categorical = self._categorical()
+        if categorical is not None:
+            return ChainFilter([not flag for flag in categorical.equal_mask(value)])
         return Filter(self, lambda x: x != value)
 
     def __gt__(self, value: Any) -> Filter:
+        array = self._array()
+        if array is not None:
+            return ChainFilter(array > buffers.operand(value))
         return Filter(self, lambda x: x > value)
 
     def __lt__(self, value: Any) -> Filter:
+        array = self._array()
+        if array is not None:
+            return ChainFilter(array < buffers.operand(value))
         return Filter(self, lambda x: x < value)
 
     def __ge__(self, value: Any) -> Filter:
+        array = self._array()
+        if array is not None:
+            return ChainFilter(array >= buffers.operand(value))
         return Filter(self, lambda x: x >= value)
 
     def __le__(self, value: Any) -> Filter:
+        array = self._array()
+        if array is not None:
+            return ChainFilter(array <= buffers.operand(value))
         return Filter(self, lambda x: x <= value)
 
     def __add__(self, other) -> Column:
+        array = self._array()
+        if array is not None:
+            return Column(array + buffers.operand(other), self.name, None, self.labels)
         data = columns.add_to_column(self.data, other)
-        return Column(data, self.name)
+        return Column(data, self.name, None, self.labels)
 
     def __sub__(self, other) -> Column:
+        array = self._array()
+        if array is not None:
+            return Column(array - buffers.operand(other), self.name, None, self.labels)
         data = columns.subtract_from_column(self.data, other)
-        return Column(data, self.name, self.parent, self.labels)
+        return Column(data, self.name, None, self.labels)
 
     def __mul__(self, other) -> Column:
+        array = self._array()
+        if array is not None:
+            return Column(array * buffers.operand(other), self.name, None, self.labels)
         data = columns.multiply_column(self.data, other)
-        return Column(data, self.name, self.parent, self.labels)
+        return Column(data, self.name, None, self.labels)
 
     def __truediv__(self, other) -> Column:
+        array = self._array()
+        if array is not None:
+            return Column(array / buffers.operand(other), self.name, None, self.labels)
         data = columns.divide_column(self.data, other)
-        return Column(data, self.name, self.parent, self.labels)
+        return Column(data, self.name, None, self.labels)
 
     def __mod__(self, other) -> Column:
+        array = self._array()
+        if array is not None:
+            return Column(array % buffers.operand(other), self.name, None, self.labels)
         data = columns.mod_column(self.data, other)
-        return Column(data, self.name, self.parent, self.labels)
+        return Column(data, self.name, None, self.labels)
 
     def __floordiv__(self, other) -> Column:
+        array = self._array()
+        if array is not None:
+            return Column(array // buffers.operand(other), self.name, None, self.labels)
         data = columns.floor_column(self.data, other)
-        return Column(data, self.name, self.parent, self.labels)
+        return Column(data, self.name, None, self.labels)
 
     def __pow__(self, other) -> Column:
+        array = self._array()
+        if array is not None:
+            return Column(array ** buffers.operand(other), self.name, None, self.labels)
         data = columns.exponent_column(self.data, other)
-        return Column(data, self.name, self.parent, self.labels)
+        return Column(data, self.name, None, self.labels)
 
     def isin(self, values: MutableSequence) -> Filter:
+        array = self._array()
+        if array is not None:
+            return ChainFilter(buffers.numpy().isin(array, list(values)))
+        categorical = self._categorical()
+        if categorical is not None:
+            return ChainFilter(categorical.isin_mask(values))
         return Filter(self, lambda x: x in values)
 
     def notin(self, values: MutableSequence) -> Filter:
+        array = self._array()
+        if array is not None:
+            return ChainFilter(~buffers.numpy().isin(array, list(values)))
+        categorical = self._categorical()
+        if categorical is not None:
+            return ChainFilter([not flag for flag in categorical.isin_mask(values)])
         return Filter(self, lambda x: x not in values)
 
     def drop(self):
-        """drop Column from parent"""
+        """drop Column from parent, keeping a copy of its values"""
         if self.parent is not None:
+            if self._values is None:
+                self.data = self.data
             self.parent.drop_column(self.name)
             self.parent = None
 
-    def cast_as(self, data_type: Callable) -> None:
-        self.data = [data_type(item) for item in self.data]
-        if self.parent is not None:
-            self.parent.cast_column_as(self.name, data_type)
-
-    def value_counts(self) -> dict:
-        return {value: self.data.count(value) for value in self.data}
+    def cast_as(self, data_type: dtypes.DType, errors: str = "raise") -> None:
+        """Convert the values to data_type (see Table.astype), converting
+        the parent's column once and sharing the result.
+        """
+        if self.parent is None:
+            self.data = dtypes.convert(self.data, data_type, errors)
+            return
+        self.parent.cast_column_as(self.name, data_type, errors)
+        if self._values is not None:
+            self.data = self.parent._data[self.name]
+
+    def value_counts(self, normalize: bool = False, dropna: bool = False, top: Optional[int] = None) -> dict:
+        """{value: count} most frequent first, counted in one pass.
+        Pass normalize for proportions, dropna to leave out None
+        and top to keep only the top most frequent values.
+        """
+        return counts.rank_counts(counts.count_values(self.data), normalize, dropna, top)
 
     def sum(self) -> Union[float, int]:
-        return sum(self.data)
+        array = self._array()
+        if array is not None and len(array):
+            return array.sum().item()
+        return sum(self)
+
+    def _map_values(self, func: windows.WindowFunc) -> Column:
+        return Column(func(self.data), self.name, None, self.labels)
+
+    def rolling(self, window: int, min_periods: Optional[int] = None) -> windows.Window:
+        """Moving window of window values, e.g. col.rolling(7).mean().
+        Windows with fewer than min_periods (default window) non-None values give None.
+        """
+        return windows.Window(self._map_values, window, min_periods)
+
+    def expanding(self, min_periods: int = 1) -> windows.Window:
+        """Window of all values up to each value, e.g. col.expanding().max()."""
+        return windows.Window(self._map_values, None, min_periods)
+
+    def cumsum(self) -> Column:
+        return self._map_values(windows.cumsum)
+
+    def cummin(self) -> Column:
+        return self._map_values(windows.cummin)
+
+    def cummax(self) -> Column:
+        return self._map_values(windows.cummax)
+
+    def shift(self, periods: int = 1, fill_value: Any = None) -> Column:
+        return self._map_values(lambda values: windows.shift(values, periods, fill_value))
+
+    def diff(self, periods: int = 1) -> Column:
+        return self._map_values(lambda values: windows.diff(values, periods))
 
     def groupby(self) -> Group:
         name = str(self.name)
-        groups = groupby({name: self.data}, by=str(name))
-        return Group(groups, by=name)
+        values = self.data
+        indexes = group_indexes({name: values}, name)
+        groups = [(key, {name: buffers.to_list(buffers.take(values, rows))}) for key, rows in indexes.items()]
+        return Group(groups, by=name, indexes=list(indexes.values()), labels=self.labels)
 
     def __reversed__(self) -> Column:
-        data = list(reversed(self.data))
-        return Column(data, self.name, self.parent, self.labels)
+        return Column(self.data[::-1], self.name, None, self.labels)
 
     def __delitem__(self, i) -> None:
         raise NotImplementedError("deleting items from columns is not implemented")
 
     def __contains__(self, value) -> bool:
-        return value in self.data
+        return value in iter(self)
 
     def index(self, value) -> int:
-        return list(self.data).index(value)
+        return buffers.to_list(self.data).index(value)
 
     def count(self, value) -> int:
-        return list(self.data).count(value)
+        return buffers.to_list(self.data).count(value)
 
 
 def itercolumns(data: MutableMapping, parent, labels=None) -> Generator[Column, None, None]:
     for col in data.keys():
-        yield Column(data[col], col, parent, labels)
+        yield Column.view(parent, col, labels)
 
 
 def iteritems(data: MutableMapping, parent) -> Generator[tuple[str, Column], None, None]:
     for col in data.keys():
-        yield col, Column(data[col], col, parent)
+        yield col, Column.view(parent, col)
 
 
 def cast_column_as(data: MutableMapping, column_name: str, data_type: Callable) -> DataDict:
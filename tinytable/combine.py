@@ -0,0 +1,117 @@
+"""Combine Tables and build Tables a row at a time.
+
+concat sizes every output column once from the total row count and
+fills it a Table at a time, so joining many chunks copies each value
+once instead of regrowing the result per chunk. RowBuffer appends rows
+to per column lists, which grow in amortized constant time per row.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Union
+
+import tinytable as tt
+import tinytable.buffers as buffers
+from tinytable.bitmap import Bitmap
+from tinytable.types import DataDict
+
+RowValues = Union[Mapping[str, Any], Sequence[Any]]
+
+
+def column_names(tables: Sequence["tt.Table"], join: str = "outer") -> List[str]:
+    """Column names of tables in order of first appearance: all of them for an
+    "outer" join, only those in every Table for an "inner" join.
+    """
+    if join not in ("outer", "inner"):
+        raise ValueError('join must be "outer" or "inner"')
+    names = list(dict.fromkeys(name for table in tables for name in table._data))
+    if join == "inner":
+        names = [name for name in names if all(name in table._data for table in tables)]
+    return names
+
+
+def concat(tables: Iterable["tt.Table"], join: str = "outer") -> "tt.Table":
+    """Return new Table of the rows of tables, one after another.
+
+    join="outer" keeps every column, with None for the rows of Tables
+    missing it, and join="inner" keeps only the columns in every Table.
+    Labels are kept if every Table has labels. Nulls are tracked if
+    every Table tracks them.
+    """
+    tables = list(tables)
+    names = column_names(tables, join)
+    lengths = [len(table) for table in tables]
+    data = {name: buffers.concat([table._data.get(name) for table in tables], lengths) for name in names}
+    labels: Optional[list] = None
+    if tables and all(table.labels is not None for table in tables):
+        labels = buffers.concat([table.labels for table in tables], lengths)
+    validity: Optional[Dict[str, Bitmap]] = None
+    if tables and all(table.validity is not None for table in tables):
+        validity = {name: Bitmap.from_values(buffers.to_list(values)) for name, values in data.items()}
+    return tt.Table._from_data(data, labels, sum(lengths) if data else 0, (), validity)
+
+
+class RowBuffer:
+    """Rows collected into growing column lists, for building a Table incrementally.
+
+    Rows are Mappings of {column_name: value} or Sequences of values in
+    column order. A Mapping with a new column adds it, filled with None
+    for earlier rows; columns missing from a Mapping get None.
+    """
+
+    def __init__(self, columns: Optional[Sequence[str]] = None) -> None:
+        self.data: DataDict = {name: [] for name in columns or ()}
+        self.row_count = 0
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def __repr__(self) -> str:
+        return f"RowBuffer({self.row_count} rows, columns={list(self.data)})"
+
+    def append(self, row: RowValues) -> None:
+        data = self.data
+        if isinstance(row, Mapping):
+            for name in row:
+                if name not in data:
+                    data[name] = [None] * self.row_count
+            for name, values in data.items():
+                values.append(row.get(name))
+        else:
+            if len(row) != len(data):
+                raise ValueError("row values length must match columns length.")
+            for values, value in zip(data.values(), row):
+                values.append(value)
+        self.row_count += 1
+
+    def extend(self, rows: Iterable[RowValues]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def extend_table(self, table: "tt.Table") -> None:
+        """Append all rows of table, a column at a time."""
+        data = self.data
+        count = len(table)
+        for name in table.data:
+            if name not in data:
+                data[name] = [None] * self.row_count
+        for name, values in data.items():
+            values.extend(buffers.to_list(table.data[name]) if name in table.data else [None] * count)
+        self.row_count += count
+
+    def to_table(self, labels: Optional[Sequence] = None) -> "tt.Table":
+        """Return Table of the rows so far, handing over the column lists
+        and leaving the buffer empty with the same columns.
+        """
+        if labels is not None and len(labels) != self.row_count:
+            raise ValueError("labels length must match rows length.")
+        data = self.data
+        table = tt.Table._from_data(data, None if labels is None else list(labels), self.row_count if data else 0)
+        self.data = {name: [] for name in data}
+        self.row_count = 0
+        return table
+
+
+def rows_to_data(rows: Iterable[RowValues], columns: Sequence[str]) -> DataDict:
+    """Column lists of rows (Mappings or Sequences of values in columns order)."""
+    buffer = RowBuffer(columns)
+    buffer.extend(rows)
+    return buffer.data
@@ -0,0 +1,61 @@
+"""Hash counting of column values and row combinations for value_counts.
+
+Values are counted in one pass with a Counter (or over the integer codes
+of a Categorical), then ranked most frequent first. Ties keep the order
+the values first appeared in.
+"""
+
+import heapq
+from collections import Counter
+from operator import itemgetter
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import tinytable.buffers as buffers
+from tinytable.categorical import Categorical
+
+
+def count_values(values: Sequence) -> Dict[Any, int]:
+    """{value: count} of values, in order of first appearance."""
+    if isinstance(values, Categorical):
+        return values.value_counts()
+    return Counter(buffers.to_list(values))
+
+
+def count_rows(columns: Sequence[Sequence]) -> Dict[Tuple, int]:
+    """{row values tuple: count} of the rows made by zipping columns."""
+    return Counter(zip(*(buffers.to_list(values) for values in columns)))
+
+
+def rank_counts(
+    counts: Mapping[Any, int],
+    normalize: bool = False,
+    dropna: bool = False,
+    top: Optional[int] = None,
+    is_na=None,
+) -> Dict[Any, Union[int, float]]:
+    """Return counts ordered most frequent first.
+
+    dropna leaves out keys where is_na(key) (key is None by default),
+    top keeps only the top most frequent keys and
+    normalize divides each count by the total of the remaining counts.
+    """
+    items = list(counts.items())
+    if dropna:
+        missing = is_na if is_na is not None else _is_none
+        items = [item for item in items if not missing(item[0])]
+    total = sum(count for _, count in items)
+    if top is None:
+        items.sort(key=itemgetter(1), reverse=True)
+    else:
+        items = heapq.nlargest(top, items, key=itemgetter(1))
+    if normalize:
+        return {key: count / total for key, count in items}
+    return dict(items)
+
+
+def _is_none(value: Any) -> bool:
+    return value is None
+
+
+def row_has_none(row: Tuple) -> bool:
+    return any(value is None for value in row)
@@ -1,12 +1,12 @@
 import csv
 from os.path import exists
-from typing import Dict, Generator, List, Optional, Sequence, Union
-from urllib import request
+from typing import Dict, Generator, Iterable, List, Optional, Sequence, Union
 
 from tinytim.data import column_names
 from tinytim.rows import itertuples, row_dicts_to_data
 from tinytim.utils import combine_names_rows
 
+from tinytable.intern import InternOption, interned_rows, interner
 from tinytable.types import DataDict, DataMapping, data_dict
 
 
@@ -30,30 +30,44 @@ def convert_str(value: str) -> Union[float, int, bool, str]:
     return value
 
 
-def chunk_csv_file(path: str, chunksize=5, newline="", encoding="utf-8-sig") -> Generator[dict, None, None]:
+def chunk_csv_file(
+    path: str,
+    chunksize=5,
+    newline="",
+    encoding="utf-8-sig",
+    names: Optional[Sequence[str]] = None,
+    intern_strings: InternOption = False,
+) -> Generator[dict, None, None]:
     """
     Read chunks of table object from given CSV file.
+    If names is passed, the first line is read as data instead of column names.
+    Pass intern_strings to share repeated str values across all chunks.
     """
-    column_names = []
+    column_names: List[str] = [] if names is None else list(names)
+    strings = interner(intern_strings)
     rows = []
-    first = True
-    chunk_end = chunksize
     with open(path, "r", newline=newline, encoding=encoding) as f:
         dialect = csv.Sniffer().sniff(f.read(1024))
         f.seek(0)
-        for i, row in enumerate(csv.reader(f, dialect)):
-            if first:
-                column_names = row
-                first = False
-            else:
-                rows.append([convert_str(v) for v in row])
-            if i == chunk_end:
+        reader = csv.reader(f, dialect)
+        if names is None:
+            column_names = next(reader, [])
+        converted = ([convert_str(v) for v in row] for row in reader)
+        for row in interned_rows(converted, strings, column_names):
+            rows.append(row)
+            if len(rows) == chunksize:
                 yield combine_names_rows(column_names, rows)
                 rows = []
-                chunk_end += chunksize
-        else:
-            if len(rows) > 0:
-                yield combine_names_rows(column_names, rows)
+        if len(rows) > 0:
+            yield combine_names_rows(column_names, rows)
+
+
+def _read_rows(reader: Iterable[dict], convert_numbers: bool, intern_strings: InternOption) -> DataDict:
+    """Column data of csv row dicts, converting and interning each row as it is read."""
+    rows: Iterable[dict] = reader
+    if convert_numbers:
+        rows = ({name: convert_str(value) for name, value in row.items()} for row in rows)
+    return row_dicts_to_data(list(interned_rows(rows, interner(intern_strings))))
 
 
 def convert_values(d: DataMapping) -> DataDict:
@@ -122,12 +136,11 @@ def read_csv_file(
     encoding: str = "utf-8-sig",
     convert_numbers: bool = True,
     convert_columns: bool = False,
+    intern_strings: InternOption = False,
 ) -> Dict[str, List]:
     with open(path, "r", newline=newline, encoding=encoding) as f:
         reader = csv.DictReader(f, fieldnames=names) if names else csv.DictReader(f)
-        d = row_dicts_to_data([row for row in reader])
-    if convert_numbers:
-        convert_values_inplace(d)
+        d = _read_rows(reader, convert_numbers, intern_strings)
     if convert_columns:
         convert_columns_inplace(d)
     return d
@@ -143,15 +156,34 @@ def data_to_csv_file(data: DataDict, path: str, newline="", encoding="utf-8-sig"
         writer.writerows(rows)
 
 
+def data_chunks_to_csv_file(chunks: Iterable[DataMapping], path: str, newline="", encoding="utf-8-sig") -> None:
+    """Write a sequence of data chunks to one csv file at path.
+    Column names are written once, from the first chunk.
+    """
+    with open(path, "w", encoding=encoding, newline=newline) as f:
+        writer = csv.writer(f)
+        first = True
+        for data in chunks:
+            if first:
+                writer.writerow(column_names(data))
+                first = False
+            writer.writerows(itertuples(data))
+
+
 def read_csv_url(
-    url: str, names: Optional[Sequence[str]] = None, encoding="utf-8-sig", convert_numbers: bool = True, convert_columns: bool = False
+    url: str,
+    names: Optional[Sequence[str]] = None,
+    encoding="utf-8-sig",
+    convert_numbers: bool = True,
+    convert_columns: bool = False,
+    intern_strings: InternOption = False,
 ) -> Dict[str, List]:
+    from urllib import request
+
     response = request.urlopen(url)
     lines = [line.decode(encoding) for line in response.readlines()]
     reader = csv.DictReader(lines, fieldnames=names) if names else csv.DictReader(lines)
-    d = row_dicts_to_data([row for row in reader])
-    if convert_numbers:
-        convert_values_inplace(d)
+    d = _read_rows(reader, convert_numbers, intern_strings)
     if convert_columns:
         convert_columns_inplace(d)
     return d
@@ -164,8 +196,9 @@ def read_csv(
     encoding: str = "utf-8-sig",
     convert_numbers: bool = True,
     convert_columns: bool = False,
+    intern_strings: InternOption = False,
 ) -> Dict[str, List]:
     # check if path is valid file path
     if exists(path):
-        return read_csv_file(path, names, newline, encoding, convert_numbers, convert_columns)
-    return read_csv_url(path, names, encoding, convert_numbers, convert_columns)
+        return read_csv_file(path, names, newline, encoding, convert_numbers, convert_columns, intern_strings)
+    return read_csv_url(path, names, encoding, convert_numbers, convert_columns, intern_strings)
@@ -0,0 +1,86 @@
+"""Finding duplicate rows by hashing row keys.
+
+A row's key is its value (one column) or tuple of values (several columns)
+in the subset columns. Tables mark duplicates in one pass over the keys.
+Streams remember the keys seen in earlier chunks in a SeenKeys set that
+can be bounded, forgetting or spilling keys past its bound.
+"""
+
+import sqlite3
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from tinytable.group import group_keys
+from tinytable.types import DataMapping
+
+Keep = Union[str, bool]
+
+
+def row_keys(data: DataMapping, subset: Optional[Union[str, Sequence[str]]] = None) -> Sequence:
+    """Key of each row of data from the subset columns (all columns by default)."""
+    return group_keys(data, list(data) if subset is None else subset)
+
+
+def duplicated_mask(keys: Sequence, keep: Keep = "first") -> List[bool]:
+    """Flag of each key being a duplicate.
+
+    keep="first" flags all but the first of equal keys, "last" all but the last
+    and False flags every key that appears more than once.
+    """
+    if keep == "first":
+        seen: set = set()
+        mask = []
+        for key in keys:
+            mask.append(key in seen)
+            seen.add(key)
+        return mask
+    if keep == "last":
+        return duplicated_mask(list(reversed(keys)), "first")[::-1]
+    if keep is False:
+        counts = Counter(keys)
+        return [counts[key] > 1 for key in keys]
+    raise ValueError('keep must be "first", "last" or False')
+
+
+class SeenKeys:
+    """Set of row keys seen so far, holding at most max_keys in memory.
+
+    Past max_keys the oldest keys are forgotten, so only repeats within
+    the last max_keys distinct keys are found. With spill=True they are
+    moved to a temporary sqlite database instead, so every key is
+    remembered (keys on disk are compared by repr).
+    """
+
+    def __init__(self, max_keys: Optional[int] = None, spill: bool = False) -> None:
+        self.max_keys = max_keys
+        self.spill = spill
+        self.keys: Dict[Any, None] = {}
+        self.db: Optional[sqlite3.Connection] = None
+
+    def add(self, key: Any) -> bool:
+        """Add key, returning True if it was not seen before."""
+        keys = self.keys
+        if key in keys:
+            return False
+        if self.db is not None and self.db.execute("SELECT 1 FROM seen WHERE key = ?", (repr(key),)).fetchone():
+            return False
+        keys[key] = None
+        if self.max_keys is not None and len(keys) > self.max_keys:
+            if self.spill:
+                self._spill()
+            else:
+                del keys[next(iter(keys))]
+        return True
+
+    def _spill(self) -> None:
+        if self.db is None:
+            # An empty filename is a private on-disk database deleted when closed.
+            self.db = sqlite3.connect("")
+            self.db.execute("CREATE TABLE seen (key TEXT PRIMARY KEY)")
+        self.db.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((repr(key),) for key in self.keys))
+        self.keys.clear()
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
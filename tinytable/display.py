@@ -0,0 +1,84 @@
+"""Bounded cost text display of Tables, Columns, Rows and Groups.
+
+Only the cells that are shown are read and formatted: past
+display.max_rows rows or display.max_columns columns the middle
+is replaced by a ... marker, so repr of a huge Table stays cheap.
+tabulate is imported on first use.
+"""
+
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from tinytable.options import get_option
+
+GAP = "..."
+
+
+def shown_positions(count: int, limit: Optional[int]) -> Tuple[List[int], Optional[int]]:
+    """Return (positions to show, index of the gap marker or None if all are shown).
+    Past limit, the first and last positions are shown.
+    """
+    if limit is None or count <= limit:
+        return list(range(count)), None
+    limit = max(limit, 1)
+    head = (limit + 1) // 2
+    tail = limit // 2
+    return list(range(head)) + list(range(count - tail, count)), head
+
+
+def format_cell(value: Any, max_colwidth: Optional[int]) -> Any:
+    """Shorten long str values, leaving numbers for tabulate to align."""
+    if max_colwidth is None or value is None or isinstance(value, (int, float)):
+        return value
+    text = value if isinstance(value, str) else str(value)
+    if max_colwidth is not None and len(text) > max_colwidth:
+        return text[: max(max_colwidth - len(GAP), 0)] + GAP
+    return text
+
+
+def format_grid(
+    names: Sequence[str],
+    column: Callable[[str], Sequence],
+    row_count: int,
+    labels: Optional[Sequence] = None,
+) -> str:
+    """Format shown cells of a table as a grid.
+
+    column(name) returns the indexable values of a named column,
+    labels are shown as the index if given, row positions otherwise.
+    """
+    from tabulate import tabulate
+
+    max_colwidth = get_option("display.max_colwidth")
+    column_positions, column_gap = shown_positions(len(names), get_option("display.max_columns"))
+    row_positions, row_gap = shown_positions(row_count, get_option("display.max_rows"))
+    headers = [names[i] for i in column_positions]
+    columns = [column(name) for name in headers]
+    rows = []
+    index = []
+    for i in row_positions:
+        cells = [format_cell(values[i], max_colwidth) for values in columns]
+        if column_gap is not None:
+            cells.insert(column_gap, GAP)
+        rows.append(cells)
+        index.append(i if labels is None else format_cell(labels[i], max_colwidth))
+    if column_gap is not None:
+        headers.insert(column_gap, GAP)
+    if row_gap is not None:
+        rows.insert(row_gap, [GAP] * len(headers))
+        index.insert(row_gap, GAP)
+    text = tabulate(rows, headers=headers, tablefmt="grid", showindex=index)
+    if row_gap is not None or column_gap is not None:
+        text += f"\n[{row_count} rows x {len(names)} columns]"
+    return text
+
+
+def format_groups(groups: Sequence[tuple], by: Sequence) -> str:
+    """Format up to display.max_groups (key, Table) groups."""
+    positions, gap = shown_positions(len(groups), get_option("display.max_groups"))
+    parts = [f"Group by {list(by)} ({len(groups)} groups)"]
+    for n, i in enumerate(positions):
+        if n == gap:
+            parts.append(GAP)
+        key, table = groups[i]
+        parts.append(f"{key!r}:\n{table!r}")
+    return "\n".join(parts)
@@ -0,0 +1,123 @@
+"""Column value type conversion for Table.astype.
+
+Conversions to int, float, bool and str try one C level map over the
+values first and only fall back to converting value by value (to apply
+the errors policy) if that fails. NumPy array columns are cast with one
+vectorized astype. None values stay None for these types.
+bool keeps Python's bool() meaning (any non-empty str is True),
+"boolean" parses strings like "yes" or "0" instead.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Union
+
+import tinytable.buffers as buffers
+from tinytable.categorical import Categorical
+
+DType = Union[str, type, Callable[[Any], Any]]
+
+ERRORS = ("raise", "coerce", "ignore")
+
+# Typed storage dtypes, held as NumPy arrays when every value converts.
+TYPED: Dict[str, type] = {"int64": int, "float64": float, "bool": bool}
+
+TRUE_STRINGS = frozenset({"true", "t", "yes", "y", "1"})
+FALSE_STRINGS = frozenset({"false", "f", "no", "n", "0"})
+
+# Exceptions raised by a failed conversion of one value.
+CONVERSION_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+def to_bool(value: Any) -> bool:
+    """bool of value, parsing strings like "true", "no" or "1" instead of testing if they are empty."""
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in TRUE_STRINGS:
+            return True
+        if text in FALSE_STRINGS:
+            return False
+        raise ValueError(f"cannot convert {value!r} to bool")
+    return bool(value)
+
+
+# Function converting one value to each builtin type.
+CONVERTERS: Dict[type, Callable[[Any], Any]] = {int: int, float: float, bool: bool, str: str}
+
+# Named dtypes parsing str values, kept as lists with None values kept.
+PARSERS: Dict[str, Callable[[Any], Any]] = {"boolean": to_bool}
+
+
+def validate_errors(errors: str) -> None:
+    if errors not in ERRORS:
+        raise ValueError(f"errors must be one of {ERRORS}, not {errors!r}.")
+
+
+def convert(values: Sequence, dtype: DType, errors: str = "raise") -> Sequence:
+    """Return values converted to dtype.
+
+    "category" dictionary encodes values as a Categorical,
+    "object" returns a plain list of the values,
+    "int64", "float64" and "bool" convert to a NumPy array (a list if any value is None),
+    "boolean" parses strings like "yes", "False" or "0" to bools,
+    a type or function is applied to each value.
+    errors="raise" raises the first conversion error, "coerce" converts
+    failed values to None and "ignore" returns values unchanged.
+    """
+    validate_errors(errors)
+    if dtype == "category":
+        return values if isinstance(values, Categorical) else Categorical.from_values(values)
+    if dtype == "object":
+        return buffers.to_list(values) if buffers.is_array(values) else list(values)
+    if isinstance(dtype, str) and dtype in PARSERS:
+        return convert_values(buffers.to_list(values), PARSERS[dtype], errors, keep_none=True)
+    if isinstance(dtype, str) and dtype in TYPED:
+        if buffers.is_array(values):
+            return convert_array(values, dtype, TYPED[dtype], errors)
+        converted = convert(values, TYPED[dtype], errors)
+        return converted if converted is values else buffers.to_array(converted)
+    if dtype in CONVERTERS and buffers.is_array(values):
+        if dtype is str:
+            return [str(value) for value in values.tolist()]  # type: ignore[attr-defined]
+        converted = convert_array(values, dtype, dtype, errors)
+        return converted.tolist() if buffers.is_array(converted) else converted
+    if isinstance(dtype, type) and dtype in CONVERTERS:
+        return convert_values(buffers.to_list(values), CONVERTERS[dtype], errors, keep_none=True)
+    if callable(dtype):
+        return convert_values(buffers.to_list(values), dtype, errors, keep_none=False)
+    raise ValueError(f"unknown dtype {dtype!r}")
+
+
+def convert_array(values: Any, dtype: DType, to_type: type, errors: str) -> Any:
+    """values.astype(dtype), applying errors to nan and inf floats cast to int,
+    which astype would silently turn into arbitrary ints.
+    Returns values itself if errors="ignore", a list with None for failed values if "coerce".
+    """
+    if to_type is int and values.dtype.kind == "f" and not buffers.numpy().isfinite(values).all():
+        converted = convert_values(values.tolist(), int, errors, keep_none=True)
+        return values if errors == "ignore" else converted
+    return values.astype(dtype)
+
+
+def convert_values(values: List[Any], func: Callable[[Any], Any], errors: str, keep_none: bool) -> List[Any]:
+    """func of each value, None values kept as None if keep_none.
+    Returns values itself if a conversion fails and errors="ignore".
+    """
+    has_none = keep_none and None in values
+    try:
+        if has_none:
+            return [None if value is None else func(value) for value in values]
+        return list(map(func, values))
+    except CONVERSION_ERRORS:
+        if errors == "raise":
+            raise
+    if errors == "ignore":
+        return values
+    out: List[Any] = []
+    for value in values:
+        if value is None and keep_none:
+            out.append(None)
+            continue
+        try:
+            out.append(func(value))
+        except CONVERSION_ERRORS:
+            out.append(None)
+    return out
@@ -1,17 +1,23 @@
+"""Excel reading and writing. openpyxl is imported on first use."""
+
+from __future__ import annotations
+
 from os.path import exists
-from typing import Collection, List, Optional, Union
+from typing import TYPE_CHECKING, Collection, List, Optional, Sequence, Union
 
-from openpyxl import Workbook, load_workbook
-from openpyxl.chartsheet.chartsheet import Chartsheet
-from openpyxl.worksheet._read_only import ReadOnlyWorksheet
-from openpyxl.worksheet.worksheet import Worksheet
 from tinytim.rows import itertuples
 from tinytim.utils import combine_names_rows
 
+from tinytable.intern import InternOption, interned_rows, interner
 from tinytable.types import DataDict, DataMapping
 
-Sheet = Union[Worksheet, ReadOnlyWorksheet, Chartsheet]
-WorkSheet = Union[Worksheet, ReadOnlyWorksheet]
+if TYPE_CHECKING:
+    from openpyxl.chartsheet.chartsheet import Chartsheet
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    from openpyxl.worksheet.worksheet import Worksheet
+
+Sheet = Union["Worksheet", "ReadOnlyWorksheet", "Chartsheet"]
+WorkSheet = Union["Worksheet", "ReadOnlyWorksheet"]
 
 
 class WorkBook:
@@ -19,6 +25,8 @@ class WorkBook:
         self.path = path
 
     def __enter__(self):
+        from openpyxl import load_workbook
+
         self.wb = load_workbook(self.path)
         return self
 
@@ -33,23 +41,23 @@ class WorkBook:
         return self.wb[key]
 
 
-def read_excel_file(path: str, sheet_name: Optional[str] = None) -> DataDict:
+def read_excel_file(path: str, sheet_name: Optional[str] = None, intern_strings: InternOption = False) -> DataDict:
     """
     Reads a table object from given excel file path.
     """
+    from openpyxl.chartsheet.chartsheet import Chartsheet
+
     column_names: List[str] = []
-    rows = []
-    first = True
+    rows: List[Sequence] = []
     with WorkBook(path) as wb:
         ws = wb.active if sheet_name is None else wb[sheet_name]
         if isinstance(ws, Chartsheet):
             raise TypeError("Chartsheet has no values to read into table.")
-        for row in ws.values:
-            if first:
-                column_names = [str(name) for name in row]
-                first = False
-            else:
-                rows.append(row)
+        values = iter(ws.values)
+        header = next(values, None)
+        if header is not None:
+            column_names = [str(name) for name in header]
+            rows.extend(interned_rows(values, interner(intern_strings), column_names))
 
     return combine_names_rows(column_names, rows)
 
@@ -74,6 +82,8 @@ def data_to_excel_file(
     Overides worksheet sheet_name if it already exists.
     If sheet_name is None, will pick next available Sheet{i} name.
     """
+    from openpyxl import Workbook, load_workbook
+
     if exists(path) and not replace_workbook:
         wb = load_workbook(path)
         if sheet_name is None:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any, Callable, Iterator
 
+from tinytable.buffers import is_array
+
 
 class FilterIterator:
     """Passed when iterating through Filter
@@ -87,9 +89,23 @@ class Filter:
 
 
 class ChainFilter(Filter):
+    """Filter of precomputed bool values.
+    values may be a NumPy bool array from a numpy backend Column.
+    """
+
     def __init__(self, values: list[bool]):
         self.values = values
 
+    def __and__(self, other) -> ChainFilter:
+        if is_array(self.values) and is_array(getattr(other, "values", None)):
+            return ChainFilter(self.values & other.values)
+        return super().__and__(other)
+
+    def __or__(self, other) -> ChainFilter:
+        if is_array(self.values) and is_array(getattr(other, "values", None)):
+            return ChainFilter(self.values | other.values)
+        return super().__or__(other)
+
     def __iter__(self):
         return iter(self.values)
 
@@ -1,25 +1,45 @@
-from typing import Collection, List, Union
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Collection, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 import tinytim.group as group
 
 import tinytable as tt
+import tinytable.buffers as buffers
+import tinytable.display as display
+import tinytable.sketch as sketch
+import tinytable.stats as stats
+import tinytable.window as windows
+from tinytable.categorical import Categorical
+from tinytable.types import DataDict, DataMapping
 
 
 class Group:
     """Returned by Column and Table groupby method.
     Acts like a list of tuple(key, Table)
     Can apply aggregation function to calculate new Table.
+    indexes holds the original row indexes of each group and labels the original row labels,
+    used by transform, apply and window functions to put results back in row order.
     """
 
-    def __init__(self, groups: List[tuple], by: Union[str, Collection]):
+    def __init__(
+        self,
+        groups: Sequence[tuple],
+        by: Union[str, Collection],
+        indexes: Optional[Sequence[Sequence[int]]] = None,
+        labels: Optional[Sequence] = None,
+    ):
         self.groups = groups
         self.by = [by] if isinstance(by, str) else by
+        self.indexes = indexes
+        self.labels = labels
 
     def __iter__(self):
         return iter(self.groups)
 
     def __repr__(self):
-        return repr(self.groups)
+        return display.format_groups(self.groups, self.by)
 
     def __getitem__(self, i: int):
         return self.groups[i]
@@ -56,6 +76,233 @@ class Group:
         labels, rows = group.pstdev_groups(self.groups)
         return tt.Table(rows, labels)
 
-    def nunique(self):
-        labels, rows = group.nunique_groups(self.groups)
+    def nunique(self, approx=False, precision=sketch.DEFAULT_PRECISION):
+        if approx:
+            labels, rows = group.aggregate_groups(self.groups, lambda table: sketch.approx_nunique_data(table._data, precision))
+        else:
+            labels, rows = group.nunique_groups(self.groups)
         return tt.Table(rows, labels)
+
+    def quantile(self, q=0.5):
+        labels, rows = group.aggregate_groups(self.groups, lambda table: stats.quantile_data(table._data, q))
+        return tt.Table(rows, labels)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def describe(self):
+        """Table of describe statistics of each group, in columns named {column}_{statistic}."""
+        labels, rows = group.aggregate_groups(self.groups, describe_row)
+        return tt.Table(rows, labels)
+
+    def approx_quantile(self, q=0.5, k=sketch.DEFAULT_K):
+        labels, rows = group.aggregate_groups(self.groups, lambda table: sketch.approx_quantile_data(table._data, q, k))
+        return tt.Table(rows, labels)
+
+    def _map_columns(self, func):
+        """Table of func applied to the columns (other than by) of each group,
+        keeping the columns in every result, rows in original row order.
+        Without row indexes, rows are in group order, each labeled with its group key.
+        """
+        results = [self._value_columns(table)._map_columns(func) for _, table in self.groups]
+        if self.indexes is None:
+            return self._stack(results)
+        names = [name for name in results[0]._data if all(name in result._data for result in results)] if results else []
+        return self._scatter([{name: result._data[name] for name in names} for result in results])
+
+    def _value_columns(self, table) -> "tt.Table":
+        if not isinstance(table, tt.Table):
+            table = tt.Table(table)
+        return table.only_columns([name for name in table.columns if name not in self.by])
+
+    def _stack(self, results: Sequence["tt.Table"]) -> "tt.Table":
+        """Table of each group's result rows in group order, labeled with the group key,
+        keeping the columns in every result.
+        """
+        labels: List[Any] = []
+        for (key, _), result in zip(self.groups, results):
+            labels.extend([key] * len(result))
+        names = [name for name in results[0]._data if all(name in result._data for result in results)] if results else []
+        data = {name: [value for result in results for value in result._data[name]] for name in names}
+        return tt.Table(data, labels)
+
+    def _run(self, func: Callable[["tt.Table"], Any], processes: Optional[int]) -> List[Any]:
+        """func called with the value columns of each group, in a pool of processes if given."""
+        tables = [self._value_columns(table) for _, table in self.groups]
+        if processes is None:
+            return [func(table) for table in tables]
+        with ProcessPoolExecutor(processes) as pool:
+            return list(pool.map(func, tables))
+
+    def _scatter(self, results: Sequence[Mapping[str, Any]]) -> "tt.Table":
+        """Table in original row order of each group's {column name: value or values},
+        a single value filling all of its group's rows.
+        """
+        if self.indexes is None:
+            raise ValueError("Group has no row indexes, group a Table with groupby to transform")
+        row_count = sum(map(len, self.indexes))
+        data: Dict[str, list] = {}
+        for rows, result in zip(self.indexes, results):
+            for name, value in result.items():
+                column = data.get(name)
+                if column is None:
+                    column = data[name] = [None] * row_count
+                if buffers.is_sequence(value):
+                    if len(value) != len(rows):
+                        raise ValueError(f"transform of column {name!r} returned {len(value)} values for a group of {len(rows)} rows")
+                    for i, item in zip(rows, buffers.to_list(value)):
+                        column[i] = item
+                else:
+                    for i in rows:
+                        column[i] = value
+        return tt.Table(data, self.labels)
+
+    def transform(self, func: Union[str, Callable[[list], Any]], processes: Optional[int] = None) -> "tt.Table":
+        """Table of per group results broadcast back to the original rows, in original row order.
+
+        func is the name of a Table aggregation (e.g. "mean") or a function
+        called with the values of each column (other than by) of each group,
+        returning one value for all of the group's rows or one value per row.
+        Columns func raises TypeError for are left out.
+        Pass processes to run groups in a pool of that many processes (func must be picklable).
+        """
+        if isinstance(func, str) and func not in TRANSFORMS:
+            raise ValueError(f"unknown transform {func!r}, must be a function or one of {list(TRANSFORMS)}")
+        return self._scatter(self._run(partial(transform_table, func), processes))
+
+    def apply(self, func: Callable[["tt.Table"], Any], processes: Optional[int] = None) -> "tt.Table":
+        """Call func with a Table of the columns (other than by) of each group.
+
+        func returns a Table (or data mapping). If every result has as many rows
+        as its group, the rows are put back in the original row order.
+        Otherwise the results are stacked in group order, labeled with the group key.
+        Pass processes to run groups in a pool of that many processes (func must be picklable).
+        """
+        results = [result if isinstance(result, tt.Table) else tt.Table(result) for result in self._run(func, processes)]
+        if self.indexes is not None and all(len(result) == len(rows) for result, rows in zip(results, self.indexes)):
+            return self._scatter([result._data for result in results])
+        return self._stack(results)
+
+    def rolling(self, window, min_periods=None):
+        """Moving window within each group, e.g. grouped.rolling(3).mean()."""
+        return windows.Window(self._map_columns, window, min_periods)
+
+    def expanding(self, min_periods=1):
+        return windows.Window(self._map_columns, None, min_periods)
+
+    def cumsum(self):
+        return self._map_columns(windows.cumsum)
+
+    def cummin(self):
+        return self._map_columns(windows.cummin)
+
+    def cummax(self):
+        return self._map_columns(windows.cummax)
+
+    def shift(self, periods=1, fill_value=None):
+        return self._map_columns(lambda values: windows.shift(values, periods, fill_value))
+
+    def diff(self, periods=1):
+        return self._map_columns(lambda values: windows.diff(values, periods))
+
+    def cumcount(self):
+        """Table of the position of each row within its group, in original row order.
+        Without row indexes, rows are in group order, each labeled with its group key.
+        """
+        if self.indexes is not None:
+            return self._scatter([{"cumcount": list(range(len(rows)))} for rows in self.indexes])
+        labels: List[Any] = []
+        positions: List[int] = []
+        for key, table in self.groups:
+            labels.extend([key] * len(table))
+            positions.extend(range(len(table)))
+        return tt.Table({"cumcount": positions}, labels)
+
+
+class RunGroups(Sequence[Tuple[Any, Any]]):
+    """Sequence of (group key, Table) pairs of runs of rows with equal keys.
+
+    Each group's Table is sliced from data when it is accessed,
+    so iterating the groups only holds the current group.
+    """
+
+    def __init__(self, data: DataDict, runs: List[Tuple[Any, int, int]]) -> None:
+        self.data = data
+        self.runs = runs
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(len(self))[i]]
+        key, start, stop = self.runs[i]
+        return key, tt.Table._from_data({name: values[start:stop] for name, values in self.data.items()}, None, stop - start)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"RunGroups({len(self)} groups)"
+
+
+TRANSFORMS = ("sum", "count", "mean", "min", "max", "std", "pstd", "mode", "nunique", "median", "cumsum", "cummin", "cummax")
+
+
+def transform_table(func: Union[str, Callable[[list], Any]], table: "tt.Table") -> Dict[str, Any]:
+    """{column name: func result} of a group Table's columns."""
+    if isinstance(func, str):
+        result = getattr(table, func)()
+        return result._data if isinstance(result, tt.Table) else result
+    out = {}
+    for name, values in table._data.items():
+        try:
+            out[name] = func(buffers.to_list(values))
+        except TypeError:
+            continue
+    return out
+
+
+def describe_row(table: "tt.Table") -> Dict[str, Any]:
+    return {
+        f"{column_name}_{stat}": value
+        for column_name, described in stats.describe_data(table._data).items()
+        for stat, value in described.items()
+    }
+
+
+def group_keys(data: DataMapping, by: Union[str, Sequence[str]]) -> Sequence:
+    """Return the group key of each row.
+    A str by gives the column values, a sequence of names gives row tuples.
+    """
+    if isinstance(by, str):
+        return data[by]
+    return list(zip(*(data[name] for name in by)))
+
+
+def group_indexes(data: DataMapping, by: Union[str, Sequence[str]]) -> Dict[Any, List[int]]:
+    """Return {group key: row indexes} in one pass, keys in order of first appearance."""
+    if isinstance(by, str):
+        values = data[by]
+        if isinstance(values, Categorical):
+            return values.group_indexes()
+    out: Dict[Any, List[int]] = {}
+    for i, key in enumerate(group_keys(data, by)):
+        indexes = out.get(key)
+        if indexes is None:
+            out[key] = [i]
+        else:
+            indexes.append(i)
+    return out
+
+
+def key_runs(data: DataMapping, by: Union[str, Sequence[str]]) -> Iterator[Tuple[Any, int, int]]:
+    """Yield (group key, start, stop) of each run of consecutive rows with equal group keys,
+    comparing neighbouring keys instead of hashing them.
+    """
+    start = 0
+    for key, run in itertools.groupby(group_keys(data, by)):
+        stop = start + sum(1 for _ in run)
+        yield key, start, stop
+        start = stop
@@ -1,9 +1,10 @@
 """Purely integer-location based indexing for Table selection by position."""
 
-from typing import List, Sequence
+from typing import Any, List, Sequence
 
 from tinytim.data import table_value
-from tinytim.utils import slice_to_range
+
+import tinytable.buffers as buffers
 
 
 class Iloc:
@@ -35,21 +36,19 @@ class Iloc:
 
             # With scalar integers. tbl.iloc[0, 1]
             if is_int_tuple(key):
-                data = self.parent.data
+                data = self.parent._data
                 column = self.parent.columns[key[1]]
                 return table_value(data, column, key[0])
 
             # With lists of integers. tbl.iloc[[0, 2], [1, 3]]
             if is_two_int_lists(key):
                 cols = self.parent.columns
-                return self.parent[[cols[i] for i in key[1]]].filter_by_indexes(key[0])
+                return self.parent.filter_by_indexes(key[0], [cols[i] for i in key[1]])
 
             # With slice objects. tbl.iloc[1:3, 0:3]
             if is_two_int_slices(key):
-                index_range = slice_to_range(key[0])
-                column_range = slice_to_range(key[1])
-                cols = self.parent.columns
-                return self.parent[[cols[i] for i in column_range]].filter_by_indexes(index_range)
+                index_range = range(*key[0].indices(len(self.parent)))
+                return self.parent.filter_by_indexes(index_range, list(self.parent.columns[key[1]]))
 
         raise TypeError("Cannot index by location index with a non-integer key")
 
@@ -62,7 +61,7 @@ class Iloc:
         # With a slice object. tbl.iloc[:3] = [{'age': 22}, {'age': 21}, {'age': 20}]
         if isinstance(key, slice):
             if is_int_slice(key):
-                self.parent[key] = value
+                self.parent.edit_rows(range(len(self.parent))[key], value)
                 return
             else:
                 raise TypeError("Cannot index by location index with a non-integer key")
@@ -71,8 +70,7 @@ class Iloc:
         #                          tbl.iloc[[0, 1]] = [[1, 22], [2, 21]]
         if isinstance(key, list):
             if is_int_list(key):
-                for i, v in zip(key, value):
-                    self.parent.edit_row(i, v)
+                self.parent.edit_rows(key, value)
                 return
             else:
                 raise TypeError("Cannot index by location index with a non-integer key")
@@ -87,17 +85,38 @@ class Iloc:
                 self.parent[column][key[0]] = value
                 return
 
-            # With lists of integers. tbl.iloc[[0, 2], [1, 3]] = []
+            # With lists of integers. tbl.iloc[[0, 2], [1, 3]] = [[1, 22], [3, 21]] or 0
             if is_two_int_lists(key):
-                raise NotImplementedError("Setting value of Table subset is not implemented.")
+                cols = self.parent.columns
+                set_block(self.parent, key[0], [cols[i] for i in key[1]], value)
+                return
 
-            # With slice objects. tbl.iloc[1:3, 0:3]
+            # With slice objects. tbl.iloc[1:3, 0:3] = [[...], [...]] or 0
             if is_two_int_slices(key):
-                raise NotImplementedError("Setting value of Table subset is not implemented.")
+                cols = self.parent.columns
+                set_block(self.parent, range(*key[0].indices(len(self.parent))), list(cols[key[1]]), value)
+                return
 
         raise TypeError("Cannot index by location index with a non-integer key")
 
 
+def set_block(table, indexes: Sequence[int], column_names: Sequence[str], value: Any) -> None:
+    """Set the values of column_names at row indexes to value, a block of
+    row value sequences or one value for every cell, a column at a time.
+    """
+    if not buffers.is_sequence(value):
+        for column_name in column_names:
+            table.edit_values(column_name, indexes, value)
+        return
+    rows = list(value)
+    if len(rows) != len(indexes):
+        raise ValueError("block must have a row of values for each index.")
+    if any(len(row) != len(column_names) for row in rows):
+        raise ValueError("block rows must have a value for each column.")
+    for position, column_name in enumerate(column_names):
+        table.edit_values(column_name, indexes, [row[position] for row in rows])
+
+
 def is_int_slice(s: slice) -> bool:
     if not isinstance(s.start, int) and s.start is not None:
         return False
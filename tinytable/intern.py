@@ -0,0 +1,84 @@
+"""Deduplicate repeated str values read from files.
+
+Readers create a new str object for every cell, even when a column
+repeats a few values. A StringInterner replaces each repeat with the
+first str object seen for that value. Readers intern each row as it
+is read, so the repeats are freed straight away instead of all being
+held until the whole column exists.
+Each column's cache is bounded: once full, new values are not cached,
+so high cardinality columns do not grow an unbounded dict.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Mapping, MutableSequence, Optional, Sequence, Union
+
+from tinytable.types import DataMapping
+
+DEFAULT_INTERN_CACHE_SIZE = 10_000
+
+InternOption = Union[bool, int]
+
+
+class StringInterner:
+    """Per column bounded caches of shared str objects."""
+
+    def __init__(self, max_size: int = DEFAULT_INTERN_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.caches: Dict[str, Dict[str, str]] = {}
+
+    def intern_values(self, column_name: str, values: MutableSequence) -> None:
+        """Replace repeated str values in values with one shared object, in place."""
+        cache = self.caches.setdefault(column_name, {})
+        max_size = self.max_size
+        for i, value in enumerate(values):
+            if type(value) is str:
+                shared = cache.get(value)
+                if shared is None:
+                    if len(cache) < max_size:
+                        cache[value] = value
+                elif shared is not value:
+                    values[i] = shared
+
+    def intern_value(self, column_name: str, value: Any) -> Any:
+        """Return the shared str object equal to value, or value itself."""
+        if type(value) is not str:
+            return value
+        cache = self.caches.get(column_name)
+        if cache is None:
+            cache = self.caches[column_name] = {}
+        shared = cache.get(value)
+        if shared is None:
+            if len(cache) < self.max_size:
+                cache[value] = value
+            return value
+        return shared
+
+    def intern_data(self, data: DataMapping) -> None:
+        """Intern the str values of every column of data, in place."""
+        for column_name, values in data.items():
+            self.intern_values(column_name, values)  # type: ignore[arg-type]
+
+
+def interned_rows(rows: Iterable[Any], strings: Optional[StringInterner], column_names: Sequence[str] = ()) -> Iterator[Any]:
+    """Yield rows with their str values interned as each row is read, rows as is if strings is None.
+    Rows are Mappings of {column_name: value} or Sequences of values in column_names order.
+    """
+    if strings is None:
+        yield from rows
+        return
+    intern_value = strings.intern_value
+    for row in rows:
+        if isinstance(row, Mapping):
+            yield {name: intern_value(name, value) for name, value in row.items()}
+        else:
+            yield [intern_value(name, value) for name, value in zip(column_names, row)]
+
+
+def interner(intern_strings: Optional[InternOption]) -> Optional[StringInterner]:
+    """Return a StringInterner for a reader's intern_strings option:
+    False for none, True for the default cache size, or an int cache size per column.
+    """
+    if intern_strings is None or intern_strings is False:
+        return None
+    if intern_strings is True:
+        return StringInterner()
+    return StringInterner(int(intern_strings))
@@ -0,0 +1,93 @@
+"""Label and mask based indexing for Table selection and setting.
+
+Rows are selected by a Filter, a bool per row, a label or a list of
+labels (row positions for Tables without labels); columns by a name
+or a list of names. Setting edits each selected column in one pass.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from tinytim.filter import indexes_from_filter
+
+import tinytable.buffers as buffers
+from tinytable.filter import Filter
+from tinytable.iloc import set_block
+
+
+class Loc:
+    def __init__(self, parent):
+        self.parent = parent
+
+    def __getitem__(self, key):
+        rows, columns = split_key(key)
+        # tbl.loc[tbl['age'] > 18] or tbl.loc[['a', 'b'], ['name', 'age']]
+        table = self.parent.filter_by_indexes(row_positions(self.parent, rows))
+        if columns is None:
+            return table
+        # tbl.loc[mask, 'age'] -> Column
+        if isinstance(columns, str):
+            return table[columns]
+        return table.only_columns(list(columns))
+
+    def __setitem__(self, key, value) -> None:
+        rows, columns = split_key(key)
+        positions = row_positions(self.parent, rows)
+        # tbl.loc[tbl['age'] > 18, 'adult'] = True
+        if isinstance(columns, str):
+            self.parent.edit_values(columns, positions, value)
+            return
+        # tbl.loc[mask, ['x', 'y']] = [[1, 2], [3, 4]] or 0
+        set_block(self.parent, positions, list(self.parent.columns) if columns is None else columns, value)
+
+
+def split_key(key: Any) -> Tuple[Any, Optional[Any]]:
+    """Split key into (rows key, columns key or None for all columns)."""
+    if isinstance(key, tuple):
+        if len(key) != 2:
+            raise IndexError("loc takes a rows key and a columns key")
+        return key[0], key[1]
+    return key, None
+
+
+def row_positions(table, key: Any) -> List[int]:
+    """Row positions selected by key."""
+    if isinstance(key, Filter):
+        mask = getattr(key, "values", None)
+        if buffers.is_array(mask):
+            return buffers.numpy().flatnonzero(mask).tolist()
+        return indexes_from_filter(list(key))
+    if isinstance(key, slice):
+        if key != slice(None) and table.labels is not None:
+            raise TypeError("loc only takes the full slice : for rows of a labeled Table")
+        return list(range(len(table))[key])
+    if buffers.is_sequence(key):
+        keys = buffers.to_list(key)
+        if keys and all(isinstance(k, bool) for k in keys):
+            if len(keys) != len(table):
+                raise ValueError("mask length must match rows length.")
+            return [i for i, selected in enumerate(keys) if selected]
+        index = label_index(table)
+        return [position for k in keys for position in label_positions(table, index, k)]
+    return label_positions(table, label_index(table), key)
+
+
+def label_index(table) -> Optional[Dict[Any, List[int]]]:
+    """{label: row positions} of a labeled table, None without labels."""
+    if table.labels is None:
+        return None
+    index: Dict[Any, List[int]] = {}
+    for i, label in enumerate(table.labels):
+        index.setdefault(label, []).append(i)
+    return index
+
+
+def label_positions(table, index: Optional[Dict[Any, List[int]]], label: Any) -> List[int]:
+    """Positions of the rows labeled label, the row position itself for Tables without labels."""
+    if index is None:
+        if not isinstance(label, int):
+            raise KeyError(label)
+        return [table._position(label)]
+    positions = index.get(label)
+    if positions is None:
+        raise KeyError(label)
+    return positions
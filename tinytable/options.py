@@ -0,0 +1,59 @@
+"""Package wide options, looked up by dotted name.
+
+>>> import tinytable as tt
+>>> tt.set_option('display.max_rows', 20)
+>>> with tt.option_context('display.max_rows', 5):
+...     print(tbl)
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+DEFAULTS: Dict[str, Any] = {
+    # Rows shown by repr before truncating to head and tail rows, None for all.
+    "display.max_rows": 60,
+    # Columns shown by repr before truncating to first and last columns, None for all.
+    "display.max_columns": 20,
+    # Characters shown of each str cell, None for all.
+    "display.max_colwidth": None,
+    # Groups shown by Group repr, None for all.
+    "display.max_groups": 10,
+}
+
+options: Dict[str, Any] = dict(DEFAULTS)
+
+
+def _validate_name(name: str) -> None:
+    if name not in DEFAULTS:
+        raise KeyError(f"No option named {name!r}, options are {list(DEFAULTS)}")
+
+
+def get_option(name: str) -> Any:
+    _validate_name(name)
+    return options[name]
+
+
+def set_option(name: str, value: Any) -> None:
+    _validate_name(name)
+    options[name] = value
+
+
+def reset_option(name: str) -> None:
+    _validate_name(name)
+    options[name] = DEFAULTS[name]
+
+
+@contextmanager
+def option_context(*args: Any) -> Iterator[None]:
+    """Temporarily set options, passed as name, value pairs."""
+    if len(args) % 2:
+        raise ValueError("option_context takes name, value pairs.")
+    pairs = list(zip(args[::2], args[1::2]))
+    old = [(name, get_option(name)) for name, _ in pairs]
+    try:
+        for name, value in pairs:
+            set_option(name, value)
+        yield
+    finally:
+        for name, value in old:
+            set_option(name, value)
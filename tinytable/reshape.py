@@ -0,0 +1,128 @@
+"""Reshape data between long and wide layouts: pivot and melt.
+
+pivot_table buckets row indexes by (index key, column key) in one hash
+pass, then aggregates each cell's values. melt builds each output column
+by repeating and concatenating whole column lists, with no per row dicts.
+"""
+
+import statistics
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import tinytable.buffers as buffers
+from tinytable.group import group_keys
+from tinytable.types import DataDict, DataMapping
+
+Names = Union[str, Sequence[str]]
+AggFunc = Union[str, Callable[[list], Any]]
+
+# Cell aggregation functions by name, each called with the cell's non-None values.
+AGGFUNCS: Dict[str, Callable[[list], Any]] = {
+    "sum": sum,
+    "count": len,
+    "mean": lambda values: sum(values) / len(values),
+    "min": min,
+    "max": max,
+    "median": statistics.median,
+    "std": lambda values: statistics.stdev(values) if len(values) > 1 else None,
+    "first": lambda values: values[0],
+    "last": lambda values: values[-1],
+    "nunique": lambda values: len(set(values)),
+}
+
+
+def _names(names: Names) -> List[str]:
+    return [names] if isinstance(names, str) else list(names)
+
+
+def _label(key: Any) -> str:
+    return "_".join(map(str, key)) if isinstance(key, tuple) else str(key)
+
+
+def _only(values: list) -> Any:
+    if len(values) > 1:
+        raise ValueError("pivot index and columns have duplicate entries, use pivot_table to aggregate them")
+    return values[0]
+
+
+def pivot_table(
+    data: DataMapping,
+    index: Names,
+    columns: Names,
+    values: Optional[Names] = None,
+    aggfunc: AggFunc = "mean",
+    fill_value: Any = None,
+) -> DataDict:
+    """Wide data with a row per distinct index key and a column per distinct columns key,
+    each cell the aggfunc of the values in rows with that pair of keys.
+
+    Keys are in order of first appearance. values defaults to every other column,
+    leaving out columns aggfunc raises TypeError for;
+    with more than one values column, output columns are named {value}_{key}.
+    aggfunc is a name in AGGFUNCS or a function of a list of values, called
+    with the non-None values of each cell. Empty cells are fill_value.
+    """
+    index_names = _names(index)
+    column_names = _names(columns)
+    value_names = [name for name in data if name not in index_names + column_names] if values is None else _names(values)
+    func = AGGFUNCS[aggfunc] if isinstance(aggfunc, str) else aggfunc
+    cells: Dict[Any, List[int]] = {}
+    for i, cell in enumerate(zip(group_keys(data, index), group_keys(data, columns))):
+        rows = cells.get(cell)
+        if rows is None:
+            cells[cell] = [i]
+        else:
+            rows.append(i)
+    row_keys = list(dict.fromkeys(row_key for row_key, _ in cells))
+    column_keys = list(dict.fromkeys(column_key for _, column_key in cells))
+    out: DataDict = {}
+    for position, name in enumerate(index_names):
+        out[name] = row_keys if isinstance(index, str) else [key[position] for key in row_keys]
+    for value_name in value_names:
+        column_values = buffers.to_list(data[value_name])
+        value_columns = {}
+        try:
+            for column_key in column_keys:
+                label = _label(column_key) if len(value_names) == 1 else f"{value_name}_{_label(column_key)}"
+                column = []
+                for row_key in row_keys:
+                    rows = cells.get((row_key, column_key), [])
+                    present = [column_values[i] for i in rows if column_values[i] is not None]
+                    column.append(func(present) if present else fill_value)
+                value_columns[label] = column
+        except TypeError:
+            if values is not None:
+                raise
+            continue
+        out.update(value_columns)
+    return out
+
+
+def pivot(data: DataMapping, index: Names, columns: Names, values: Optional[Names] = None) -> DataDict:
+    """Wide data like pivot_table without aggregating, raising ValueError
+    if a pair of index and columns keys is in more than one row.
+    """
+    return pivot_table(data, index, columns, values, _only)
+
+
+def melt(
+    data: DataMapping,
+    id_vars: Optional[Names] = None,
+    value_vars: Optional[Names] = None,
+    var_name: str = "variable",
+    value_name: str = "value",
+) -> DataDict:
+    """Long data with a row per id row and value_vars column (all other columns by default):
+    the id_vars columns, var_name holding the column name and value_name holding its value.
+    """
+    id_names = [] if id_vars is None else _names(id_vars)
+    value_names = [name for name in data if name not in id_names] if value_vars is None else _names(value_vars)
+    row_count = len(data[next(iter(data))]) if data else 0
+    out: DataDict = {name: buffers.to_list(data[name]) * len(value_names) for name in id_names}
+    variables: list = []
+    melted: list = []
+    for name in value_names:
+        variables.extend([name] * row_count)
+        melted.extend(buffers.to_list(data[name]))
+    out[var_name] = variables
+    out[value_name] = melted
+    return out
@@ -1,61 +1,98 @@
-from typing import Any, Dict, Generator, List, Tuple
-
-from tabulate import tabulate
-from tinytim.utils import row_values_generator
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
 
+import tinytable.display as display
+from tinytable.buffers import value_at
 from tinytable.types import DataMapping
 
 
 class Row:
-    def __init__(self, data: Dict[str, Any], index: int, parent=None, label=None):
-        self.data = data
+    """Row of Table values.
+
+    Rows from a Table are views: values are read from the parent
+    Table's columns at index when accessed, no row dict is built.
+    Setting an item writes through to the parent Table.
+    Rows made from a dict, or dropped from their parent, hold their own values.
+    """
+
+    __slots__ = ("_values", "index", "parent", "label")
+
+    def __init__(self, data: Optional[Dict[str, Any]], index: int, parent=None, label=None):
+        self._values = data
         self.index = index
         self.parent = parent
         self.label = label
 
+    @classmethod
+    def view(cls, parent, index: int, label=None) -> "Row":
+        """Row reading values from parent Table at index."""
+        return cls(None, index, parent, label)
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Row values {column_name: value}."""
+        if self._values is not None:
+            return self._values
+        index = self.index
+        return {column: value_at(values, index) for column, values in self.parent._data.items()}
+
     def __len__(self) -> int:
-        return len(self.data)
+        if self._values is not None:
+            return len(self._values)
+        return len(self.parent._data)
 
-    def __iter__(self):
-        return row_values_generator(self.data)
+    def __iter__(self) -> Iterator[Any]:
+        if self._values is not None:
+            return iter(list(self._values.values()))
+        index = self.index
+        return (value_at(values, index) for values in self.parent._data.values())
 
     def __repr__(self) -> str:
         index = self.index if self.label is None else self.label
-        return tabulate({col: [value] for col, value in self.data.items()}, headers=self.columns, tablefmt="grid", showindex=[index])
+        return display.format_grid(self.columns, lambda column: [self[column]], 1, [index])
 
     def __getitem__(self, column: str) -> Any:
-        return self.data[column]
+        if self._values is not None:
+            return self._values[column]
+        return value_at(self.parent._data[column], self.index)
 
     def __setitem__(self, column: str, value: Any) -> None:
-        self.data[column] = value
+        if self._values is not None:
+            self._values[column] = value
         if self.parent is not None:
             self.parent.edit_value(column, self.index, value)
 
     @property
     def columns(self) -> List[str]:
-        return list(self.data.keys())
+        return self.keys()
 
     def keys(self) -> List[str]:
-        return list(self.data.keys())
+        if self._values is not None:
+            return list(self._values.keys())
+        return list(self.parent._data.keys())
 
     def drop(self) -> None:
-        """drop Row from parent"""
+        """drop Row from parent, keeping a copy of its values"""
         if self.parent is not None:
+            self._values = self.data
             self.parent.drop_row(self.index)
             self.parent = None
 
     def values(self) -> List[Any]:
-        return list(self.data.values())
+        return list(self)
 
 
 def iterrows(data: DataMapping, parent, labels=None) -> Generator[Tuple[int, Row], None, None]:
     if len(data) == 0:
         return
-    i = 0
-    while True:
-        try:
+    row_count = len(next(iter(data.values())))
+    if parent is None:
+        for i in range(row_count):
             label = None if labels is None else labels[i]
-            yield i, Row({col: data[col][i] for col in data}, i, parent, label)
-        except IndexError:
-            return
-        i += 1
+            yield i, Row({col: data[col][i] for col in data}, i, None, label)
+        return
+    if labels is None:
+        for i in range(row_count):
+            yield i, Row(None, i, parent)
+    else:
+        for i, label in zip(range(row_count), labels):
+            yield i, Row(None, i, parent, label)
@@ -0,0 +1,229 @@
+"""Mergeable sketches for approximate distinct counts and quantiles.
+
+A HyperLogLog estimates the number of distinct values in a fixed number
+of bytes, and a QuantileSketch (a KLL sketch) estimates quantiles
+keeping about 3 * k values. Both can be built from separate chunks,
+groups or processes and merged, and to_dict/from_dict convert their
+state to plain JSON-compatible values for storing or sending.
+"""
+
+import hashlib
+import math
+import random
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Union
+
+import tinytable.buffers as buffers
+
+DEFAULT_PRECISION = 14
+DEFAULT_K = 200
+
+
+def stable_hash(value: Any) -> int:
+    """64 bit hash of the repr of value, the same in every process
+    (unlike hash of str, which is randomized per process).
+    Equal numbers hash the same, like in a set: True, 1 and 1.0 are one value.
+    """
+    if isinstance(value, bool):
+        value = int(value)
+    elif isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return int.from_bytes(hashlib.blake2b(repr(value).encode(), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """Approximate distinct value counter using 2**precision one byte registers.
+    The relative standard error is about 1.04 / sqrt(2**precision),
+    under 1% for the default precision of 14 (16 KiB).
+    """
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any], precision: int = DEFAULT_PRECISION) -> "HyperLogLog":
+        sketch = cls(precision)
+        sketch.update(values)
+        return sketch
+
+    def add(self, value: Any) -> None:
+        self.update([value])
+
+    def update(self, values: Sequence[Any]) -> None:
+        registers = self.registers
+        index_shift = 64 - self.precision
+        rest_mask = (1 << index_shift) - 1
+        for value in buffers.to_list(values):
+            h = stable_hash(value)
+            index = h >> index_shift
+            rank = index_shift - (h & rest_mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Merge other into this sketch in place and return it."""
+        if other.precision != self.precision:
+            raise ValueError("can only merge HyperLogLogs of the same precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        m = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / sum(2.0**-rank for rank in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small counts.
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"precision": self.precision, "registers": self.registers.hex()}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "HyperLogLog":
+        sketch = cls(state["precision"])
+        sketch.registers = bytearray.fromhex(state["registers"])
+        return sketch
+
+
+class QuantileSketch:
+    """Approximate quantiles of numeric values (a KLL sketch).
+
+    Values are kept in levels of compactors, a value at level h standing
+    for 2**h values. A full level is sorted and every other value moved
+    up a level, so the sketch holds about 3 * k values however many are added.
+    Rank error is about 1.7 / k; with up to k values, quantiles are exact.
+    None values are skipped.
+    """
+
+    def __init__(self, k: int = DEFAULT_K, seed: int = 0) -> None:
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        self.k = k
+        self.count = 0
+        self.compactors: List[list] = [[]]
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any], k: int = DEFAULT_K) -> "QuantileSketch":
+        sketch = cls(k)
+        sketch.update(values)
+        return sketch
+
+    def add(self, value: Any) -> None:
+        self.update([value])
+
+    def update(self, values: Iterable[Any]) -> None:
+        """Add values, raising TypeError for values that are not numbers."""
+        if buffers.is_array(values):
+            values = buffers.to_list(values)  # type: ignore[arg-type]
+        batch = []
+        for value in values:
+            if value is None:
+                continue
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"QuantileSketch values must be numbers, not {type(value).__name__}")
+            batch.append(value)
+            if len(batch) == self.k:
+                self._add_batch(batch)
+                batch = []
+        if batch:
+            self._add_batch(batch)
+
+    def _add_batch(self, batch: list) -> None:
+        self.compactors[0].extend(batch)
+        self.count += len(batch)
+        self._compress()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        while sum(map(len, self.compactors)) > sum(self._capacity(level) for level in range(len(self.compactors))):
+            for level, items in enumerate(self.compactors):
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self.compactors.append([])
+                    self.compactors[level + 1].extend(self._compact(items))
+                    break
+
+    def _compact(self, items: list) -> list:
+        """Empty items (keeping one if odd) and return every other sorted value."""
+        items.sort()
+        odd = items.pop() if len(items) % 2 else None
+        promoted = items[self._random.randint(0, 1) :: 2]
+        items.clear()
+        if odd is not None:
+            items.append(odd)
+        return promoted
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Merge other into this sketch in place and return it."""
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for items, other_items in zip(self.compactors, other.compactors):
+            items.extend(other_items)
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> List[Any]:
+        """Estimated value at each quantile q (0 <= q <= 1) of qs,
+        the nearest lower value where q falls between two values.
+        """
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("quantiles must be between 0 and 1")
+        if self.count == 0:
+            raise ValueError("quantiles of an empty sketch")
+        weighted = sorted((value, 1 << level) for level, items in enumerate(self.compactors) for value in items)
+        out = []
+        for q in qs:
+            rank = q * (self.count - 1)
+            cumulative = 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative > rank:
+                    break
+            out.append(value)
+        return out
+
+    def quantile(self, q: float) -> Any:
+        return self.quantiles([q])[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "count": self.count, "compactors": [list(items) for items in self.compactors]}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(state["k"])
+        sketch.count = state["count"]
+        sketch.compactors = [list(items) for items in state["compactors"]]
+        return sketch
+
+
+def approx_nunique_data(data: Mapping[str, Sequence[Any]], precision: int = DEFAULT_PRECISION) -> Dict[str, int]:
+    """Approximate distinct count of each column of data."""
+    return {column_name: HyperLogLog.from_values(values, precision).count() for column_name, values in data.items()}
+
+
+def approx_quantile_data(
+    data: Mapping[str, Sequence[Any]], q: Union[float, Sequence[float]] = 0.5, k: int = DEFAULT_K
+) -> Dict[str, Any]:
+    """Approximate quantile (or list of quantiles for a sequence q) of each numeric column of data,
+    skipping other columns and columns of only None.
+    """
+    out = {}
+    for column_name, values in data.items():
+        try:
+            sketch = QuantileSketch.from_values(values, k)
+        except TypeError:
+            continue
+        if sketch.count:
+            out[column_name] = sketch.quantile(q) if isinstance(q, (int, float)) else sketch.quantiles(q)
+    return out
@@ -0,0 +1,120 @@
+"""Sort keys and in-memory or external merge sorting of table data.
+
+Missing values (None) always sort last, in either direction.
+"""
+
+import heapq
+from functools import cmp_to_key
+from typing import Any, Callable, Generator, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from tinytable.spill import DEFAULT_MEMORY_LIMIT, SpillFile, estimate_row_bytes, write_run
+from tinytable.types import DataDict, DataMapping
+
+Ascending = Union[bool, Sequence[bool]]
+
+
+def _ascending_list(ascending: Ascending, n: int) -> List[bool]:
+    if isinstance(ascending, bool):
+        return [ascending] * n
+    ascending = list(ascending)
+    if len(ascending) != n:
+        raise ValueError("ascending must be a bool or have one bool per by column.")
+    return ascending
+
+
+def _compare(a: Any, b: Any) -> int:
+    if a is None:
+        return 0 if b is None else 1
+    if b is None:
+        return -1
+    return -1 if a < b else (1 if b < a else 0)
+
+
+def sort_key(positions: Sequence[int], ascending: Ascending = True) -> Tuple[Callable[[Sequence], Any], bool]:
+    """Return (key function, reverse) sorting row sequences by values at positions.
+
+    When every position sorts in the same direction the key is a plain tuple
+    compared in C, otherwise a slower per-position comparison is used.
+    """
+    directions = _ascending_list(ascending, len(positions))
+    if all(directions) or not any(directions):
+        reverse = not directions[0] if directions else False
+        if reverse:
+            return (lambda row: tuple((row[p] is not None, row[p]) for p in positions)), True
+        return (lambda row: tuple((row[p] is None, row[p]) for p in positions)), False
+
+    def compare(a: Sequence, b: Sequence) -> int:
+        for p, asc in zip(positions, directions):
+            a_value, b_value = a[p], b[p]
+            if a_value is None or b_value is None:
+                result = _compare(a_value, b_value)
+            else:
+                result = _compare(a_value, b_value) if asc else _compare(b_value, a_value)
+            if result:
+                return result
+        return 0
+
+    return cmp_to_key(compare), False
+
+
+def sort_indexes(data: DataMapping, by: Sequence[str], ascending: Ascending = True) -> List[int]:
+    """Return the row indexes of data in sorted order (stable)."""
+    keys = list(zip(*(data[name] for name in by)))
+    key, reverse = sort_key(range(len(by)), ascending)
+    return sorted(range(len(keys)), key=lambda i: key(keys[i]), reverse=reverse)
+
+
+def rows_to_chunks(names: Sequence[str], rows: Iterable[Sequence], chunksize: int) -> Generator[DataDict, None, None]:
+    """Group row sequences into data chunks of chunksize rows."""
+    chunk: List[Sequence] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunksize:
+            yield {name: list(values) for name, values in zip(names, zip(*chunk))}
+            chunk = []
+    if chunk:
+        yield {name: list(values) for name, values in zip(names, zip(*chunk))}
+
+
+def external_sort(
+    chunks: Iterable[DataMapping],
+    by: Sequence[str],
+    ascending: Ascending = True,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    chunksize: int = 10_000,
+    tmpdir: Optional[str] = None,
+) -> Generator[DataDict, None, None]:
+    """
+    Sort a sequence of data chunks by by columns using bounded memory.
+
+    Rows are buffered until their estimated size passes memory_limit,
+    then the sorted buffer is spilled to a temporary run file.
+    Runs are k-way merged and yielded as chunks of chunksize rows.
+    """
+    names: Optional[List[str]] = None
+    key: Callable[[Sequence], Any] = tuple
+    reverse = False
+    runs: List[SpillFile] = []
+    buffer: List[tuple] = []
+    buffer_bytes = 0
+    try:
+        for data in chunks:
+            if names is None:
+                names = list(data)
+                key, reverse = sort_key([names.index(name) for name in by], ascending)
+            rows = list(zip(*(data[name] for name in names)))
+            buffer.extend(rows)
+            buffer_bytes += estimate_row_bytes(data) * len(rows)
+            if buffer_bytes > memory_limit:
+                buffer.sort(key=key, reverse=reverse)
+                runs.append(write_run(buffer, tmpdir))
+                buffer = []
+                buffer_bytes = 0
+        if names is None:
+            return
+        buffer.sort(key=key, reverse=reverse)
+        merged: Iterator[Sequence] = heapq.merge(*runs, buffer, key=key, reverse=reverse) if runs else iter(buffer)
+        yield from rows_to_chunks(names, merged, chunksize)
+    finally:
+        for run in runs:
+            run.close()
@@ -0,0 +1,229 @@
+"""Temporary spill files for working on data larger than a memory budget.
+
+Rows, group partitions and partial aggregation states are written to
+anonymous temporary files as pickled batches and read back one batch
+at a time. Memory use is estimated from sampled value sizes.
+"""
+
+import pickle
+import sys
+import tempfile
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from tinytim.rows import row_dicts_to_data
+
+import tinytable as tt
+from tinytable.aggregate import Aggregation, GroupAccumulator, finalize_data, merge_data
+from tinytable.group import group_indexes
+from tinytable.types import DataDict, DataMapping
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+SPILL_PARTITIONS = 16
+SPILL_BATCH_ROWS = 1024
+ESTIMATE_SAMPLE_ROWS = 100
+# Size of one pointer slot in a column list.
+SLOT_BYTES = 8
+
+
+def sizeof(value: Any) -> int:
+    """Approximate memory size of value, including items of containers."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(sizeof(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(sizeof(k) + sizeof(v) for k, v in value.items())
+    return size
+
+
+def estimate_row_bytes(data: DataMapping, sample: int = ESTIMATE_SAMPLE_ROWS) -> int:
+    """Estimate the memory size of one row of data from evenly spaced sample rows."""
+    row_count = max((len(values) for values in data.values()), default=0)
+    if row_count == 0:
+        return 0
+    indexes = range(0, row_count, max(1, row_count // sample))
+    total = sum(sizeof(values[i]) + SLOT_BYTES for values in data.values() for i in indexes)
+    return total // len(indexes)
+
+
+def estimate_data_bytes(data: DataMapping) -> int:
+    row_count = max((len(values) for values in data.values()), default=0)
+    return estimate_row_bytes(data) * row_count
+
+
+class SpillFile:
+    """Anonymous temporary file of pickled batches.
+    The file is deleted when closed or garbage collected.
+    """
+
+    def __init__(self, tmpdir: Optional[str] = None) -> None:
+        self.file = tempfile.TemporaryFile(dir=tmpdir)
+
+    def write(self, batch: Any) -> int:
+        """Append batch to the file and return its offset."""
+        self.file.seek(0, 2)
+        offset = self.file.tell()
+        pickle.dump(batch, self.file, pickle.HIGHEST_PROTOCOL)
+        return offset
+
+    def read(self, offset: int) -> Any:
+        """Read the batch written at offset."""
+        self.file.seek(offset)
+        return pickle.load(self.file)
+
+    def batches(self) -> Iterator[Any]:
+        """Iterate every batch in write order."""
+        offset = 0
+        while True:
+            self.file.seek(offset)
+            try:
+                batch = pickle.load(self.file)
+            except EOFError:
+                return
+            offset = self.file.tell()
+            yield batch
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate the items of every batch in write order."""
+        for batch in self.batches():
+            yield from batch
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def write_run(rows: Sequence, tmpdir: Optional[str] = None) -> SpillFile:
+    """Spill rows to a new SpillFile in batches of SPILL_BATCH_ROWS."""
+    run = SpillFile(tmpdir)
+    for start in range(0, len(rows), SPILL_BATCH_ROWS):
+        run.write(rows[start : start + SPILL_BATCH_ROWS])
+    return run
+
+
+class SpilledGroups(Sequence[Tuple[Any, Any]]):
+    """Sequence of (group key, Table) pairs kept in a spill file.
+
+    Only the group being accessed is loaded into memory, so iterating
+    the groups of a large Table does not hold a second copy of the data.
+    """
+
+    def __init__(self, spill: SpillFile, keys: List[Any], offsets: List[int]) -> None:
+        self.spill = spill
+        self.keys = keys
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(len(self))[i]]
+        return self.keys[i], tt.Table(self.spill.read(self.offsets[i]))
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"SpilledGroups({len(self)} groups)"
+
+
+def spill_groups(
+    data: DataMapping, by: Union[str, Sequence[str]], tmpdir: Optional[str] = None, indexes: Optional[Dict[Any, List[int]]] = None
+) -> SpilledGroups:
+    """Group data by by columns, writing each group's data to a spill file.
+    Pass the group_indexes of data if already known.
+    """
+    spill = SpillFile(tmpdir)
+    keys = []
+    offsets = []
+    if indexes is None:
+        indexes = group_indexes(data, by)
+    for key, rows in indexes.items():
+        group_data: DataDict = {column_name: [values[i] for i in rows] for column_name, values in data.items()}
+        keys.append(key)
+        offsets.append(spill.write(group_data))
+    return SpilledGroups(spill, keys, offsets)
+
+
+class SpillGroupAccumulator(GroupAccumulator):
+    """GroupAccumulator that spills partial states to disk over memory_limit.
+
+    Spilled states are hash partitioned by group key, then merged one
+    partition at a time when the result is requested.
+    Result keys keep their order of first appearance.
+    """
+
+    def __init__(
+        self,
+        agg: Aggregation,
+        by: Any,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        partitions: int = SPILL_PARTITIONS,
+        tmpdir: Optional[str] = None,
+    ) -> None:
+        super().__init__(agg, by)
+        self.memory_limit = memory_limit
+        self.partition_count = partitions
+        self.tmpdir = tmpdir
+        self.partitions: Optional[List[SpillFile]] = None
+        self.first_seen: Dict[Any, int] = {}
+        self.seen = 0
+        self.group_bytes = 0
+
+    @property
+    def spilled(self) -> bool:
+        return self.partitions is not None
+
+    def update(self, data: DataMapping) -> None:
+        super().update(data)
+        if self.states and not self.group_bytes:
+            key, states = next(iter(self.states.items()))
+            self.group_bytes = sizeof(key) + sizeof(states) + SLOT_BYTES * 4
+        if len(self.states) * self.group_bytes > self.memory_limit:
+            self.spill()
+
+    def update_key(self, key: Any, states: Mapping[str, Any]) -> None:
+        if key not in self.first_seen:
+            self.first_seen[key] = self.seen
+        self.seen += 1
+        super().update_key(key, states)
+
+    def spill(self) -> None:
+        """Write in memory states to partition files and clear them."""
+        if self.partitions is None:
+            self.partitions = [SpillFile(self.tmpdir) for _ in range(self.partition_count)]
+        buckets: List[List[Tuple[Any, int, Dict[str, Any]]]] = [[] for _ in range(self.partition_count)]
+        for key, states in self.states.items():
+            buckets[hash(key) % self.partition_count].append((key, self.first_seen[key], states))
+        for partition, bucket in zip(self.partitions, buckets):
+            if bucket:
+                partition.write(bucket)
+        self.states = {}
+        self.first_seen = {}
+
+    def close(self) -> None:
+        """Delete partition files."""
+        if self.partitions is not None:
+            for partition in self.partitions:
+                partition.close()
+            self.partitions = None
+
+    def result(self) -> Tuple[List[Any], DataDict]:
+        if self.partitions is None:
+            return super().result()
+        self.spill()
+        out = []
+        for partition in self.partitions:
+            merged: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
+            for key, first, states in partition:
+                if key in merged:
+                    old_first, old_states = merged[key]
+                    merged[key] = (min(first, old_first), merge_data(self.agg, old_states, states))
+                else:
+                    merged[key] = (first, states)
+            for key, (first, states) in merged.items():
+                row = finalize_data(self.agg, states)
+                if len(row):
+                    out.append((first, key, row))
+        out.sort(key=lambda item: item[0])
+        return [key for _, key, _ in out], row_dicts_to_data([row for _, _, row in out])
@@ -1,17 +1,52 @@
-from typing import List, MutableMapping, Optional
+"""SQLite reading and writing. sqlite_utils is imported on first use."""
+
+from typing import Any, Generator, List, MutableMapping, Optional
 
-from sqlite_utils import Database
-from sqlite_utils.db import Table
 from tinytim.rows import iterrows, row_dicts_to_data
+from tinytim.utils import combine_names_rows
+
+from tinytable.intern import InternOption, interned_rows, interner
 
 
 def get_table_names(path: str) -> List[str]:
+    from sqlite_utils import Database
+
     return Database(path).table_names()
 
 
-def read_sqlite_table(path: str, table_name: str) -> dict:
+def read_sqlite_table(path: str, table_name: str, intern_strings: InternOption = False) -> dict:
+    from sqlite_utils import Database
+
     db = Database(path)
-    return row_dicts_to_data(list(db[table_name].rows))
+    return row_dicts_to_data(list(interned_rows(db[table_name].rows, interner(intern_strings))))
+
+
+def chunk_cursor(cursor: Any, chunksize: int, intern_strings: InternOption = False) -> Generator[dict, None, None]:
+    """
+    Read chunks of table object from an executed DB-API cursor.
+    Only chunksize rows are fetched at a time.
+    Pass intern_strings to share repeated str values across all chunks.
+    """
+    column_names = [description[0] for description in cursor.description]
+    strings = interner(intern_strings)
+    while True:
+        rows = cursor.fetchmany(chunksize)
+        if not rows:
+            return
+        yield combine_names_rows(column_names, list(interned_rows(rows, strings, column_names)))
+
+
+def chunk_sqlite_table(path: str, table_name: str, chunksize: int, intern_strings: InternOption = False) -> Generator[dict, None, None]:
+    """
+    Read chunks of table object from sqlite database table.
+    """
+    from sqlite_utils import Database
+
+    db = Database(path)
+    try:
+        yield from chunk_cursor(db.execute(f"select * from [{table_name}]"), chunksize, intern_strings)
+    finally:
+        db.close()
 
 
 def data_to_sqlite_table(
@@ -29,6 +64,9 @@ def data_to_sqlite_table(
     Set append_records = True to insert records
     into existing table.
     """
+    from sqlite_utils import Database
+    from sqlite_utils.db import Table
+
     db = Database(path)
     records = [d for _, d in iterrows(data)]
     table = db.table(table_name)
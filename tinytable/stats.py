@@ -0,0 +1,105 @@
+"""Exact quantiles and summary statistics of numeric columns.
+
+Each column is sorted once (or partitioned once at every needed position
+for NumPy arrays) and all requested quantiles are read from that
+ordering, instead of sorting per statistic. None values are skipped and
+columns with other non-numeric values are left out.
+"""
+
+import math
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import tinytable.buffers as buffers
+
+Quantile = Union[float, Sequence[float]]
+
+DESCRIBE_STATS = ("count", "mean", "std", "min", "25%", "50%", "75%", "max")
+
+
+def numeric_values(values: Sequence[Any]) -> List[Any]:
+    """Non-None values, raising TypeError if any are not numbers."""
+    out = [value for value in buffers.to_list(values) if value is not None]
+    for value in out:
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"quantiles need numbers, not {type(value).__name__}")
+    return out
+
+
+def validate_quantiles(qs: Sequence[float]) -> None:
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError("quantiles must be between 0 and 1")
+
+
+def sorted_quantiles(ordered: Sequence[Any], qs: Sequence[float]) -> List[Any]:
+    """Quantiles of sorted values, interpolating linearly between the two nearest values."""
+    out = []
+    last = len(ordered) - 1
+    for q in qs:
+        position = q * last
+        lower = math.floor(position)
+        fraction = position - lower
+        value = ordered[lower]
+        if fraction:
+            value = value + (ordered[lower + 1] - value) * fraction
+        out.append(value)
+    return out
+
+
+def quantiles(values: Sequence[Any], qs: Sequence[float]) -> Optional[List[Any]]:
+    """Quantiles qs of values in one sort (one partition for arrays),
+    None if there are no values.
+    """
+    validate_quantiles(qs)
+    if buffers.is_array(values) and values.dtype.kind in "iuf":  # type: ignore[attr-defined]
+        if len(values) == 0:
+            return None
+        return buffers.numpy().quantile(values, list(qs)).tolist()
+    ordered = numeric_values(values)
+    if not ordered:
+        return None
+    ordered.sort()
+    return sorted_quantiles(ordered, qs)
+
+
+def quantile_data(data: Mapping[str, Sequence[Any]], q: Quantile = 0.5) -> Dict[str, Any]:
+    """Quantile q (or list of quantiles for a sequence q) of each numeric column of data."""
+    single = isinstance(q, (int, float))
+    qs: Sequence[float] = [q] if single else q  # type: ignore[list-item,assignment]
+    out = {}
+    for column_name, values in data.items():
+        try:
+            result = quantiles(values, qs)
+        except TypeError:
+            continue
+        if result is not None:
+            out[column_name] = result[0] if single else result
+    return out
+
+
+def describe_values(values: Sequence[Any]) -> Optional[Dict[str, Any]]:
+    """count, mean, std, min, quartiles and max of values from one sort,
+    None if there are no values.
+    """
+    ordered = numeric_values(values)
+    if not ordered:
+        return None
+    ordered.sort()
+    count = len(ordered)
+    mean = math.fsum(ordered) / count
+    std = math.sqrt(math.fsum((value - mean) ** 2 for value in ordered) / (count - 1)) if count > 1 else None
+    lower, middle, upper = sorted_quantiles(ordered, (0.25, 0.5, 0.75))
+    return {"count": count, "mean": mean, "std": std, "min": ordered[0], "25%": lower, "50%": middle, "75%": upper, "max": ordered[-1]}
+
+
+def describe_data(data: Mapping[str, Sequence[Any]]) -> Dict[str, Dict[str, Any]]:
+    """{column name: describe_values} of each numeric column of data."""
+    out = {}
+    for column_name, values in data.items():
+        try:
+            described = describe_values(values)
+        except TypeError:
+            continue
+        if described is not None:
+            out[column_name] = described
+    return out
@@ -0,0 +1,326 @@
+"""Lazy pipelines of Table operations over a stream of Table chunks.
+
+A TableStream never holds more than one chunk in memory: operations are
+recorded and applied chunk by chunk when the stream is consumed by an
+aggregation or a sink.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from tinytim.rows import row_dicts_to_data
+
+import tinytable as tt
+import tinytable.csv as csv
+import tinytable.sqlite as sqlite
+from tinytable.aggregate import (
+    Accumulator,
+    Aggregation,
+    GroupAccumulator,
+    SortedGroupAccumulator,
+    approx_quantile_aggregation,
+    get_aggregation,
+)
+from tinytable.combine import concat
+from tinytable.dedupe import SeenKeys, row_keys
+from tinytable.group import key_runs
+from tinytable.intern import InternOption
+from tinytable.sketch import DEFAULT_K
+from tinytable.sort import Ascending, external_sort
+from tinytable.spill import DEFAULT_MEMORY_LIMIT, SpillGroupAccumulator
+from tinytable.types import DataMapping
+
+if TYPE_CHECKING:
+    from tinytable.filter import Filter
+    from tinytable.table import Table
+
+Chunk = Union["Table", DataMapping]
+
+
+class Chunks:
+    """Re-iterable source of chunks.
+    Calls factory for a fresh iterator every time it is iterated,
+    so a stream over a file can be consumed more than once.
+    """
+
+    def __init__(self, factory: Callable[[], Iterable[Chunk]]) -> None:
+        self.factory = factory
+
+    def __iter__(self) -> Iterator[Chunk]:
+        return iter(self.factory())
+
+
+class TableStream:
+    """Sequence of Table chunks with a Table-like vocabulary.
+
+    Built from read_csv(path, chunksize=n), read_sqlite(path, name, chunksize=n),
+    a sqlite cursor or any iterable of Tables (or data mappings).
+    """
+
+    def __init__(self, chunks: Iterable[Chunk]) -> None:
+        self.chunks = chunks
+
+    @classmethod
+    def from_csv(
+        cls, path: str, chunksize: int, names: Optional[Sequence[str]] = None, intern_strings: InternOption = False
+    ) -> TableStream:
+        """Stream chunks of chunksize rows from csv file at path."""
+        return cls(Chunks(lambda: csv.chunk_csv_file(path, chunksize, names=names, intern_strings=intern_strings)))
+
+    @classmethod
+    def from_sqlite(cls, path: str, table_name: str, chunksize: int, intern_strings: InternOption = False) -> TableStream:
+        """Stream chunks of chunksize rows from sqlite table."""
+        return cls(Chunks(lambda: sqlite.chunk_sqlite_table(path, table_name, chunksize, intern_strings)))
+
+    @classmethod
+    def from_cursor(cls, cursor: Any, chunksize: int, intern_strings: InternOption = False) -> TableStream:
+        """Stream chunks of chunksize rows from an executed DB-API cursor.
+        A cursor can only be consumed once.
+        """
+        return cls(sqlite.chunk_cursor(cursor, chunksize, intern_strings))
+
+    def __iter__(self) -> Iterator[Table]:
+        for chunk in self.chunks:
+            yield chunk if isinstance(chunk, tt.Table) else tt.Table(chunk)
+
+    def __repr__(self) -> str:
+        return f"TableStream({self.chunks!r})"
+
+    def pipe(self, func: Callable[[Table], Table]) -> TableStream:
+        """Return new TableStream with func applied to each chunk."""
+        return TableStream(Chunks(lambda: (func(chunk) for chunk in self)))
+
+    def filter(self, predicate: Callable[[Table], Union[Filter, Sequence[bool]]]) -> TableStream:
+        """Keep rows where predicate(chunk) is True.
+
+        Example
+        -------
+        >>> stream.filter(lambda tbl: tbl['age'] >= 18)
+        """
+        return self.pipe(lambda chunk: chunk.filter(predicate(chunk)))  # type: ignore[arg-type]
+
+    def select(self, column_names: Sequence[str]) -> TableStream:
+        """Keep only column_names columns."""
+        names = list(column_names)
+        return self.pipe(lambda chunk: chunk.only_columns(names))
+
+    def map(self, func: Callable[[Table], Table]) -> TableStream:
+        """Replace each chunk with func(chunk)."""
+        return self.pipe(func)
+
+    def with_column(self, column_name: str, values: Union[Callable[[Table], Any], Any]) -> TableStream:
+        """Add or replace column_name with values.
+        values can be a function of each chunk returning the column values.
+
+        Example
+        -------
+        >>> stream.with_column('age_months', lambda tbl: tbl['age'] * 12)
+        """
+
+        def add_column(chunk: Table) -> Table:
+            new_values = values(chunk) if callable(values) else values
+            return chunk.edit_column(column_name, new_values, inplace=False)  # type: ignore[return-value]
+
+        return self.pipe(add_column)
+
+    def head(self, n: int = 5) -> Table:
+        """Return Table of the first n rows, reading only as many chunks as needed."""
+        chunks: List[Table] = []
+        remaining = n
+        if remaining <= 0:
+            return _concat_chunks(chunks)
+        for chunk in self:
+            chunk = chunk.head(remaining)
+            remaining -= len(chunk)
+            chunks.append(chunk)
+            if remaining <= 0:
+                break
+        return _concat_chunks(chunks)
+
+    def to_table(self) -> Table:
+        """Collect every chunk into one Table."""
+        return _concat_chunks(self)
+
+    def aggregate(self, name: Union[str, Aggregation]) -> dict:
+        """Aggregate each column over every chunk with named aggregation."""
+        acc = Accumulator(get_aggregation(name))
+        for chunk in self:
+            acc.update(chunk._data)
+        return acc.result()
+
+    def sum(self) -> dict:
+        return self.aggregate("sum")
+
+    def count(self) -> dict:
+        return self.aggregate("count")
+
+    def mean(self) -> dict:
+        return self.aggregate("mean")
+
+    def min(self) -> dict:
+        return self.aggregate("min")
+
+    def max(self) -> dict:
+        return self.aggregate("max")
+
+    def approx_nunique(self) -> dict:
+        """Approximate distinct count of each column, merging a HyperLogLog per chunk."""
+        return self.aggregate("approx_nunique")
+
+    def approx_quantile(self, q: Union[float, Sequence[float]] = 0.5, k: int = DEFAULT_K) -> dict:
+        """Approximate quantile/s of each numeric column, merging a QuantileSketch per chunk."""
+        return self.aggregate(approx_quantile_aggregation(q, k))
+
+    def drop_duplicates(
+        self, subset: Optional[Union[str, Sequence[str]]] = None, max_keys: Optional[int] = None, spill: bool = False
+    ) -> TableStream:
+        """Stream without rows repeating the subset column values (all by default) of an earlier row,
+        in this or an earlier chunk.
+        Pass max_keys to hold at most that many seen keys in memory: older keys are then
+        forgotten, or with spill=True moved to a temporary database file.
+        """
+
+        def chunks() -> Iterator[Table]:
+            seen = SeenKeys(max_keys, spill)
+            try:
+                for chunk in self:
+                    keep = [i for i, key in enumerate(row_keys(chunk._data, subset)) if seen.add(key)]
+                    if keep:
+                        yield chunk if len(keep) == len(chunk) else chunk.filter_by_indexes(keep)
+            finally:
+                seen.close()
+
+        return TableStream(Chunks(chunks))
+
+    def groupby(self, by: Union[str, Sequence[str]], memory_limit: Optional[int] = None, sorted: bool = False) -> StreamGroup:
+        """Group rows of every chunk by column/s by.
+        Pass memory_limit (bytes) to spill partial group states to disk
+        when there are too many groups to hold in memory.
+        Pass sorted=True if rows are sorted by the by columns (e.g. an ORDER BY
+        query) to hold only the current group, carried over between chunks.
+        """
+        return StreamGroup(self, by, memory_limit, sorted)
+
+    def sort_values(
+        self,
+        by: Union[str, Sequence[str]],
+        ascending: Ascending = True,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        chunksize: int = 10_000,
+    ) -> TableStream:
+        """Return stream of chunksize row Tables sorted by column/s by.
+
+        Uses an external merge sort: sorted runs of at most memory_limit
+        bytes are spilled to temporary files, then merged.
+        Missing values (None) sort last and chunk labels are dropped.
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        return TableStream(Chunks(lambda: external_sort((chunk._data for chunk in self), names, ascending, memory_limit, chunksize)))
+
+    def to_csv(self, path: str) -> None:
+        """Save every chunk in one csv file at path."""
+        csv.data_chunks_to_csv_file((chunk._data for chunk in self), path)
+
+    def to_sqlite(
+        self, path: str, table_name: str, primary_key: Optional[str] = None, replace_table: bool = False, append_records=False
+    ) -> None:
+        """Save every chunk in one sqlite table."""
+        for chunk in self:
+            sqlite.data_to_sqlite_table(chunk._data, path, table_name, primary_key, replace_table, append_records)
+            replace_table = False
+            append_records = True
+
+
+class StreamGroup:
+    """Returned by TableStream groupby method.
+    Aggregations merge partial results per group key chunk by chunk,
+    holding one aggregated state per group instead of the group rows,
+    spilling states to disk past memory_limit bytes.
+    With sorted=True, only the current group's state or rows are held.
+    """
+
+    def __init__(
+        self, stream: TableStream, by: Union[str, Sequence[str]], memory_limit: Optional[int] = None, sorted: bool = False
+    ) -> None:
+        self.stream = stream
+        self.by = by
+        self.memory_limit = memory_limit
+        self.sorted = sorted
+
+    def __iter__(self) -> Iterator[Tuple[Any, Table]]:
+        """Yield (key, Table) of each group of a sorted stream as soon as its key changes."""
+        if not self.sorted:
+            raise ValueError("only groups of a sorted stream can be iterated, use groupby(by, sorted=True)")
+        key: Any = None
+        parts: List[Table] = []
+        for chunk in self.stream:
+            for run_key, start, stop in key_runs(chunk._data, self.by):
+                if parts and run_key != key:
+                    yield key, _concat_chunks(parts)
+                    parts = []
+                key = run_key
+                parts.append(chunk.iloc[start:stop])
+        if parts:
+            yield key, _concat_chunks(parts)
+
+    def aggregate_stream(self, name: Union[str, Aggregation]) -> TableStream:
+        """Stream of Tables of the groups of a sorted stream aggregated with named aggregation,
+        one Table of the groups finished by each chunk, labeled by group key.
+        """
+        if not self.sorted:
+            raise ValueError("only a sorted stream can be aggregated incrementally, use groupby(by, sorted=True)")
+        return TableStream(Chunks(lambda: self._sorted_aggregates(get_aggregation(name))))
+
+    def _sorted_aggregates(self, agg: Aggregation) -> Iterator[Table]:
+        acc = SortedGroupAccumulator(agg, self.by)
+        for chunk in self.stream:
+            finished = acc.update(chunk._data)
+            if finished:
+                yield _group_rows_table(finished)
+        finished = acc.flush()
+        if finished:
+            yield _group_rows_table(finished)
+
+    def aggregate(self, name: Union[str, Aggregation]) -> Table:
+        if self.sorted:
+            return _concat_chunks(self.aggregate_stream(name))
+        agg = get_aggregation(name)
+        if self.memory_limit is None:
+            acc = GroupAccumulator(agg, self.by)
+        else:
+            acc = SpillGroupAccumulator(agg, self.by, self.memory_limit)
+        try:
+            for chunk in self.stream:
+                acc.update(chunk._data)
+            labels, data = acc.result()
+        finally:
+            if isinstance(acc, SpillGroupAccumulator):
+                acc.close()
+        return tt.Table(data, labels)
+
+    def sum(self) -> Table:
+        return self.aggregate("sum")
+
+    def count(self) -> Table:
+        return self.aggregate("count")
+
+    def mean(self) -> Table:
+        return self.aggregate("mean")
+
+    def min(self) -> Table:
+        return self.aggregate("min")
+
+    def max(self) -> Table:
+        return self.aggregate("max")
+
+
+def _group_rows_table(rows: List[Tuple[Any, Dict[str, Any]]]) -> Table:
+    return tt.Table(row_dicts_to_data([row for _, row in rows]), [key for key, _ in rows])
+
+
+def _concat_chunks(chunks: Iterable[Table]) -> Table:
+    table = concat(chunks)
+    if not table.labels:
+        table.labels = None
+    return table
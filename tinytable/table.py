@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import copy
+import functools
+import operator
+from contextlib import contextmanager
 from enum import Enum
 from typing import (
     Any,
     Callable,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
     Mapping,
     Optional,
     Sequence,
+    Set,
     Union,
+    overload,
 )
 
 import tinytim.copy as data_copy
@@ -26,18 +32,34 @@ import tinytim.na as na
 import tinytim.rows as rows
 import tinytim.utils as utils
 from hasattrs import has_mapping_attrs
-from tabulate import tabulate
 
+import tinytable.buffers as buffers
 import tinytable.column as column
+import tinytable.combine as combine
+import tinytable.counts as counts
 import tinytable.csv as csv
+import tinytable.dedupe as dedupe
+import tinytable.display as display
+import tinytable.dtypes as dtypes
 import tinytable.excel as excel
+import tinytable.reshape as reshape
 import tinytable.row as row
+import tinytable.sketch as sketch
+import tinytable.sort as sort
+import tinytable.spill as spill
 import tinytable.sqlite as sqlite
+import tinytable.stats as stats
+import tinytable.window as windows
+from tinytable.bitmap import Bitmap
+from tinytable.categorical import encode_data
 from tinytable.column import Column
 from tinytable.filter import Filter
-from tinytable.group import Group
+from tinytable.group import Group, RunGroups, group_indexes, key_runs
 from tinytable.iloc import Iloc
+from tinytable.intern import InternOption
+from tinytable.loc import Loc
 from tinytable.row import Row
+from tinytable.stream import TableStream
 from tinytable.types import DataDict, DataMapping, data_dict
 
 ColumnNames = Sequence[str]
@@ -56,6 +78,13 @@ class Table:
     A pure Python version of Pandas DataFrame.
     """
 
+    # True inside batch_edit, when single value edits skip buffer and null tracking checks.
+    _batching = False
+    # Tracked null bitmaps (see _validity) and whether Table.data was handed out since they were made.
+    _bitmaps: Optional[Dict[str, Bitmap]] = None
+    _bitmaps_stale = False
+    _row_count: Optional[int]
+
     def __init__(
         self,
         data: Union[DataMapping, Sequence[Sequence], None] = None,
@@ -69,10 +98,164 @@ class Table:
         """
         data = {} if data is None else data
         data = self._transform_data_input(data, columns)
-        self.data: DataDict = data
+        self.data = data
         self._validate()
         self.labels: Union[None, list] = labels if labels is None else list(labels)
 
+    @classmethod
+    def _from_data(
+        cls,
+        data: DataDict,
+        labels: Optional[list] = None,
+        row_count: Optional[int] = None,
+        shared: Iterable[str] = (),
+        validity: Optional[Dict[str, Bitmap]] = None,
+    ) -> Table:
+        """Wrap new column lists known to be of equal length,
+        skipping the copy and validation done by Table().
+        Pass shared column names whose lists are also used by another Table.
+        """
+        table = cls.__new__(cls)
+        table._data = data
+        table._row_count = row_count
+        table._shared = set(shared)
+        table._validity = validity
+        table.labels = labels
+        return table
+
+    def _share(self, column_names: Iterable[str]) -> DataDict:
+        """Return {column_name: list} of column_names without copying the lists.
+
+        Both Tables then copy a shared list before changing it in place
+        (copy-on-write), so neither sees the other's changes.
+        """
+        data = {str(name): self._data[name] for name in column_names}
+        self._shared.update(data)
+        return data
+
+    def _writable(self, column_name: str) -> list:
+        """Return column_name's list, copied first if it is shared."""
+        if column_name in self._shared:
+            self._shared.discard(column_name)
+            self._data[column_name] = buffers.copy(self._data[column_name])
+        return self._data[column_name]
+
+    def _writable_all(self) -> None:
+        for column_name in list(self._shared):
+            self._writable(column_name)
+
+    @property
+    def data(self) -> DataDict:
+        """Column data {column_name: list[values]}.
+
+        The dict and lists are the Table's own, so they may be changed
+        directly: lists shared with other Tables are copied first, the
+        row count is recounted and tracked null bitmaps are rebuilt
+        the next time they are used.
+        """
+        self._writable_all()
+        self._row_count = None
+        if self._bitmaps is not None:
+            self._bitmaps_stale = True
+        return self._data
+
+    @data.setter
+    def data(self, data: DataDict) -> None:
+        self._data = data
+        self._row_count = None
+        self._shared: Set[str] = set()
+        self._validity = None
+
+    @property
+    def _validity(self) -> Optional[Dict[str, Bitmap]]:
+        """Tracked null bitmaps, rebuilt if Table.data was handed out since they were made."""
+        if self._bitmaps_stale:
+            self._bitmaps = {name: Bitmap.from_values(values) for name, values in self._data.items()}
+            self._bitmaps_stale = False
+        return self._bitmaps
+
+    @_validity.setter
+    def _validity(self, validity: Optional[Dict[str, Bitmap]]) -> None:
+        self._bitmaps = validity
+        self._bitmaps_stale = False
+
+    def track_nulls(self) -> None:
+        """Keep a validity Bitmap of the non-None values of each column.
+
+        Table methods keep the bitmaps up to date. isna, notna, dropna and
+        null_count then read the bitmaps instead of checking every value,
+        and aggregations skip None values.
+        Bitmaps are rebuilt after Table.data is changed directly.
+        """
+        self._validity = {name: Bitmap.from_values(values) for name, values in self._data.items()}
+
+    @property
+    def validity(self) -> Optional[Dict[str, Bitmap]]:
+        """Validity Bitmap of each column, None unless track_nulls was called."""
+        return self._validity
+
+    def _derive_validity(
+        self, select: Callable[[Bitmap], Bitmap], column_names: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Bitmap]]:
+        """Validity bitmaps of a derived Table, None if nulls are not tracked."""
+        validity = self._validity
+        if validity is None:
+            return None
+        names = validity if column_names is None else column_names
+        return {str(name): select(validity[name]) for name in names}
+
+    @property
+    def backend(self) -> str:
+        """"numpy" if any column is held as a NumPy array, else "python"."""
+        return "numpy" if any(buffers.is_array(values) for values in self._data.values()) else "python"
+
+    def to_backend(self, backend: str) -> Table:
+        """Return new Table with columns held by backend.
+
+        "numpy" holds columns of all bool, int or float values as NumPy arrays,
+        vectorizing Column arithmetic, comparisons, aggregations and row gathers.
+        Arithmetic then follows NumPy rules (fixed width integers,
+        division by zero gives inf or nan).
+        "python" converts arrays back to lists of the same values.
+        """
+        buffers.validate_backend(backend)
+        convert = buffers.to_array if backend == "numpy" else buffers.to_list
+        data = {name: convert(values) for name, values in self._data.items()}
+        shared = [name for name, values in data.items() if values is self._data[name]]
+        self._shared.update(shared)
+        return Table._from_data(data, copy.copy(self.labels), self._row_count, shared, self._derive_validity(Bitmap.copy))
+
+    def _list_data(self) -> DataDict:
+        """Column data with any arrays converted to lists, for list only functions."""
+        if self.backend == "python":
+            return self._data
+        return {name: buffers.to_list(values) for name, values in self._data.items()}
+
+    def _aggregate(self, name: str, func: Callable[[DataMapping], dict]) -> dict:
+        """Aggregate each column, using NumPy reductions for array columns
+        and skipping None values of tracked columns.
+        """
+        data: DataMapping = self._data
+        if self._validity is not None:
+            validity = self._validity
+            data = {
+                column_name: values if buffers.is_array(values) else validity[column_name].compress(values)
+                for column_name, values in data.items()
+            }
+        if self.backend == "python":
+            return func(data)
+        reduced = {}
+        rest = {}
+        for column_name, values in data.items():
+            value = buffers.reduce(values, name) if buffers.is_array(values) else None
+            if value is None:
+                rest[column_name] = buffers.to_list(values)
+            else:
+                reduced[column_name] = value
+        result = func(rest)
+        return {column_name: reduced[column_name] if column_name in reduced else result[column_name]
+                for column_name in self._data if column_name in reduced or column_name in result}
+
     def _transform_data_input(self, data: Union[DataMapping, Sequence[Sequence]], columns: Optional[ColumnNames] = None) -> Dict[str, list]:
         if columns is not None and not has_mapping_attrs(data):
             # data is a sequence of sequences and column names passed
@@ -90,16 +273,18 @@ class Table:
         return Table(data, columns)
 
     def __len__(self) -> int:
-        if not self.data:
-            return 0
-        return features.row_count(self.data)
+        row_count = self._row_count
+        data = self._data
+        # Recount if a column list was resized outside Table methods.
+        if row_count is None or (data and len(next(iter(data.values()))) != row_count):
+            row_count = self._row_count = features.row_count(data) if data else 0
+        return row_count
 
     def __repr__(self) -> str:
-        index: Union[bool, list[str]] = True if self.labels is None else self.labels
-        return tabulate(self, headers=self.columns, tablefmt="grid", showindex=index)
+        return display.format_grid(self.columns, self._data.__getitem__, len(self), self.labels)
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self.data)
+        return iter(self._data)
 
     def __getitem__(self, key: Union[str, int]) -> Union[column.Column, Row, Table]:
         """
@@ -117,13 +302,11 @@ class Table:
             return self.column(str(key))
         # tbl[1] -> Row
         if isinstance(key, int):
-            index: int = self._convert_index(key)
-            self._validate_index(index)
-            return self.row(index)
+            return self.row(self._position(key))
         # tbl[1:4] -> Table
         if isinstance(key, slice):
             validate_int_slice(key)
-            return self.filter_by_indexes(list(utils.slice_to_range(key, len(self))))
+            return self.filter_by_indexes(utils.slice_to_range(key, len(self)))
         if isinstance(key, list):
             if utils.all_bool(key):
                 # tbl[[True, False, True, True]] -> Table
@@ -165,16 +348,16 @@ class Table:
 
     @property
     def shape(self) -> tuple[int, int]:
-        return features.shape(self.data)
+        return features.shape(self._data)
 
     @property
     def size(self) -> int:
-        return features.size(self.data)
+        return features.size(self._data)
 
     @property
     def columns(self) -> tuple[str, ...]:
         """Column names."""
-        return tuple(features.column_names(self.data))
+        return tuple(features.column_names(self._data))
 
     @columns.setter
     def columns(self, values: List[str]) -> None:
@@ -183,47 +366,58 @@ class Table:
 
     @property
     def index(self) -> Column:
-        return Column(features.index(self.data), None, self, self.labels)
+        return Column(features.index(self._data), None, self, self.labels)
 
     @property
     def values(self) -> tuple[tuple[Any, ...], ...]:
-        return rows.values(self.data)
+        return rows.values(self._list_data())
 
     @property
     def iloc(self) -> Iloc:
         """Purely integer-location based indexing for selection by position."""
         return Iloc(self)
 
+    @property
+    def loc(self) -> Loc:
+        """Label and mask based indexing: tbl.loc[rows, columns].
+        Setting applies to all selected rows of a column in one pass.
+        """
+        return Loc(self)
+
     def filter(self, f: Filter) -> Table:
+        mask = getattr(f, "values", None)
+        if buffers.is_array(mask):
+            return self.filter_by_indexes(buffers.numpy().flatnonzero(mask))
         indexes = filter.indexes_from_filter(list(f))
         return self.filter_by_indexes(indexes)
 
     def only_columns(self, column_names: List[str]) -> Table:
         """Return new Table with only column_names Columns."""
-        d = filter.only_columns(self.data, column_names)
-        return Table(data_dict(d), self.labels)
+        d = self._share(column_names)
+        return Table._from_data(d, copy.copy(self.labels), self._row_count if d else 0, d, self._derive_validity(Bitmap.copy, d))
 
-    def _convert_index(self, index: int) -> int:
+    def _position(self, index: int) -> int:
+        """Return validated non-negative row position of index,
+        negative index counting from the end.
+        """
+        row_count = len(self)
         if index < 0:
-            return len(self) + index
-        return index
-
-    def _validate_index(self, index: int) -> None:
-        if len(self) == 0:
+            index += row_count
+        if 0 <= index < row_count:
+            return index
+        if row_count == 0:
             raise IndexError("row index out of range (empty Table)")
-        upper_range = len(self) - 1
-        if index > len(self) - 1 or index < 0:
-            raise IndexError(f"row index {index} out of range (0-{upper_range})")
+        raise IndexError(f"row index {index} out of range (0-{row_count - 1})")
 
     def _validate(self) -> bool:
         count = None
-        for key in self.data:
-            col_count = len(self.data[key])
+        for values in self._data.values():
+            col_count = len(values)
             if count is None:
                 count = col_count
-            if count != col_count:
+            elif count != col_count:
                 raise ValueError("All columns must be of the same length")
-            count = col_count
+        self._row_count = 0 if count is None else count
         return True
 
     def _get_label(self, index: int) -> Union[None, List]:
@@ -231,169 +425,476 @@ class Table:
 
     def row(self, index: int) -> Row:
         label = self._get_label(index)
-        return Row(rows.row_dict(self.data, index), index, self, label)
+        return Row.view(self, index, label)
 
     def column(self, column_name: str) -> Column:
-        return Column(features.column_values(self.data, column_name), column_name, self, self.labels)
+        if column_name not in self._data:
+            raise KeyError(column_name)
+        return Column.view(self, column_name, self.labels)
 
     def drop_column(self, column_name: str, inplace=True) -> Union[None, Table]:
         if inplace:
-            edit.drop_column_inplace(self.data, column_name)
+            edit.drop_column_inplace(self._data, column_name)
+            self._shared.discard(column_name)
+            if self._validity is not None:
+                self._validity.pop(column_name, None)
+            if not self._data:
+                self._row_count = 0
             return None
         else:
-            return Table(edit.drop_column(self.data, column_name), self.labels)
+            data = self._share(name for name in self._data if name != column_name)
+            validity = self._derive_validity(Bitmap.copy, data)
+            return Table._from_data(data, copy.copy(self.labels), self._row_count if data else 0, data, validity)
 
     def drop_row(self, index: int, inplace=True) -> Union[None, Table]:
         if inplace:
-            edit.drop_row_inplace(self.data, index)
+            self._writable_all()
+            if self.backend == "python":
+                edit.drop_row_inplace(self._data, index)
+            else:
+                for column_name, values in self._data.items():
+                    self._data[column_name] = buffers.delete(values, index)
+            if self._validity is not None:
+                for bitmap in self._validity.values():
+                    bitmap.delete(index)
             if self.labels is not None:
                 edit.drop_label_inplace(self.labels, index)
+            if self._row_count:
+                self._row_count -= 1
             return None
         else:
-            new_labels = None if self.labels is None else edit.drop_label(self.labels, index)
-            return Table(edit.drop_row(self.data, index), new_labels)
+            position = self._position(index)
+            return self.filter_by_indexes([i for i in range(len(self)) if i != position])
+
+    def drop_rows(self, indexes: Iterable[int], inplace=True) -> Union[None, Table]:
+        """Drop the rows at indexes (negative indexes counting from the end).
+        Every column and the labels are compacted once, instead of
+        shifting the later rows down for each dropped row.
+        """
+        keep = [True] * len(self)
+        for index in indexes:
+            keep[self._position(index)] = False
+        return self._keep_rows(keep, inplace)
+
+    def drop(self, mask: Union[Filter, Sequence[bool]], inplace=True) -> Union[None, Table]:
+        """Drop the rows where mask (a Filter or a bool per row) is True,
+        compacting every column and the labels once.
+        """
+        values = getattr(mask, "values", None)
+        drops = values.tolist() if buffers.is_array(values) else list(mask)  # type: ignore[union-attr]
+        if len(drops) != len(self):
+            raise ValueError("mask length must match rows length.")
+        return self._keep_rows([not drop for drop in drops], inplace)
+
+    def _keep_rows(self, keep: List[bool], inplace: bool) -> Union[None, Table]:
+        indexes = [i for i, kept in enumerate(keep) if kept]
+        if inplace:
+            if len(indexes) < len(keep):
+                self.filter_by_indexes_inplace(indexes)
+            return None
+        return self.filter_by_indexes(indexes)
 
     def keys(self) -> tuple[str, ...]:
         return self.columns
 
     def itercolumns(self) -> Generator[Column, None, None]:
-        return column.itercolumns(self.data, self, self.labels)
+        return column.itercolumns(self._data, self, self.labels)
 
     def iterrows(self) -> Generator[tuple[int, Row], None, None]:
-        return row.iterrows(self.data, self, self.labels)
+        return row.iterrows(self._data, self, self.labels)
 
     def iteritems(self) -> Generator[tuple[str, Column], None, None]:
-        return column.iteritems(self.data, self)
+        return column.iteritems(self._data, self)
 
     def itertuples(self) -> Generator[tuple, None, None]:
-        return rows.itertuples(self.data)
+        return rows.itertuples(self._list_data())
 
     def edit_row(self, index: int, values: Union[Mapping, Sequence], inplace=True) -> Union[None, Table]:
         if inplace:
-            if isinstance(values, Mapping):
-                edit.edit_row_items_inplace(self.data, index, values)
+            if self.backend == "numpy" or self._validity is not None:
+                if isinstance(values, Sequence):
+                    if len(values) != len(self._data):
+                        raise AttributeError("values length must match columns length.")
+                    values = dict(zip(self._data, values))
+                for column_name, value in values.items():
+                    self.edit_value(column_name, index, value)
+            elif isinstance(values, Mapping):
+                for column_name in values:
+                    self._writable(column_name)
+                edit.edit_row_items_inplace(self._data, index, values)
             elif isinstance(values, Sequence):
-                edit.edit_row_values_inplace(self.data, index, values)
+                self._writable_all()
+                edit.edit_row_values_inplace(self._data, index, values)
             return None
         else:
-            if isinstance(values, Mapping):
-                data = edit.edit_row_items(self.data, index, values)
-            elif isinstance(values, Sequence):
-                data = edit.edit_row_values(self.data, index, values)
-            return Table(data, copy.copy(self.labels))
+            table = self.copy()
+            table.edit_row(index, values)
+            return table
+
+    def append_rows(self, rows: Iterable[Union[Mapping, Sequence]], labels: Optional[Sequence] = None) -> None:
+        """Append rows (Mappings or Sequences of values in column order) in place.
+        Mapping rows may add columns, filled with None for earlier rows.
+        Column lists grow in amortized constant time per row.
+        Pass labels for each row when the Table has labels.
+        """
+        rows = list(rows)
+        self._extend(combine.rows_to_data(rows, self.columns), len(rows), labels)
+
+    def append_table(self, other: Table) -> None:
+        """Append the rows of other in place, a column at a time.
+        Columns only in other are added, filled with None for earlier rows.
+        """
+        self._extend(other._data, len(other), other.labels if self.labels is not None else None)
+
+    def _extend(self, data: DataMapping, count: int, labels: Optional[Sequence]) -> None:
+        old_count = len(self)
+        if self.labels is not None:
+            if labels is None or len(labels) != count:
+                raise ValueError("labels must be passed for each appended row of a labeled Table.")
+            self.labels.extend(labels)
+        elif labels is not None:
+            raise ValueError("cannot append labels to a Table without labels.")
+        validity = self._validity
+        for column_name in list(self._data) + [name for name in data if name not in self._data]:
+            values = data.get(column_name)
+            if column_name in self._data:
+                column_values = self._writable(column_name)
+                if isinstance(column_values, list):
+                    column_values.extend([None] * count if values is None else buffers.to_list(values))
+                else:
+                    self._data[column_name] = buffers.concat([column_values, values], [old_count, count])
+            else:
+                self._data[column_name] = buffers.concat([None, values], [old_count, count])
+                if validity is not None:
+                    validity[column_name] = Bitmap.from_bools([False] * old_count)
+            if validity is not None:
+                validity[column_name].extend([False] * count if values is None else [v is not None for v in values])
+        self._row_count = old_count + count
 
     def edit_column(self, column_name: str, values: Sequence, inplace=True) -> Union[None, Table]:
         if inplace:
-            edit.edit_column_inplace(self.data, column_name, values)
+            array = values.data if isinstance(values, Column) else values
+            if buffers.is_array(array) and self._data and len(array) == len(self):
+                self._data[column_name] = buffers.copy(array)
+                self._shared.discard(column_name)
+            else:
+                if column_name in self._data:
+                    self._data[column_name] = buffers.to_list(self._writable(column_name))
+                edit.edit_column_inplace(self._data, column_name, values)
+            if self._validity is not None:
+                self._validity[column_name] = Bitmap.from_values(self._data[column_name])
             return None
         else:
-            return Table(edit.edit_column(self.data, column_name, values), copy.copy(self.labels))
+            table = self.copy()
+            table.edit_column(column_name, values)
+            return table
 
     def edit_value(self, column_name: str, index: int, value: Any, inplace=True) -> Union[None, Table]:
         if inplace:
-            edit.edit_value_inplace(self.data, column_name, index, value)
+            if self._batching:
+                self._writable(column_name)[index] = value
+                return None
+            self._data[column_name] = buffers.set_value(self._writable(column_name), index, value)
+            if self._validity is not None:
+                self._validity[column_name][index] = value is not None
             return None
         else:
-            return Table(edit.edit_value(self.data, column_name, index, value), copy.copy(self.labels))
+            table = self.copy()
+            table.edit_value(column_name, index, value)
+            return table
+
+    def edit_values(self, column_name: str, indexes: Iterable[int], values: Any, inplace=True) -> Union[None, Table]:
+        """Set column_name's value at each of indexes to values (one per index, or one value for all)
+        in one pass over the column, adding column_name filled with None if it is new.
+        """
+        if not inplace:
+            table = self.copy()
+            table.edit_values(column_name, indexes, values)
+            return table
+        positions = [self._position(index) for index in indexes]
+        values = buffers.to_list(values) if buffers.is_sequence(values) else [values] * len(positions)
+        if len(values) != len(positions):
+            raise ValueError("values length must match indexes length.")
+        if column_name not in self._data:
+            self._data[column_name] = [None] * len(self)
+            if self._validity is not None:
+                self._validity[column_name] = Bitmap.from_bools([False] * len(self))
+        column_values = self._writable(column_name)
+        if buffers.is_array(column_values) and all(buffers.fits(column_values, value) for value in values):
+            column_values[buffers.numpy().asarray(positions, dtype=buffers.numpy().intp)] = values
+        else:
+            if buffers.is_array(column_values):
+                column_values = self._data[column_name] = buffers.to_list(column_values)
+            for position, value in zip(positions, values):
+                column_values[position] = value
+        if self._validity is not None and not self._batching:
+            bitmap = self._validity[column_name]
+            for position, value in zip(positions, values):
+                bitmap[position] = value is not None
+        return None
+
+    def edit_rows(self, indexes: Iterable[int], values: Sequence[Union[Mapping, Sequence]]) -> None:
+        """Set the rows at indexes to values in place, a column at a time.
+        Each row of values is a Mapping of {column_name: value} or a Sequence of values in column order.
+        """
+        indexes = list(indexes)
+        if len(values) != len(indexes):
+            raise ValueError("values length must match indexes length.")
+        if all(isinstance(row_values, Mapping) for row_values in values):
+            for column_name in dict.fromkeys(name for row_values in values for name in row_values):
+                pairs = [(index, row_values[column_name]) for index, row_values in zip(indexes, values) if column_name in row_values]
+                self.edit_values(column_name, [index for index, _ in pairs], [value for _, value in pairs])
+            return
+        column_names = list(self._data)
+        rows = []
+        for row_values in values:
+            if not isinstance(row_values, Mapping):
+                if len(row_values) != len(column_names):
+                    raise AttributeError("values length must match columns length.")
+                row_values = dict(zip(column_names, row_values))
+            rows.append(row_values)
+        self.edit_rows(indexes, rows)
+
+    @contextmanager
+    def batch_edit(self) -> Iterator[Table]:
+        """Context for many single value edits (Column, Row or edit_value).
+
+        Columns are made writable lists once on entry, so each edit inside
+        is a plain list assignment. On exit, columns of bool, int or float
+        values go back to NumPy arrays if they were arrays, and validity
+        bitmaps of tracked nulls are rebuilt once.
+        """
+        if self._batching:
+            yield self
+            return
+        arrays = [column_name for column_name, values in self._data.items() if buffers.is_array(values)]
+        self._writable_all()
+        for column_name in arrays:
+            self._data[column_name] = buffers.to_list(self._data[column_name])
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            for column_name in arrays:
+                if column_name in self._data:
+                    self._data[column_name] = buffers.to_array(self._data[column_name])
+            if self._validity is not None:
+                self.track_nulls()
 
     def copy(self, deep=False) -> Table:
-        if deep:
-            return Table(data_copy.deepcopy_table(self.data), copy.deepcopy(self.labels))
-        return Table(data_dict(data_copy.copy_table(self.data)), copy.copy(self.labels))
+        """Return a copy of the Table.
 
-    def cast_column_as(self, column_name: str, data_type: Callable) -> None:
-        self.data[column_name] = [data_type(value) for value in self.data[column_name]]
+        Shallow copies share column lists with the original until either
+        Table changes a column (copy-on-write), values are not copied.
+        Deep copies copy every value.
+        """
+        if deep:
+            data = data_copy.deepcopy_table(self._data)
+            return Table._from_data(data, copy.deepcopy(self.labels), self._row_count, (), self._derive_validity(Bitmap.copy))
+        data = self._share(self._data)
+        return Table._from_data(data, copy.copy(self.labels), self._row_count, data, self._derive_validity(Bitmap.copy))
+
+    def astype(self, dtype: Union[dtypes.DType, Mapping[str, dtypes.DType]], errors: str = "raise") -> Table:
+        """Return new Table with columns converted to dtype.
+
+        Pass {column_name: dtype} to convert some columns, or one dtype for all.
+        dtype "category" dictionary encodes a column as a Categorical,
+        "object" converts it back to a list,
+        "int64", "float64" and "bool" store it as a NumPy array,
+        "boolean" parses strings like "yes" or "0" (bool keeps bool() meaning),
+        a type or function converts each value (int, float, bool and str keep None values).
+        errors="raise" raises on a value that cannot be converted,
+        "coerce" sets it to None and "ignore" leaves its column unchanged.
+        """
+        dtypes.validate_errors(errors)
+        column_dtypes = dict(dtype) if isinstance(dtype, Mapping) else dict.fromkeys(self._data, dtype)
+        for column_name in column_dtypes:
+            if column_name not in self._data:
+                raise KeyError(column_name)
+        table = self.copy()
+        for column_name, column_dtype in column_dtypes.items():
+            table._convert_column(column_name, column_dtype, errors)
+        return table
+
+    def cast_column_as(self, column_name: str, data_type: dtypes.DType, errors: str = "raise") -> None:
+        """Convert column_name to data_type in place, like astype."""
+        self._convert_column(column_name, data_type, errors)
+
+    def _convert_column(self, column_name: str, dtype: dtypes.DType, errors: str) -> None:
+        values = self._data[column_name]
+        converted = dtypes.convert(values, dtype, errors)
+        if converted is not values:
+            self._data[column_name] = converted  # type: ignore[assignment]
+            self._shared.discard(column_name)
+            if self._validity is not None:
+                self._validity[column_name] = Bitmap.from_values(buffers.to_list(converted))
 
     def replace_column_names(self, new_keys: Sequence[str]) -> None:
-        if len(new_keys) != len(self.data.keys()):
+        if len(new_keys) != len(self._data.keys()):
             raise ValueError("new_keys must be same len as dict keys.")
-        for new_key, old_key in zip(new_keys, self.data.keys()):
+        for new_key, old_key in zip(new_keys, self._data.keys()):
             if new_key != old_key:
-                self.data[new_key] = list(self.data[old_key])
-                del self.data[old_key]
+                self._data[new_key] = list(self._data[old_key])
+                del self._data[old_key]
+                self._shared.discard(old_key)
+                if self._validity is not None:
+                    self._validity[new_key] = self._validity.pop(old_key)
 
     def to_csv(self, path: str) -> None:
         """Save Table as csv at path."""
-        csv.data_to_csv_file(self.data, path)
+        csv.data_to_csv_file(self._list_data(), path)
 
     def to_excel(self, path: str, sheet_name: Optional[str] = None, replace_workbook: bool = False, replace_worksheet: bool = True) -> None:
         """Save Table in Excel Workbook."""
-        excel.data_to_excel_file(self.data, path, sheet_name, replace_workbook, replace_worksheet)
+        excel.data_to_excel_file(self._list_data(), path, sheet_name, replace_workbook, replace_worksheet)
 
     def to_sqlite(
         self, path: str, table_name: str, primary_key: Optional[str] = None, replace_table: bool = False, append_records=False
     ) -> None:
         """Save Table in sqlite database."""
-        sqlite.data_to_sqlite_table(self.data, path, table_name, primary_key, replace_table, append_records)
+        sqlite.data_to_sqlite_table(self._list_data(), path, table_name, primary_key, replace_table, append_records)
 
     def label_head(self, n: int = 5) -> Union[None, List]:
         return None if self.labels is None else self.labels[:n]
 
     def label_tail(self, n: int = 5) -> Union[None, List]:
-        return None if self.labels is None else self.labels[-n:]
+        return None if self.labels is None else self.labels[max(len(self.labels) - n, 0) :]
 
     def head(self, n: int = 5) -> Table:
-        return Table(data_dict(features.head(self.data, n)), self.label_head(n))
+        rows = slice(None, n)
+        return Table._from_data(self._slice_rows(rows), self.label_head(n), validity=self._derive_validity(lambda b: b.slice(rows)))
 
     def tail(self, n: int = 5) -> Table:
-        return Table(data_dict(features.tail(self.data, n)), self.label_tail(n))
+        rows = slice(max(len(self) - n, 0), None)
+        return Table._from_data(self._slice_rows(rows), self.label_tail(n), validity=self._derive_validity(lambda b: b.slice(rows)))
 
-    def nunique(self) -> dict[str, int]:
+    def _slice_rows(self, rows: slice) -> DataDict:
+        return {name: values[rows].copy() if buffers.is_array(values) else values[rows] for name, values in self._data.items()}
+
+    def nunique(self, approx: bool = False, precision: int = sketch.DEFAULT_PRECISION) -> dict[str, int]:
         """Count number of distinct values in each column.
         Return dict with number of distinct values.
+        Pass approx=True to estimate the counts with a fixed size HyperLogLog
+        per column (2**precision bytes) instead of a set of every distinct value.
         """
-        return utils.nunique(self.data)
+        if approx:
+            return sketch.approx_nunique_data(self._data, precision)
+        return utils.nunique(self._data)
 
-    def filter_by_indexes(self, indexes: Sequence[int]) -> Table:
-        """return only rows in indexes"""
-        labels = None if self.labels is None else filter.filter_list_by_indexes(self.labels, indexes)
-        data = data_dict(filter.filter_by_indexes(self.data, indexes))
-        return Table(data, labels=labels)
+    def approx_quantile(self, q: Union[float, Sequence[float]] = 0.5, k: int = sketch.DEFAULT_K) -> dict:
+        """Approximate quantile q (or list of quantiles for a sequence q) of each numeric column,
+        estimated with a QuantileSketch of about 3 * k values, skipping None values.
+        """
+        return sketch.approx_quantile_data(self._data, q, k)
+
+    def filter_by_indexes(self, indexes: Sequence[int], columns: Optional[Sequence[str]] = None) -> Table:
+        """return only rows in indexes, and only columns if passed.
+        Each selected column is gathered once straight from its buffer
+        (sliced for a range of consecutive indexes).
+        """
+        labels = None if self.labels is None else buffers.take(self.labels, indexes)
+        names = self._data if columns is None else columns
+        data = {str(name): buffers.take(self._data[name], indexes) for name in names}
+        validity = self._derive_validity(lambda b: b.take(indexes), data)
+        return Table._from_data(data, labels, len(indexes) if data else 0, (), validity)
 
     def filter_by_indexes_inplace(self, indexes: Sequence[int]) -> None:
         """return only rows in indexes"""
-        labels = None if self.labels is None else filter.filter_list_by_indexes(self.labels, indexes)
-        data = data_dict(filter.filter_by_indexes(self.data, indexes))
+        labels = None if self.labels is None else buffers.take(self.labels, indexes)
+        data = {name: buffers.take(values, indexes) for name, values in self._data.items()}
+        validity = self._derive_validity(lambda b: b.take(indexes))
         if len(data) == 0:
             self.labels = None
         self.labels = labels
         self.data = data
+        self._row_count = len(indexes) if data else 0
+        self._validity = validity
 
     def filter_by_columns(self, columns: Sequence[str]) -> Table:
-        data = data_dict(filter.filter_by_columns(self.data, columns))
-        return Table(data, labels=self.labels)
+        data = self._share(columns)
+        validity = self._derive_validity(Bitmap.copy, data)
+        return Table._from_data(data, copy.copy(self.labels), self._row_count if data else 0, data, validity)
 
     def filter_by_columns_inplace(self, columns: Sequence[str]) -> None:
-        data = data_dict(filter.filter_by_columns(self.data, columns))
+        data = {str(name): self._data[name] for name in columns}
+        row_count = self._row_count if data else 0
+        shared = self._shared.intersection(data)
+        validity = self._derive_validity(lambda b: b, data)
         self.data = data
-        if len(self.data) == 0:
+        self._row_count = row_count
+        self._shared = shared
+        self._validity = validity
+        if len(self._data) == 0:
             self.labels = None
 
     def sample(self, n, random_state=None) -> Table:
         """return random sample of rows"""
-        if not self.data:
+        if not self._data:
             raise ValueError("Sample larger than population")
-        indexes = filter.sample_indexes(self.data, n, random_state)
+        indexes = filter.sample_indexes(self._data, n, random_state)
         labels = None if self.labels is None else filter.filter_list_by_indexes(self.labels, indexes)
-        return Table(data_dict(filter.filter_by_indexes(self.data, indexes)), labels=labels)
-
-    def groupby(self, by: Union[str, Sequence]) -> Group:
-        return Group([(value, Table(data)) for value, data in group.groupby(self.data, by)], by)
+        data = {name: buffers.take(values, indexes) for name, values in self._data.items()}
+        return Table._from_data(data, labels, len(indexes), (), self._derive_validity(lambda b: b.take(indexes)))
+
+    def groupby(self, by: Union[str, Sequence], memory_limit: Optional[int] = None, sorted: bool = False) -> Group:
+        """Group rows by column/s by.
+
+        Pass memory_limit (bytes) to write the groups of a Table estimated
+        larger than memory_limit to a temporary file, loading one group
+        at a time when the Group is iterated or aggregated.
+        Pass sorted=True if rows are already sorted by the by columns to group
+        runs of equal keys as slices without hashing keys. Unsorted rows then
+        give one group per run.
+        """
+        data = self._list_data()
+        if sorted:
+            runs = list(key_runs(data, by))
+            return Group(RunGroups(data, runs), by, [range(start, stop) for _, start, stop in runs], self.labels)
+        indexes = group_indexes(data, by)
+        if memory_limit is not None and spill.estimate_data_bytes(data) > memory_limit:
+            return Group(spill.spill_groups(data, by, indexes=indexes), by, list(indexes.values()), self.labels)
+        groups = [
+            (key, Table._from_data({name: buffers.take(values, rows) for name, values in data.items()}, None, len(rows)))
+            for key, rows in indexes.items()
+        ]
+        return Group(groups, by, list(indexes.values()), self.labels)
+
+    def sort_values(self, by: Union[str, Sequence[str]], ascending: sort.Ascending = True, memory_limit: Optional[int] = None) -> Table:
+        """Return new Table with rows sorted by column/s by.
+
+        Sort is stable and missing values (None) sort last.
+        Pass memory_limit (bytes) to sort a Table estimated larger than
+        memory_limit with an external merge sort of its keys, spilling
+        sorted runs to temporary files.
+        """
+        names = [by] if isinstance(by, str) else list(by)
+        if memory_limit is not None and spill.estimate_data_bytes(self._data) > memory_limit:
+            index_name = "__index__"
+            while index_name in names:
+                index_name += "_"
+            keys = {name: self._data[name] for name in names}
+            keys[index_name] = list(range(len(self)))
+            chunks = sort.rows_to_chunks(list(keys), zip(*keys.values()), spill.SPILL_BATCH_ROWS)
+            indexes = [i for chunk in sort.external_sort(chunks, names, ascending, memory_limit) for i in chunk[index_name]]
+        else:
+            indexes = sort.sort_indexes(self._data, names, ascending)
+        return self.filter_by_indexes(indexes)
 
     def inner_join(self, other: DataMapping, left_on, right_on=None) -> Table:
-        data = join.inner_join(self.data, other, left_on, right_on)
+        data = join.inner_join(self._list_data(), other, left_on, right_on)
         return Table(data)
 
     def left_join(self, other: DataMapping, left_on, right_on=None) -> Table:
-        data = join.left_join(self.data, other, left_on, right_on)
+        data = join.left_join(self._list_data(), other, left_on, right_on)
         return Table(data)
 
     def right_join(self, other: DataMapping, left_on, right_on=None) -> Table:
-        data = join.right_join(self.data, other, left_on, right_on)
+        data = join.right_join(self._list_data(), other, left_on, right_on)
         return Table(data)
 
     def full_join(self, other: DataMapping, left_on, right_on=None) -> Table:
-        data = join.full_join(self.data, other, left_on, right_on)
+        data = join.full_join(self._list_data(), other, left_on, right_on)
         return Table(data)
 
     def join(self, other: DataMapping, left_on, right_on=None, how: JoinStrategy = JoinStrategy.left) -> Table:
@@ -408,28 +909,160 @@ class Table:
         raise ValueError('how must be "left", "right", "inner", or "full"')
 
     def sum(self) -> dict:
-        return group.sum_data(self.data)
+        return self._aggregate("sum", group.sum_data)
 
     def count(self) -> dict:
-        return group.count_data(self.data)
+        return group.count_data(self._data)
 
     def mean(self) -> dict:
-        return group.mean_data(self.data)
+        return self._aggregate("mean", group.mean_data)
 
     def min(self) -> dict:
-        return group.min_data(self.data)
+        return self._aggregate("min", group.min_data)
 
     def max(self) -> dict:
-        return group.max_data(self.data)
+        return self._aggregate("max", group.max_data)
 
     def std(self) -> dict:
-        return group.stdev_data(self.data)
+        return self._aggregate("std", group.stdev_data)
 
     def mode(self) -> dict:
-        return group.mode_data(self.data)
+        return group.mode_data(self._list_data())
 
     def pstd(self) -> dict:
-        return group.pstdev_data(self.data)
+        return self._aggregate("pstd", group.pstdev_data)
+
+    def quantile(self, q: stats.Quantile = 0.5) -> dict:
+        """Quantile q (or list of quantiles for a sequence q) of each numeric column,
+        interpolating linearly between values and skipping None values.
+        Each column is sorted once for all quantiles.
+        """
+        return stats.quantile_data(self._data, q)
+
+    def median(self) -> dict:
+        return self.quantile(0.5)
+
+    def describe(self) -> Table:
+        """Return Table of count, mean, std, min, quartiles and max of each numeric column,
+        labeled by statistic. Each column is sorted once for all statistics.
+        """
+        described = stats.describe_data(self._data)
+        data = {name: [row[stat] for stat in stats.DESCRIBE_STATS] for name, row in described.items()}
+        return Table(data, list(stats.DESCRIBE_STATS))
+
+    def _map_columns(self, func: windows.WindowFunc) -> Table:
+        """Return new Table of func applied to each column's values, leaving out columns func raises TypeError for."""
+        data = {}
+        for name, values in self._data.items():
+            try:
+                data[name] = func(values)
+            except TypeError:
+                continue
+        return Table._from_data(data, copy.copy(self.labels), len(self))
+
+    def rolling(self, window: int, min_periods: Optional[int] = None) -> windows.Window:
+        """Moving window of window rows over each numeric column, e.g. tbl.rolling(7).mean().
+        Windows with fewer than min_periods (default window) non-None values give None.
+        """
+        return windows.Window(self._map_columns, window, min_periods)
+
+    def expanding(self, min_periods: int = 1) -> windows.Window:
+        """Window of all rows up to each row over each numeric column, e.g. tbl.expanding().max()."""
+        return windows.Window(self._map_columns, None, min_periods)
+
+    def cumsum(self) -> Table:
+        return self._map_columns(windows.cumsum)
+
+    def cummin(self) -> Table:
+        return self._map_columns(windows.cummin)
+
+    def cummax(self) -> Table:
+        return self._map_columns(windows.cummax)
+
+    def shift(self, periods: int = 1, fill_value: Any = None) -> Table:
+        """Return new Table with every column's values moved down periods rows (up for negative periods)."""
+        return self._map_columns(lambda values: windows.shift(values, periods, fill_value))
+
+    def diff(self, periods: int = 1) -> Table:
+        return self._map_columns(lambda values: windows.diff(values, periods))
+
+    def duplicated(self, subset: Optional[Union[str, Sequence[str]]] = None, keep: dedupe.Keep = "first") -> List[bool]:
+        """Flag of each row repeating the values of an earlier row in the subset columns (all by default).
+        keep="last" flags all but the last repeat instead and keep=False flags every repeated row.
+        """
+        return dedupe.duplicated_mask(dedupe.row_keys(self._data, subset), keep)
+
+    def drop_duplicates(
+        self, subset: Optional[Union[str, Sequence[str]]] = None, keep: dedupe.Keep = "first", inplace: bool = False
+    ) -> Union[Table, None]:
+        """Remove rows flagged by duplicated(subset, keep).
+        Return new Table or None if inplace=True.
+        """
+        indexes = [i for i, duplicate in enumerate(self.duplicated(subset, keep)) if not duplicate]
+        if inplace:
+            self.filter_by_indexes_inplace(indexes)
+            return None
+        return self.filter_by_indexes(indexes)
+
+    def pivot_table(
+        self,
+        index: reshape.Names,
+        columns: reshape.Names,
+        values: Optional[reshape.Names] = None,
+        aggfunc: reshape.AggFunc = "mean",
+        fill_value: Any = None,
+    ) -> Table:
+        """Return wide Table with a row per distinct index key and a column per distinct columns key,
+        each cell aggregating the values of the rows with that pair of keys with aggfunc
+        (a name such as "sum", "count", "mean", or a function of a list of values).
+        """
+        return Table(reshape.pivot_table(self._list_data(), index, columns, values, aggfunc, fill_value))
+
+    def pivot(self, index: reshape.Names, columns: reshape.Names, values: Optional[reshape.Names] = None) -> Table:
+        """Return wide Table like pivot_table, raising ValueError for duplicate index and columns pairs."""
+        return Table(reshape.pivot(self._list_data(), index, columns, values))
+
+    def melt(
+        self,
+        id_vars: Optional[reshape.Names] = None,
+        value_vars: Optional[reshape.Names] = None,
+        var_name: str = "variable",
+        value_name: str = "value",
+    ) -> Table:
+        """Return long Table with a row per row and value_vars column (all but id_vars by default),
+        holding the id_vars values, the column name in var_name and its value in value_name.
+        """
+        return Table(reshape.melt(self._data, id_vars, value_vars, var_name, value_name))
+
+    def value_counts(
+        self,
+        subset: Optional[Union[str, Sequence[str]]] = None,
+        normalize: bool = False,
+        dropna: bool = False,
+        top: Optional[int] = None,
+    ) -> Table:
+        """Count each distinct combination of the subset column values (all columns by default).
+        Returns Table of the subset columns and a count (or proportion if normalize) column,
+        most frequent first.
+        Pass dropna to leave out rows with a None value and top to keep only the top rows.
+        """
+        if subset is None:
+            names = list(self._data)
+        else:
+            names = [subset] if isinstance(subset, str) else list(subset)
+        for name in names:
+            if name not in self._data:
+                raise KeyError(name)
+        if len(names) == 1:
+            ranked = counts.rank_counts(counts.count_values(self._data[names[0]]), normalize, dropna, top)
+            keys = [(key,) for key in ranked]
+        else:
+            row_counts = counts.count_rows([self._data[name] for name in names])
+            ranked = counts.rank_counts(row_counts, normalize, dropna, top, is_na=counts.row_has_none)
+            keys = list(ranked)
+        data = {name: [key[i] for key in keys] for i, name in enumerate(names)}
+        data["proportion" if normalize else "count"] = list(ranked.values())
+        return Table(data)
 
     def fillna(
         self,
@@ -467,19 +1100,73 @@ class Table:
         Table | None
             Table with missing values filled or None if inplace=True
         """
-        data = na.fillna(self.data, value, method, axis, inplace, limit, na_value)
+        if inplace:
+            self._writable_all()
+        source = self._list_data()
+        data = na.fillna(source, value, method, axis, inplace, limit, na_value)
+        filled = source if data is None else data_dict(data)
+        for column_name, values in self._data.items():
+            if buffers.is_array(values):
+                filled[column_name] = buffers.to_array(filled[column_name])
         if data is not None:
-            return Table(data_dict(data), self.labels)
+            table = Table._from_data(filled, copy.copy(self.labels))
+            if self._validity is not None:
+                table.track_nulls()
+            return table
+        self._data.update(filled)
+        if self._validity is not None:
+            self.track_nulls()
+        return None
+
+    def _remaining_valid(
+        self, axis: Union[int, str], how: str, thresh: Optional[int], subset: Optional[Sequence[str]]
+    ) -> Optional[List[Any]]:
+        """Remaining row indexes or column names of dropna from the validity bitmaps,
+        None when the bitmaps cannot answer.
+        """
+        validity = self._validity
+        if validity is None:
+            return None
+        if axis in [0, "rows"]:
+            bitmaps = [validity[name] for name in (self._data if subset is None else subset)]
+            if not bitmaps:
+                return None
+            if thresh is not None:
+                valid_counts = map(sum, zip(*(bitmap.to_bools() for bitmap in bitmaps)))
+                return [i for i, count in enumerate(valid_counts) if count >= thresh]
+            if how == "any":
+                return functools.reduce(operator.and_, bitmaps).valid_indexes()
+            if how == "all":
+                return functools.reduce(operator.or_, bitmaps).valid_indexes()
+        elif axis in [1, "columns"] and subset is None:
+            if thresh is not None:
+                return [name for name, bitmap in validity.items() if bitmap.count() >= thresh]
+            if how == "any":
+                return [name for name, bitmap in validity.items() if bitmap.count() == len(bitmap)]
+            if how == "all":
+                return [name for name, bitmap in validity.items() if bitmap.count()]
         return None
 
     def isna(self, na_value=None) -> Table:
-        data = na.isna(self.data, na_value)
+        if self._validity is not None and na_value is None:
+            data = {name: list(map(operator.not_, bitmap.to_bools())) for name, bitmap in self._validity.items()}
+            return Table._from_data(data, copy.copy(self.labels), self._row_count)
+        data = na.isna(self._data, na_value)
         return Table(data_dict(data), self.labels)
 
     def notna(self, na_value=None) -> Table:
-        data = na.notna(self.data, na_value)
+        if self._validity is not None and na_value is None:
+            data = {name: bitmap.to_bools() for name, bitmap in self._validity.items()}
+            return Table._from_data(data, copy.copy(self.labels), self._row_count)
+        data = na.notna(self._data, na_value)
         return Table(data_dict(data), self.labels)
 
+    def null_count(self, na_value=None) -> Dict[str, int]:
+        """Count missing values in each column."""
+        if self._validity is not None and na_value is None:
+            return {name: bitmap.null_count() for name, bitmap in self._validity.items()}
+        return {name: sum(1 for value in values if value is na_value) for name, values in self._data.items()}
+
     isnull = isna
     notnull = notna
 
@@ -514,21 +1201,23 @@ class Table:
             Table with missing values removed or None if inplace=True
         """
         # Handle empty table
-        if not self.data:
+        if not self._data:
             if inplace:
                 return None
             else:
                 return Table()
         
         # Get the remaining indexes/column names after dropping na rows/columns
-        if thresh is not None:
-            remaining = dropna.dropna_thresh(self.data, thresh, axis, subset, na_value, remaining=True)
-        elif how == "any":
-            remaining = dropna.dropna_any(self.data, axis, subset, na_value, remaining=True)
-        elif how == "all":
-            remaining = dropna.dropna_all(self.data, axis, subset, na_value, remaining=True)
-        else:
-            raise ValueError('how must be "any" or "all" if thresh is not None')
+        remaining: Any = self._remaining_valid(axis, how, thresh, subset) if na_value is None else None
+        if remaining is None:
+            if thresh is not None:
+                remaining = dropna.dropna_thresh(self._data, thresh, axis, subset, na_value, remaining=True)
+            elif how == "any":
+                remaining = dropna.dropna_any(self._data, axis, subset, na_value, remaining=True)
+            elif how == "all":
+                remaining = dropna.dropna_all(self._data, axis, subset, na_value, remaining=True)
+            else:
+                raise ValueError('how must be "any" or "all" if thresh is not None')
         # Filter by indexes or columns
         if axis in [1, "columns"]:
             remaining_columns: List[str] = [str(name) for name in remaining]
@@ -548,16 +1237,105 @@ class Table:
             raise ValueError('axis but be 0, 1, "columns", or "rows"')
 
 
-def read_csv(path: str, names: Optional[Sequence[str]] = None):
-    return Table(csv.read_csv(path, names=names))
-
-
-def read_excel(path: str, sheet_name: Optional[str] = None) -> Table:
-    return Table(excel.read_excel_file(path, sheet_name))
+@overload
+def read_csv(
+    path: str,
+    names: Optional[Sequence[str]] = ...,
+    chunksize: None = ...,
+    categorical: Union[bool, Sequence[str]] = ...,
+    intern_strings: InternOption = ...,
+) -> Table: ...
+
+
+@overload
+def read_csv(
+    path: str,
+    names: Optional[Sequence[str]],
+    chunksize: int,
+    categorical: Union[bool, Sequence[str]] = ...,
+    intern_strings: InternOption = ...,
+) -> TableStream: ...
+
+
+@overload
+def read_csv(
+    path: str,
+    names: Optional[Sequence[str]] = ...,
+    *,
+    chunksize: int,
+    categorical: Union[bool, Sequence[str]] = ...,
+    intern_strings: InternOption = ...,
+) -> TableStream: ...
+
+
+def read_csv(
+    path: str,
+    names: Optional[Sequence[str]] = None,
+    chunksize: Optional[int] = None,
+    categorical: Union[bool, Sequence[str]] = False,
+    intern_strings: InternOption = False,
+) -> Union[Table, TableStream]:
+    """Read csv into Table.
+    Pass chunksize to get a TableStream of chunksize row Tables instead.
+    Pass categorical column names, or True for every repetitive str column,
+    to dictionary encode columns as Categoricals.
+    Pass intern_strings=True (or a per column cache size) to share one
+    str object between repeated values.
+    """
+    if chunksize is not None:
+        stream = TableStream.from_csv(path, chunksize, names=names, intern_strings=intern_strings)
+        return stream if categorical is False else stream.map(lambda chunk: _encode_table(chunk, categorical))
+    return _encode_table(Table(csv.read_csv(path, names=names, intern_strings=intern_strings)), categorical)
+
+
+def read_excel(path: str, sheet_name: Optional[str] = None, intern_strings: InternOption = False) -> Table:
+    return Table(excel.read_excel_file(path, sheet_name, intern_strings))
+
+
+@overload
+def read_sqlite(
+    path: str,
+    table_name: str,
+    chunksize: None = ...,
+    categorical: Union[bool, Sequence[str]] = ...,
+    intern_strings: InternOption = ...,
+) -> Table: ...
+
+
+@overload
+def read_sqlite(
+    path: str,
+    table_name: str,
+    chunksize: int,
+    categorical: Union[bool, Sequence[str]] = ...,
+    intern_strings: InternOption = ...,
+) -> TableStream: ...
+
+
+def read_sqlite(
+    path: str,
+    table_name: str,
+    chunksize: Optional[int] = None,
+    categorical: Union[bool, Sequence[str]] = False,
+    intern_strings: InternOption = False,
+) -> Union[Table, TableStream]:
+    """Read sqlite table into Table.
+    Pass chunksize to get a TableStream of chunksize row Tables instead.
+    Pass categorical column names, or True for every repetitive str column,
+    to dictionary encode columns as Categoricals.
+    Pass intern_strings=True (or a per column cache size) to share one
+    str object between repeated values.
+    """
+    if chunksize is not None:
+        stream = TableStream.from_sqlite(path, table_name, chunksize, intern_strings)
+        return stream if categorical is False else stream.map(lambda chunk: _encode_table(chunk, categorical))
+    return _encode_table(Table(sqlite.read_sqlite_table(path, table_name, intern_strings)), categorical)
 
 
-def read_sqlite(path: str, table_name: str) -> Table:
-    return Table(sqlite.read_sqlite_table(path, table_name))
+def _encode_table(table: Table, categorical: Union[bool, Sequence[str]]) -> Table:
+    if categorical is False:
+        return table
+    return Table._from_data(encode_data(table._data, categorical), table.labels, len(table))
 
 
 def validate_int_slice(s: slice) -> None:
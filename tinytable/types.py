@@ -1,5 +1,7 @@
 from typing import Any, Dict, Mapping, Sequence
 
+from tinytable.buffers import is_array
+
 DataDict = Dict[str, list]
 DataMapping = Mapping[str, Sequence]
 RowDict = Dict[str, Any]
@@ -7,7 +9,7 @@ RowMapping = Mapping[str, Any]
 
 
 def data_dict(d: Any) -> DataDict:
-    return {str(col): list(values) for col, values in d.items()}
+    return {str(col): values.tolist() if is_array(values) else list(values) for col, values in d.items()}
 
 
 def row_dict(r: Any) -> RowDict:
@@ -0,0 +1,234 @@
+"""Rolling, expanding and cumulative window functions.
+
+Every function makes one pass over the values, updating its window
+state as each value enters (and leaves) the window: running sums and
+counts, a monotonic deque of candidates for min and max, and Welford's
+running mean and sum of squared deviations for std. None values are
+skipped; a window with fewer than min_periods values gives None.
+"""
+
+import math
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Sequence
+
+import tinytable.buffers as buffers
+
+WindowFunc = Callable[[Sequence], list]
+
+
+def numbers(values: Sequence[Any]) -> List[Any]:
+    """values as a list, raising TypeError if any are not numbers or None."""
+    out = buffers.to_list(values)
+    for value in out:
+        if value is not None and not isinstance(value, (int, float)):
+            raise TypeError(f"window functions need numbers, not {type(value).__name__}")
+    return out
+
+
+def _leaving(values: List[Any], i: int, window: Optional[int]) -> Any:
+    """Value leaving the window as value i enters, None if none leaves."""
+    if window is None or i < window:
+        return None
+    return values[i - window]
+
+
+def rolling_count(values: Sequence, window: Optional[int], min_periods: int = 0) -> list:
+    values = buffers.to_list(values)
+    out = []
+    count = 0
+    for i, value in enumerate(values):
+        if value is not None:
+            count += 1
+        if _leaving(values, i, window) is not None:
+            count -= 1
+        out.append(count if count >= min_periods else None)
+    return out
+
+
+def rolling_sum(values: Sequence, window: Optional[int], min_periods: int = 1) -> list:
+    values = numbers(values)
+    out = []
+    total: Any = 0
+    count = 0
+    for i, value in enumerate(values):
+        if value is not None:
+            total += value
+            count += 1
+        old = _leaving(values, i, window)
+        if old is not None:
+            total -= old
+            count -= 1
+        out.append(total if count and count >= min_periods else None)
+    return out
+
+
+def rolling_mean(values: Sequence, window: Optional[int], min_periods: int = 1) -> list:
+    sums = rolling_sum(values, window, min_periods)
+    counts = rolling_count(values, window)
+    return [None if total is None else total / count for total, count in zip(sums, counts)]
+
+
+def _rolling_extreme(values: Sequence, window: Optional[int], min_periods: int, keep: Callable[[Any, Any], bool]) -> list:
+    """Rolling min or max from a deque of (index, value) candidates,
+    each value pushed and popped at most once.
+    """
+    values = numbers(values)
+    out = []
+    candidates: Deque[tuple] = deque()
+    count = 0
+    for i, value in enumerate(values):
+        if value is not None:
+            count += 1
+            while candidates and not keep(candidates[-1][1], value):
+                candidates.pop()
+            candidates.append((i, value))
+        if _leaving(values, i, window) is not None:
+            count -= 1
+        if window is not None:
+            while candidates and candidates[0][0] <= i - window:
+                candidates.popleft()
+        out.append(candidates[0][1] if count and count >= min_periods else None)
+    return out
+
+
+def rolling_min(values: Sequence, window: Optional[int], min_periods: int = 1) -> list:
+    return _rolling_extreme(values, window, min_periods, lambda kept, new: kept < new)
+
+
+def rolling_max(values: Sequence, window: Optional[int], min_periods: int = 1) -> list:
+    return _rolling_extreme(values, window, min_periods, lambda kept, new: kept > new)
+
+
+def rolling_std(values: Sequence, window: Optional[int], min_periods: int = 1, ddof: int = 1) -> list:
+    """Rolling standard deviation, adding and removing values with Welford's method."""
+    values = numbers(values)
+    out: List[Optional[float]] = []
+    count = 0
+    mean = 0.0
+    squares = 0.0
+    for i, value in enumerate(values):
+        if value is not None:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            squares += delta * (value - mean)
+        old = _leaving(values, i, window)
+        if old is not None:
+            count -= 1
+            if count:
+                delta = old - mean
+                mean -= delta / count
+                squares -= delta * (old - mean)
+            else:
+                mean = squares = 0.0
+        if count > ddof and count >= min_periods:
+            out.append(math.sqrt(max(squares, 0.0) / (count - ddof)))
+        else:
+            out.append(None)
+    return out
+
+
+ROLLING_FUNCS = {
+    "count": rolling_count,
+    "sum": rolling_sum,
+    "mean": rolling_mean,
+    "min": rolling_min,
+    "max": rolling_max,
+    "std": rolling_std,
+}
+
+
+def cumsum(values: Sequence) -> list:
+    """Running total, None where the value is None."""
+    values = numbers(values)
+    total: Any = 0
+    out: List[Any] = []
+    for value in values:
+        if value is None:
+            out.append(None)
+        else:
+            total += value
+            out.append(total)
+    return out
+
+
+def _cumulative(values: Sequence, keep: Callable[[Any, Any], bool]) -> list:
+    best: Any = None
+    out: List[Any] = []
+    for value in numbers(values):
+        if value is None:
+            out.append(None)
+            continue
+        if best is None or not keep(best, value):
+            best = value
+        out.append(best)
+    return out
+
+
+def cummin(values: Sequence) -> list:
+    return _cumulative(values, lambda best, new: best <= new)
+
+
+def cummax(values: Sequence) -> list:
+    return _cumulative(values, lambda best, new: best >= new)
+
+
+def shift(values: Sequence, periods: int = 1, fill_value: Any = None) -> list:
+    """values moved down periods rows (up for negative periods), filling with fill_value."""
+    values = buffers.to_list(values)
+    n = len(values)
+    fill = [fill_value] * min(abs(periods), n)
+    if periods >= 0:
+        return fill + values[: n - len(fill)]
+    return values[len(fill) :] + fill
+
+
+def diff(values: Sequence, periods: int = 1) -> list:
+    """Difference of each value from the value periods rows before."""
+    values = numbers(values)
+    return [
+        None if value is None or previous is None else value - previous
+        for value, previous in zip(values, shift(values, periods))
+    ]
+
+
+class Window:
+    """Rolling window of window rows (expanding from the first row if window is None).
+
+    Returned by Column, Table and Group rolling and expanding methods;
+    apply maps a function of column values to the caller's result type.
+    """
+
+    def __init__(self, apply: Callable[[WindowFunc], Any], window: Optional[int], min_periods: Optional[int] = None) -> None:
+        if window is not None and window < 1:
+            raise ValueError("window must be at least 1")
+        self.apply = apply
+        self.window = window
+        self.min_periods = (window if window is not None else 1) if min_periods is None else min_periods
+
+    def __repr__(self) -> str:
+        if self.window is None:
+            return f"Window(expanding, min_periods={self.min_periods})"
+        return f"Window({self.window}, min_periods={self.min_periods})"
+
+    def aggregate(self, name: str) -> Any:
+        func = ROLLING_FUNCS[name]
+        return self.apply(lambda values: func(values, self.window, self.min_periods))
+
+    def count(self) -> Any:
+        return self.aggregate("count")
+
+    def sum(self) -> Any:
+        return self.aggregate("sum")
+
+    def mean(self) -> Any:
+        return self.aggregate("mean")
+
+    def min(self) -> Any:
+        return self.aggregate("min")
+
+    def max(self) -> Any:
+        return self.aggregate("max")
+
+    def std(self) -> Any:
+        return self.aggregate("std")